@@ -0,0 +1,229 @@
+"""Streamlit 없이 쓰는 HTTP API (모바일/태블릿 앱용)
+
+    GET  /api/word?topic=Animals&voice=Girl   다음 단어 (뜻, 음성 주소 포함)
+    GET  /api/audio/<word>?voice=Girl         단어 음성 (캐시된 음성은 ETag/Cache-Control로 오래 캐시)
+    GET  /api/speech?text=...&voice=Girl      문장 음성 (합성되는 대로 chunked 전송)
+    POST /api/check                           발음 확인 (form: word, learner_id, topic / file: audio)
+    GET  /metrics                             Prometheus 측정값 (metrics.py)
+    GET  /healthz
+
+app.py와 같은 캐시/번역/음성 인식 모듈을 쓰지만 화면을 다시 실행하지 않으므로 요청 하나의
+비용이 그 일 자체뿐이다. 공용 자원은 작업 프로세스마다 첫 요청 때 만든다(fork 이후).
+
+실행:
+    gunicorn -w 4 --threads 8 -b 0.0.0.0:8000 api:app
+    python api.py          # 개발용 (Werkzeug)
+"""
+from functools import lru_cache
+from itertools import chain
+
+from flask import Flask, Response, abort, jsonify, make_response, request, stream_with_context, url_for
+
+import config
+import matcher
+import metrics
+from asr import RecognitionBusy, RecognitionTimeout, RecognizerPool, create_backend
+from audio_cache import AudioCache, cache_key
+from outbound import CircuitOpen
+from translation import GlossStore
+from tts import VOICES, default_backend as get_tts_backend, stream as stream_audio
+import words
+
+app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = config.API_MAX_UPLOAD_BYTES
+
+
+@lru_cache(maxsize=None)
+def get_word_bank():
+    return words.load(config.WORD_BANK_PATH, config.GLOSS_BUNDLE_PATH)
+
+
+@lru_cache(maxsize=None)
+def get_audio_cache():
+    cache = AudioCache(config.AUDIO_CACHE_DIR,
+                       max_items=config.AUDIO_CACHE_MAX_ITEMS,
+                       max_bytes=config.AUDIO_CACHE_MAX_BYTES,
+                       bundle_dir=config.AUDIO_BUNDLE_DIR,
+                       mimetype=get_tts_backend().mimetype)
+    metrics.register_collector('audio_cache', cache.stats)
+    return cache
+
+
+@lru_cache(maxsize=None)
+def get_gloss_store():
+    store = GlossStore(config.GLOSS_STORE_PATH,
+                       bundle_path=config.GLOSS_BUNDLE_PATH,
+                       ttl=config.GLOSS_TTL_SECONDS,
+                       timeout=config.TRANSLATE_TIMEOUT_SECONDS)
+    metrics.register_collector('gloss_store', store.stats)
+    return store
+
+
+@lru_cache(maxsize=None)
+def get_recognizer_pool():
+    backend = create_backend(config.ASR_BACKEND,
+                             timeout=config.ASR_TIMEOUT_SECONDS,
+                             vosk_model_path=config.VOSK_MODEL_PATH)
+    pool = RecognizerPool(backend,
+                          max_workers=config.ASR_MAX_WORKERS,
+                          max_pending=config.ASR_MAX_PENDING,
+                          timeout=config.ASR_TIMEOUT_SECONDS)
+    metrics.register_collector('asr_pool', pool.stats)
+    return pool
+
+
+@lru_cache(maxsize=None)
+def get_progress_store():
+    from progress import ProgressStore
+
+    store = ProgressStore(config.DATABASE_URL)
+    metrics.register_collector('progress', store.stats)
+    return store
+
+
+def _voice():
+    voice = request.args.get('voice', 'Boy')
+    if voice not in VOICES:
+        abort(400, description=f"voice는 {', '.join(VOICES)} 중 하나여야 합니다.")
+    return voice
+
+
+@app.errorhandler(400)
+@app.errorhandler(404)
+@app.errorhandler(413)
+def client_error(error):
+    return jsonify(error=error.description), error.code
+
+
+@app.errorhandler(CircuitOpen)
+def service_unavailable(error):
+    response = jsonify(error=str(error))
+    response.headers['Retry-After'] = str(config.BREAKER_RESET_SECONDS)
+    return response, 503
+
+
+@app.get('/api/word')
+def next_word():
+    """다음 단어 (topic이 없거나 모르는 주제면 전체 단어에서 선택)"""
+    topic = request.args.get('topic')
+    voice = _voice()
+    word = get_word_bank().sample(topic)
+    return jsonify(
+        word=word,
+        topic=topic if topic in get_word_bank().topics else None,
+        gloss=get_gloss_store().lookup(word),
+        audio_url=url_for('word_audio', word=word, voice=voice),
+    )
+
+
+def _audio_response(text, gender):
+    """음성 응답 (같은 글/목소리면 내용이 바뀌지 않으므로 캐시 키를 ETag로 사용)
+
+    캐시에 있으면 한 번에 보내고 오래 캐시하도록 한다. 없으면 합성되는 조각을 받는 대로
+    chunked로 보내 첫 조각부터 재생되지만, 중간에 합성이 실패하면 잘린 음성이 되므로
+    ETag 없이 no-store로 보낸다 (다음 요청은 캐시에 저장된 완성본을 받음).
+    """
+    backend = get_tts_backend()
+    voice = backend.voice_key(gender)
+    etag = cache_key(text, 'en', voice)
+
+    if etag in request.if_none_match:
+        # 합성/캐시 조회 없이 바로 응답
+        return _immutable(make_response('', 304), etag)
+
+    audio = get_audio_cache().get(etag)
+    if audio is not None:
+        metrics.incr('tts.cache_hits')
+        return _immutable(Response(audio, mimetype=backend.mimetype), etag)
+
+    chunks = stream_audio(get_audio_cache(), text, voice, backend=backend)
+    try:
+        first = next(chunks)   # 서비스 오류(CircuitOpen 등)는 응답을 시작하기 전에 드러나도록
+    except StopIteration:
+        return jsonify(error="음성을 합성하지 못했습니다."), 502
+    response = Response(stream_with_context(chain([first], chunks)), mimetype=backend.mimetype)
+    response.cache_control.no_store = True
+    return response
+
+
+def _immutable(response, etag):
+    """완성된 음성 응답: 내용이 바뀌지 않으므로 오래 캐시"""
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = config.API_AUDIO_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+
+@app.get('/api/audio/<word>')
+def word_audio(word):
+    """단어 음성"""
+    if get_word_bank().get(word) is None:
+        abort(404, description="단어장에 없는 단어입니다.")
+    return _audio_response(word, _voice())
+
+
+@app.get('/api/speech')
+def speech_audio():
+    """문장(예문 등) 음성"""
+    text = ' '.join(request.args.get('text', '').split())
+    if not text or len(text) > config.API_TTS_MAX_CHARS:
+        abort(400, description=f"text는 1~{config.API_TTS_MAX_CHARS}자여야 합니다.")
+    return _audio_response(text, _voice())
+
+
+@app.post('/api/check')
+def check_pronunciation():
+    """녹음 파일(wav/webm)을 받아 인식하고 목표 단어와의 유사도 반환"""
+    import speech_recognition as sr
+
+    import audio_io
+
+    word = request.form.get('word', '').strip()
+    upload = request.files.get('audio')
+    if not word or upload is None:
+        abort(400, description="word와 audio가 필요합니다.")
+
+    try:
+        pcm = audio_io.to_pcm16k(upload.read())
+    except Exception as e:
+        abort(400, description=f"녹음 파일을 읽을 수 없습니다: {e}")
+    audio_data = sr.AudioData(pcm, sample_rate=audio_io.TARGET_RATE, sample_width=2)
+
+    pool = get_recognizer_pool()
+    try:
+        job = pool.submit(audio_data, grammar=get_word_bank().words_for(request.form.get('topic')))
+        transcript = pool.wait(job)
+    except RecognitionBusy:
+        response = jsonify(error="지금은 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+        response.headers['Retry-After'] = '1'
+        return response, 503
+    except RecognitionTimeout:
+        return jsonify(error="음성 인식 시간이 초과되었습니다."), 504
+    except sr.UnknownValueError:
+        return jsonify(word=word, transcript=None, similarity=0.0, correct=False)
+    except sr.RequestError:
+        return jsonify(error="음성 인식 서비스에 접근할 수 없습니다."), 502
+
+    with metrics.span('similarity'):
+        similarity = matcher.similarity(word, transcript)
+    correct = similarity > matcher.PASS_THRESHOLD
+    learner_id = request.form.get('learner_id')
+    if learner_id:
+        get_progress_store().record_attempt(learner_id, word, similarity, correct,
+                                            topic=request.form.get('topic'))
+    return jsonify(word=word, transcript=transcript, similarity=similarity, correct=correct)
+
+
+@app.get('/metrics')
+def prometheus_metrics():
+    return metrics.render_prometheus(), 200, {'Content-Type': 'text/plain; version=0.0.4'}
+
+
+@app.get('/healthz')
+def healthz():
+    return jsonify(status='ok')
+
+
+if __name__ == "__main__":
+    app.run(host='0.0.0.0', port=8000, threaded=True)
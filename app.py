@@ -1,132 +1,303 @@
 # pip install streamlit
+# pip install streamlit-mic-recorder
 # pip install SpeechRecognition
 # pip install gtts
 # pip install googletrans
 # pip install difflib   # 설치 안해도 사용가능
-# pip install sounddevice
-# pip install audio-recorder-streamlit
-from io import BytesIO  
-import wave  
-
-# streamlit-webrtc 사용  
-from streamlit_webrtc import webrtc_streamer, WebRtcMode, ClientSettings  
-
-from streamlit_mic_recorder import mic_recorder  
-import speech_recognition as sr  
+# TTS/음성 인식/번역/DB 모듈은 처음 사용할 때 불러옴 (시작 시간, 메모리 절약)
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import uuid
 
 import streamlit as st
-import speech_recognition as sr
-from gtts import gTTS
-import os
-import random
-import time
-import difflib
-from googletrans import Translator
-import sounddevice as sd
-import numpy as np
-# from scipy import signal
-from audio_recorder_streamlit import audio_recorder  
 
+import assets
+import config
+import matcher
+import metrics
+from asr import RecognitionBusy, RecognitionTimeout, RecognizerPool, create_backend
+from audio_cache import AudioCache
+from outbound import CircuitOpen
+from prefetch import Prefetcher, prepare_word
+from scheduler import LeitnerScheduler
+from scoring import best_candidate, candidates_for
+from translation import GlossStore
+from tts import default_backend as get_tts_backend, render as render_audio
+import words
+
+logger = logging.getLogger(__name__)
 
 def initialize_session_state():
     """세션 상태 초기화"""
     if 'current_word' not in st.session_state:
         st.session_state.current_word = ''
+    if 'learner_id' not in st.session_state:
+        st.session_state.learner_id = get_learner_id()
     if 'score' not in st.session_state:
-        st.session_state.score = 0
-    if 'total_attempts' not in st.session_state:
-        st.session_state.total_attempts = 0
+        # 저장된 기록이 있으면 이어서 (같은 주소로 다시 들어온 학습자)
+        st.session_state.score, st.session_state.total_attempts = \
+            get_progress_store().learner_accuracy(st.session_state.learner_id)
+    if 'selected_topic' not in st.session_state:
+        st.session_state.selected_topic = None    # 주제 (School, Family, ...)
     if 'selected_gender' not in st.session_state:
-        st.session_state.selected_gender = 'Boy'
-
-def get_random_word():
-    """무작위 단어 선택"""
-    words = [
-        "apple", "banana", "orange", "grape", "strawberry",
-        "computer", "python", "programming", "artificial", "intelligence",
-        "beautiful", "wonderful", "amazing", "fantastic", "excellent"
-    ]
-    return random.choice(words)
+        st.session_state.selected_gender = 'Boy'  # AI 친구 (목소리)
+    if 'schedulers' not in st.session_state:
+        st.session_state.schedulers = {}   # 주제 -> LeitnerScheduler
+    if 'prefetcher' not in st.session_state:
+        st.session_state.prefetcher = Prefetcher(get_background_executor(),
+                                                 max_items=config.PREFETCH_MAX_ITEMS,
+                                                 max_bytes=config.PREFETCH_MAX_BYTES)
+    if 'recording' not in st.session_state:
+        st.session_state.recording = {}    # 줄 번호 -> 녹음 중인지 (MIC를 누른 뒤 결과가 나올 때까지)
+    if 'batch' not in st.session_state:
+        st.session_state.batch = []        # 이번에 풀 단어 5개
+        st.session_state.batch_topic = None
+        st.session_state.batch_gender = None
+
+def get_learner_id():
+    """학습자 ID (주소의 ?learner= 값)
+
+    없으면 새로 만들어 주소에 넣으므로 새로고침하거나 그 주소를 즐겨찾기해 두면
+    다음 세션에서도 같은 학습 기록을 이어서 쓴다.
+    """
+    learner_id = st.query_params.get('learner', '')[:64]
+    if not learner_id:
+        learner_id = uuid.uuid4().hex
+        st.query_params['learner'] = learner_id
+    return learner_id
+
+@st.cache_resource
+def get_word_bank():
+    """단어장 (프로세스당 한 번만 읽음)"""
+    return words.load(config.WORD_BANK_PATH, config.GLOSS_BUNDLE_PATH)
+
+def get_random_word(topic=None):
+    """무작위 단어 선택 (주제가 주어지면 해당 주제에서)"""
+    return get_word_bank().sample(topic)
+
+@st.cache_resource
+def get_image(path, width):
+    """표시 크기로 줄인 이미지 bytes (프로세스당 한 번만 변환)"""
+    return assets.load(path, width)
+
+@st.cache_resource
+def get_audio_cache():
+    """프로세스 공용 TTS 오디오 캐시"""
+    cache = AudioCache(config.AUDIO_CACHE_DIR,
+                       max_items=config.AUDIO_CACHE_MAX_ITEMS,
+                       max_bytes=config.AUDIO_CACHE_MAX_BYTES,
+                       bundle_dir=config.AUDIO_BUNDLE_DIR,
+                       mimetype=get_tts_backend().mimetype)
+    metrics.register_collector('audio_cache', cache.stats)
+    return cache
+
+@st.cache_resource
+def get_gloss_store():
+    """프로세스 공용 단어 뜻 저장소"""
+    store = GlossStore(config.GLOSS_STORE_PATH,
+                       bundle_path=config.GLOSS_BUNDLE_PATH,
+                       ttl=config.GLOSS_TTL_SECONDS,
+                       timeout=config.TRANSLATE_TIMEOUT_SECONDS)
+    metrics.register_collector('gloss_store', store.stats)
+    return store
+
+@st.cache_resource
+def get_recognizer_pool():
+    """프로세스 공용 음성 인식 작업 풀"""
+    backend = create_backend(config.ASR_BACKEND,
+                             timeout=config.ASR_TIMEOUT_SECONDS,
+                             vosk_model_path=config.VOSK_MODEL_PATH)
+    pool = RecognizerPool(backend,
+                          max_workers=config.ASR_MAX_WORKERS,
+                          max_pending=config.ASR_MAX_PENDING,
+                          timeout=config.ASR_TIMEOUT_SECONDS)
+    metrics.register_collector('asr_pool', pool.stats)
+    return pool
 
 def create_audio(text, gender):
-    """텍스트를 음성으로 변환 (성별에 따른 설정 적용)"""
-    # 성별에 따른 언어 설정
-    if gender == 'Boy':
-        tts = gTTS(text=text, lang='en', tld='co.uk')  # 영국 영어 (남성스러운 음색)
-    else:
-        tts = gTTS(text=text, lang='en', tld='com')    # 미국 영어 (여성스러운 음색)
-    
-    filename = "word.mp3"
-    tts.save(filename)
-    return filename
+    """텍스트를 음성으로 변환 (성별에 따른 목소리, 합성 백엔드 형식의 bytes 반환)"""
+    backend = get_tts_backend()
+    return render_audio(get_audio_cache(), text, backend.voice_key(gender), backend=backend)
+
+@st.cache_resource
+def get_acoustic_scorer():
+    """기준 발음 MFCC 저장소 기반 채점기 (메모리 맵이라 작업 프로세스 간 공유)
+
+    저장소가 없거나 비어 있으면 None (유사도 채점으로 대신함)
+    """
+    from features import AcousticScorer, FeatureStore
+
+    try:
+        store = FeatureStore(config.FEATURE_STORE_DIR)
+    except (OSError, ValueError) as e:
+        logger.warning("기준 발음 저장소를 열 수 없어 유사도 채점을 사용합니다 (%s): %s", config.FEATURE_STORE_DIR, e)
+        return None
+    if not len(store):
+        logger.warning("기준 발음 저장소가 비어 있어 유사도 채점을 사용합니다: %s", config.FEATURE_STORE_DIR)
+        return None
+    return AcousticScorer(store)
+
+@st.cache_resource
+def get_progress_store():
+    """프로세스 공용 학습 기록 저장소"""
+    from progress import ProgressStore  # SQLAlchemy는 처음 사용할 때 불러옴
+
+    store = ProgressStore(config.DATABASE_URL)
+    metrics.register_collector('progress', store.stats)
+    return store
+
+@st.cache_resource
+def get_background_executor():
+    """음성 미리 합성 등 백그라운드 작업용 스레드 풀"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='warm')
+
+def get_scheduler(topic):
+    """현재 학습자(세션)의 주제별 복습 일정"""
+    word_bank = get_word_bank()
+    key = topic if topic in word_bank.topics else None
+    if key not in st.session_state.schedulers:
+        # 저장된 시도 기록으로 상자/복습 시각 복원 (새로고침하거나 다시 접속해도 이어서)
+        topic_words = word_bank.words_for(key)
+        history = get_progress_store().word_history(st.session_state.learner_id, topic_words if key else None)
+        st.session_state.schedulers[key] = LeitnerScheduler(topic_words).replay(history)
+    return st.session_state.schedulers[key]
+
+def schedule_batch(topic, gender, size=5):
+    """다음에 풀 단어 묶음을 정하고 뜻과 음성을 백그라운드에서 미리 준비"""
+    batch = get_scheduler(topic).next_batch(size)
+
+    cache = get_audio_cache()
+    gloss_store = get_gloss_store()
+    backend = get_tts_backend()
+    voice = backend.voice_key(gender)
+    executor = get_background_executor()
+
+    # 주제/목소리가 바뀌면 준비 중이던 단어는 취소
+    prefetcher = st.session_state.prefetcher
+    prefetcher.reset((topic, gender))
+    gloss_ready = executor.submit(gloss_store.prefetch, batch)   # 묶음 뜻은 한 번에 조회
+    prefetcher.schedule(batch, prepare_word,
+                        lambda word: render_audio(cache, word, voice, backend=backend), gloss_store.lookup, gloss_ready)
+
+    st.session_state.batch = batch
+    st.session_state.batch_topic = topic
+    st.session_state.batch_gender = gender
+    return batch
 
 # # =================================================================================================
 # # =================================================================================================
 
-# def speech_to_text():  
-#     """음성을 텍스트로 변환"""  
-#     r = sr.Recognizer()  
-#     status_placeholder = st.empty()  
-    
-#     # 오디오 처리를 위한 콜백 함수  
-#     def audio_frames_callback(frames):  
-#         sound = np.frombuffer(frames, dtype=np.int16)  
-#         return sound  
-    
-#     # webrtc_streamer 설정  
-#     webrtc_ctx = webrtc_streamer(  
-#         key="speech-to-text",  
-#         rtc_configuration=RTCConfiguration(  
-#             {"iceServers": [{"urls": ["stun:stun.l.google.com:19302"]}]}  
-#         ),  
-#         media_stream_constraints={  
-#             "video": False,  
-#             "audio": True,  
-#         },  
-#         audio_receiver_size=1024,  
-#         async_processing=True,  
-#     )  
-
-#     if webrtc_ctx.audio_receiver:  
-#         if webrtc_ctx.state.playing:  
-#             status_placeholder.write("🎤 녹음 중...")  
-#             try:  
-#                 # 오디오 데이터 수집  
-#                 audio_frames = webrtc_ctx.audio_receiver.get_frames()  
-#                 if audio_frames:  
-#                     # 오디오 데이터를 WAV 형식으로 변환  
-#                     audio_data = b''.join([frame.to_ndarray().tobytes() for frame in audio_frames])  
-                    
-#                     # WAV 파일 생성  
-#                     wav_bytes = BytesIO()  
-#                     with wave.open(wav_bytes, 'wb') as wav_file:  
-#                         wav_file.setnchannels(1)  
-#                         wav_file.setsampwidth(2)  
-#                         wav_file.setframerate(16000)  
-#                         wav_file.writeframes(audio_data)  
-                    
-#                     # 음성 인식  
-#                     audio = sr.AudioData(wav_bytes.getvalue(),   
-#                                        sample_rate=16000,  
-#                                        sample_width=2)  
-#                     text = r.recognize_google(audio, language='en-US')  
-                    
-#                     status_placeholder.success("음성 인식 완료!")  
-#                     return text.lower()  
-                    
-#             except Exception as e:  
-#                 status_placeholder.error(f"오류가 발생했습니다: {str(e)}")  
-#                 return None  
-    
-#     return None  
-
+def speech_to_text_streaming(candidates=None, scorer=None, key='speech-to-text'):
+    """실시간 녹음 (streamlit-webrtc): 말이 끝나면 무음을 감지해 자동으로 멈추고 바로 인식"""
+    import queue
+
+    import numpy as np
+    import speech_recognition as sr
+    from streamlit_webrtc import WebRtcMode, webrtc_streamer
+
+    import audio_io
+    from vad import VoiceActivityDetector
+
+    status_placeholder = st.empty()
+
+    # webrtc_streamer 설정 (오디오만 전송)
+    webrtc_ctx = webrtc_streamer(
+        key=key,
+        mode=WebRtcMode.SENDONLY,
+        rtc_configuration={"iceServers": [{"urls": ["stun:stun.l.google.com:19302"]}]},
+        media_stream_constraints={"video": False, "audio": True},
+        audio_receiver_size=1024,
+    )
+
+    if not webrtc_ctx.audio_receiver:
+        status_placeholder.write("START 버튼을 누르고 단어를 말해보세요...")
+        return None
+
+    status_placeholder.write("🎤 듣는 중... (말이 끝나면 자동으로 멈춥니다)")
+    detector = None
+    while webrtc_ctx.state.playing and not (detector and detector.done):
+        try:
+            frames = webrtc_ctx.audio_receiver.get_frames(timeout=1)
+        except queue.Empty:
+            continue
+        for frame in frames:
+            # packed s16 프레임: (1, 샘플 수 * 채널 수) → 모노
+            channels = len(frame.layout.channels)
+            samples = frame.to_ndarray().reshape(-1, channels)
+            samples = samples[:, 0] if channels == 1 else samples.mean(axis=1).astype(np.int16)
+            if detector is None:
+                detector = VoiceActivityDetector(frame.sample_rate)
+            if detector.push(samples):
+                break
+
+    if detector is None or not detector.started:
+        status_placeholder.warning("말소리가 들리지 않았습니다. 다시 시도해주세요.")
+        return None
+
+    # 앞뒤 무음을 잘라 낸 구간만 16kHz로 줄여 인식기로 전송
+    utterance = audio_io.resample(detector.utterance().astype(np.float32), detector.sample_rate)
+    audio_data = sr.AudioData(audio_io.to_int16(utterance).tobytes(), sample_rate=audio_io.TARGET_RATE, sample_width=2)
+    return recognize(audio_data, status_placeholder, candidates, scorer)
 
 # # =================================================================================================
 # # =================================================================================================
 
-def speech_to_text():  
-    """음성을 텍스트로 변환"""  
-    r = sr.Recognizer()  
+def recognize(audio_data, status_placeholder, candidates=None, scorer=None):
+    """인식 작업 풀에 맡기고 진행 상태를 표시 (candidates가 주어지면 후보 단어별 신뢰도 dict 반환)"""
+    import speech_recognition as sr
+
+    pool = get_recognizer_pool()
+    try:  
+        if candidates:
+            job = pool.submit(audio_data, grammar=candidates, score=True, scorer=scorer)
+        else:
+            # 선택한 주제의 단어를 인식 후보로 전달 (오프라인 백엔드에서 사용)
+            job = pool.submit(audio_data, grammar=get_word_bank().words_for(st.session_state.selected_topic))
+    except RecognitionBusy:
+        status_placeholder.warning("지금은 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+        return None
+
+    # 작업 상태에 따라 안내 문구 갱신
+    state_messages = {
+        'queued': "순서를 기다리는 중...",
+        'running': "음성을 텍스트로 변환 중...",
+    }
+    try:  
+        text = pool.wait(job, on_state=lambda state: status_placeholder.info(state_messages.get(state, state)))
+        
+        status_placeholder.success("음성 인식 완료!")  
+        return text
+        
+    except RecognitionTimeout:
+        status_placeholder.error("음성 인식 시간이 초과되었습니다. 다시 시도해주세요.")
+        return None
+    except CircuitOpen:
+        status_placeholder.warning("음성 인식 서비스가 잠시 불안정합니다. 잠시 후 다시 시도해주세요.")
+        return None
+    except sr.UnknownValueError:  
+        status_placeholder.error("음성을 인식할 수 없습니다. 다시 시도해주세요.")  
+        return None  
+    except sr.RequestError:  
+        status_placeholder.error("음성 인식 서비스에 접근할 수 없습니다.")  
+        return None  
+    except Exception as e:  
+        status_placeholder.error(f"오류가 발생했습니다: {str(e)}")  
+        return None
+
+def speech_to_text(candidates=None, scorer=None, key='recorder'):  
+    """음성을 텍스트로 변환 (candidates가 주어지면 후보 단어별 신뢰도 dict 반환)
+
+    녹음이 아직 없으면 None을 돌려주므로, 호출하는 쪽은 결과가 나올 때까지 매 실행마다
+    다시 불러 녹음 컴포넌트가 화면에 남아 있게 해야 한다.
+    """  
+    if config.CAPTURE_MODE == 'streaming':
+        return speech_to_text_streaming(candidates, scorer, key=key)
+
+    import speech_recognition as sr
+    from streamlit_mic_recorder import mic_recorder
+
+    import audio_io
+
     status_placeholder = st.empty()  
     
     status_placeholder.write("?? 마이크 버튼을 클릭하고 말씀해주세요...")  
@@ -135,31 +306,21 @@ def speech_to_text():
     audio = mic_recorder(  
         start_prompt="녹음 시작",  
         stop_prompt="녹음 종료",  
-        key='recorder'  
+        just_once=True,   # 같은 녹음을 다음 실행에서 다시 채점하지 않도록
+        key=key  
     )  
     
     if audio:  
-        try:  
-            status_placeholder.info("음성을 텍스트로 변환 중...")  
-            
-            # 음성 인식  
-            audio_data = sr.AudioData(audio,   
-                                    sample_rate=44100,  
-                                    sample_width=2)  
-            text = r.recognize_google(audio_data, language='en-US')  
-            
-            status_placeholder.success("음성 인식 완료!")  
-            return text.lower()  
-            
-        except sr.UnknownValueError:  
-            status_placeholder.error("음성을 인식할 수 없습니다. 다시 시도해주세요.")  
-            return None  
-        except sr.RequestError:  
-            status_placeholder.error("음성 인식 서비스에 접근할 수 없습니다.")  
-            return None  
-        except Exception as e:  
-            status_placeholder.error(f"오류가 발생했습니다: {str(e)}")  
-            return None  
+        # 녹음 파일(wav/webm)을 16kHz 모노 PCM으로 변환해 전송
+        try:
+            pcm = audio_io.to_pcm16k(audio)
+        except Exception as e:
+            status_placeholder.error(f"녹음 파일을 읽을 수 없습니다: {str(e)}")
+            return None
+        audio_data = sr.AudioData(pcm,   
+                                sample_rate=audio_io.TARGET_RATE,  
+                                sample_width=2)  
+        return recognize(audio_data, status_placeholder, candidates, scorer)
     
     return None  
 
@@ -167,15 +328,136 @@ def speech_to_text():
 # # =================================================================================================
 
 
+def stream_url(text, gender):
+    """api.py의 음성 주소 (브라우저가 직접 받아 첫 조각부터 재생)"""
+    from urllib.parse import quote
+
+    return f"{config.AUDIO_STREAM_URL}/api/audio/{quote(text)}?voice={'Boy' if gender == 'Boy' else 'Girl'}"
+
+def play_stream(url):
+    """chunked 음성을 받는 대로 재생하는 audio 요소"""
+    import html
+
+    import streamlit.components.v1 as components
+
+    components.html(f'<audio controls autoplay preload="auto" src="{html.escape(url)}"></audio>', height=60)
+
 def calculate_similarity(word1, word2):
-    """두 단어의 유사도 계산"""
-    return difflib.SequenceMatcher(None, word1, word2).ratio()
+    """두 단어의 유사도 계산 (word1: 목표 단어, word2: 인식된 문장)"""
+    with metrics.span('similarity'):
+        return matcher.similarity(word1, word2)
 
 def get_character_emoji(gender):
     """성별에 따른 이모지 반환"""
     return "👦" if gender == 'Boy' else "👧"
 
+# Streamlit 1.37 이전 버전은 experimental_fragment
+fragment = getattr(st, 'fragment', None) or st.experimental_fragment
+
+def count_render(name):
+    """화면 구역별 실행 횟수 기록 (benchmarks/reruns.py에서 사용)"""
+    counts = st.session_state.setdefault('render_counts', {})
+    counts[name] = counts.get(name, 0) + 1
+
+@fragment
+def render_row(i, row_image, gender):
+    """듣고 따라 읽기 한 줄 (이 줄의 PLAY/MIC를 누르면 이 줄만 다시 실행)"""
+    count_render(f'row_{i}')
+
+    col1, col2 = st.columns([1, 1])
+    # 새 단어 받기 버튼
+    with col1: 
+        st.image(row_image, width=200, caption=gender)
+    with col2: 
+        if st.button("PLAY", key="play_button_" + str(i)):
+            if i <= len(st.session_state.batch):
+                st.session_state.current_word = st.session_state.batch[i - 1]
+            else:
+                st.session_state.current_word = get_random_word(st.session_state.selected_topic)
+            # 미리 준비해 둔 음성과 뜻이 있으면 사용
+            # (스트리밍 재생이면 준비 중인 음성을 기다리지 않음)
+            wait = 0 if config.AUDIO_STREAM_URL else config.PREFETCH_WAIT_SECONDS
+            prepared = st.session_state.prefetcher.take(st.session_state.current_word, timeout=wait)
+            audio_bytes = audio_url = None
+            if prepared:
+                audio_bytes, korean_meaning = prepared.audio, prepared.gloss
+            else:
+                if config.AUDIO_STREAM_URL:
+                    audio_url = stream_url(st.session_state.current_word, st.session_state.selected_gender)
+                else:
+                    try:
+                        audio_bytes = create_audio(st.session_state.current_word, st.session_state.selected_gender)
+                    except CircuitOpen:
+                        pass
+                korean_meaning = get_gloss_store().lookup(st.session_state.current_word)
+            
+            # 단어와 발음 듣기 버튼 표시
+            st.write(f"## 이 단어를 읽어보세요: **{st.session_state.current_word}**")
+            if audio_bytes:
+                st.audio(audio_bytes, format=get_tts_backend().mimetype)
+            elif audio_url:
+                play_stream(audio_url)
+            else:
+                st.warning("음성 서비스가 잠시 불안정합니다. 잠시 후 다시 들어보세요.")
+            
+            # 한국어 의미 표시
+            if korean_meaning:
+                st.write(f"단어 뜻: {korean_meaning}")
+            else:
+                st.write("단어 뜻을 가져올 수 없습니다.")
+        
+        # 발음 체크 버튼: 녹음 컴포넌트는 START/녹음 종료 때마다 다시 실행되는데 그때 버튼 값은
+        # False이므로, 녹음 중인지는 세션 상태로 기억해 결과가 나올 때까지 컴포넌트를 계속 그림
+        recording = st.session_state.recording
+        if st.button("MIC", key="mic_button_" + str(i)):
+            if st.session_state.current_word:
+                recording[i] = True
+            else:
+                st.warning("먼저 '새 단어 받기' 버튼을 클릭하세요.")
+        if recording.get(i) and st.session_state.current_word:
+            recorder_key = f'recorder_{i}'
+            # 기준 발음 저장소가 없으면 acoustic 대신 유사도 채점
+            acoustic_scorer = get_acoustic_scorer() if config.SCORING_MODE == 'acoustic' else None
+            if config.SCORING_MODE == 'constrained':
+                # 목표 단어와 헷갈리기 쉬운 단어만 후보로 채점
+                vocabulary = get_word_bank().words_for(st.session_state.selected_topic)
+                scores = speech_to_text(candidates_for(st.session_state.current_word, vocabulary), key=recorder_key)
+                spoken_text = best_candidate(scores) if scores else None
+                similarity = scores.get(st.session_state.current_word, 0.0) if spoken_text else 0.0
+                if scores and spoken_text is None:
+                    # 모든 후보가 0점: 아무 말도 인식하지 못함
+                    st.error("음성을 인식할 수 없습니다. 다시 시도해주세요.")
+            elif acoustic_scorer is not None:
+                # 미리 만든 기준 발음과 녹음을 직접 비교 (음성 인식 서버 호출 없음)
+                scores = speech_to_text([st.session_state.current_word], scorer=acoustic_scorer, key=recorder_key)
+                spoken_text = "(발음 비교)" if scores else None
+                similarity = scores.get(st.session_state.current_word, 0.0) if scores else 0.0
+            else:
+                spoken_text = speech_to_text(key=recorder_key)
+                similarity = calculate_similarity(st.session_state.current_word, spoken_text) if spoken_text else 0.0
+            if spoken_text:
+                recording[i] = False   # 결과가 나오면 녹음 끝 (인식 실패면 다시 녹음할 수 있게 유지)
+                st.session_state.total_attempts += 1
+                get_scheduler(st.session_state.batch_topic).record(st.session_state.current_word, similarity > matcher.PASS_THRESHOLD)
+                get_progress_store().record_attempt(st.session_state.learner_id, st.session_state.current_word,
+                                                    similarity, similarity > matcher.PASS_THRESHOLD,
+                                                    topic=st.session_state.batch_topic)
+                
+                if similarity > matcher.PASS_THRESHOLD:
+                    st.success(f"정확합니다! (유사도: {similarity:.2%})")
+                    st.session_state.score += 1
+                    st.balloons()  # 성공시 풍선 효과 추가
+                else:
+                    st.error(f"다시 시도해보세요. 인식된 단어: {spoken_text} (유사도: {similarity:.2%})")
+                
+                # 결과 표시
+                st.write(f"당신이 말한 단어: {spoken_text}")
+                st.write(f"목표 단어: {st.session_state.current_word}")
+        st.write("")  
+
 def main():
+    count_render('main')
+    metrics.start_log_dump(config.METRICS_LOG_INTERVAL)
     # st.title("Word Friends")
     # st.title("AI 친구와 단어를 학습해보세요")
     # st.title("주제를 선택하세요")
@@ -221,44 +503,42 @@ def main():
 
     
     
-    # 선택된 이미지를 저장할 변수 초기화  
-    if 'selected_image' not in st.session_state:  
-        st.session_state.selected_image = None  
-
-    # 이미지 클릭 이벤트 처리  
-    def select_image(image_key):  
-        st.session_state.selected_image = image_key  
+    # 주제 이미지 클릭 이벤트 처리  
+    def select_topic(topic):  
+        st.session_state.selected_topic = topic  
+        # 주제의 단어 뜻을 한 번에 미리 가져오기 (백그라운드, 클릭 처리를 기다리게 하지 않음)
+        get_background_executor().submit(get_gloss_store().prefetch, get_word_bank().words_for(topic))
 
     col1, col2, col3, col4, col5 = st.columns(5)  
 
     with col1:  
         if st.button("School"):  
-            select_image('School')  
-        st.image(topic_image_paths['School'], caption='School', use_column_width=True)  
+            select_topic('School')  
+        st.image(get_image(topic_image_paths['School'], assets.WIDTHS['topic']), caption='School', use_column_width=True)  
 
     with col2:  
         if st.button("Family"):  
-            select_image('Family')  
-        st.image(topic_image_paths['Family'], caption='Family', use_column_width=True)
+            select_topic('Family')  
+        st.image(get_image(topic_image_paths['Family'], assets.WIDTHS['topic']), caption='Family', use_column_width=True)
         
     with col3:  
         if st.button("Animals"):  
-            select_image('Animals')  
-        st.image(topic_image_paths['Animals'], caption='Animals', use_column_width=True)  
+            select_topic('Animals')  
+        st.image(get_image(topic_image_paths['Animals'], assets.WIDTHS['topic']), caption='Animals', use_column_width=True)  
 
     with col4:  
         if st.button("Weather"):  
-            select_image('Weather')  
-        st.image(topic_image_paths['Weather'], caption='Weather', use_column_width=True)
+            select_topic('Weather')  
+        st.image(get_image(topic_image_paths['Weather'], assets.WIDTHS['topic']), caption='Weather', use_column_width=True)
         
     with col5:  
         if st.button("Food"):  
-            select_image('Food')  
-        st.image(topic_image_paths['Food'], caption='Food', use_column_width=True)  
+            select_topic('Food')  
+        st.image(get_image(topic_image_paths['Food'], assets.WIDTHS['topic']), caption='Food', use_column_width=True)  
 
-    # 선택된 이미지 표시  
-    if st.session_state.selected_image:  
-        st.write(f"Hello {st.session_state.selected_image}")
+    # 선택된 주제 표시  
+    if st.session_state.selected_topic:  
+        st.write(f"Hello {st.session_state.selected_topic}")
         
 
 
@@ -278,29 +558,24 @@ def main():
 
     
     
-    # 선택된 이미지를 저장할 변수 초기화  
-    if 'selected_image' not in st.session_state:  
-        st.session_state.selected_image = None  
-
-    # 이미지 클릭 이벤트 처리  
-    def select_image(image_key):  
-        st.session_state.selected_image = image_key  
+    # 캐릭터 이미지 클릭 이벤트 처리 (주제와 따로 저장, 목소리도 이 캐릭터를 따름)  
+    def select_character(gender):  
+        st.session_state.selected_gender = gender  
 
     col1, col2 = st.columns(2)  
 
     with col1:  
         if st.button("Boy"):  
-            select_image('Boy')  
-        st.image(image_paths['Boy'], caption='Boy', use_column_width=True)  
+            select_character('Boy')  
+        st.image(get_image(image_paths['Boy'], assets.WIDTHS['character']), caption='Boy', use_column_width=True)  
 
     with col2:  
         if st.button("Girl"):  
-            select_image('Girl')  
-        st.image(image_paths['Girl'], caption='Girl', use_column_width=True)  
+            select_character('Girl')  
+        st.image(get_image(image_paths['Girl'], assets.WIDTHS['character']), caption='Girl', use_column_width=True)  
 
-    # 선택된 이미지 표시  
-    if st.session_state.selected_image:  
-        st.write(f"Hello {st.session_state.selected_image}")
+    # 선택된 캐릭터 표시  
+    st.write(f"Hello {st.session_state.selected_gender}")
 
         
                 
@@ -328,53 +603,20 @@ def main():
     st.sidebar.header("점수")
     st.sidebar.write(f"정확도: {st.session_state.score}/{st.session_state.total_attempts if st.session_state.total_attempts > 0 else 1:.2%}")
     
+    # 주제/캐릭터가 바뀌었거나 처음이면 단어 5개를 한 번에 정하고 미리 준비
+    topic, gender = st.session_state.selected_topic, st.session_state.selected_gender
     test = [1, 2, 3, 4, 5]
+    if (not st.session_state.batch or st.session_state.batch_topic != topic
+            or st.session_state.batch_gender != gender):
+        schedule_batch(topic, gender, size=len(test))
+
+    row_image = get_image(image_paths[gender], assets.WIDTHS['row'])
     for i in test:
-        col1, col2 = st.columns([1, 1])
-        # 새 단어 받기 버튼
-        with col1: 
-            st.image(image_paths['Boy'], width=200, caption='Boy')
-        with col2: 
-            if st.button("PLAY", key="play_button_" + str(i)):
-                st.session_state.current_word = get_random_word()
-                audio_file = create_audio(st.session_state.current_word, st.session_state.selected_gender)
-                
-                # 단어와 발음 듣기 버튼 표시
-                st.write(f"## 이 단어를 읽어보세요: **{st.session_state.current_word}**")
-                st.audio(audio_file)
-                
-                # 한국어 의미 표시
-                translator = Translator()
-                try:
-                    korean_meaning = translator.translate(st.session_state.current_word, dest='ko').text
-                    st.write(f"단어 뜻: {korean_meaning}")
-                except:
-                    st.write("단어 뜻을 가져올 수 없습니다.")
-                
-                # 임시 파일 삭제
-                os.remove(audio_file)
-            
-            # 발음 체크 버튼
-            if st.button("MIC", key="mic_button_" + str(i)):
-                if st.session_state.current_word:
-                    spoken_text = speech_to_text()
-                    if spoken_text:
-                        similarity = calculate_similarity(st.session_state.current_word, spoken_text)
-                        st.session_state.total_attempts += 1
-                        
-                        if similarity > 0.8:
-                            st.success(f"정확합니다! (유사도: {similarity:.2%})")
-                            st.session_state.score += 1
-                            st.balloons()  # 성공시 풍선 효과 추가
-                        else:
-                            st.error(f"다시 시도해보세요. 인식된 단어: {spoken_text} (유사도: {similarity:.2%})")
-                        
-                        # 결과 표시
-                        st.write(f"당신이 말한 단어: {spoken_text}")
-                        st.write(f"목표 단어: {st.session_state.current_word}")
-                else:
-                    st.warning("먼저 '새 단어 받기' 버튼을 클릭하세요.")
-            st.write("")  
+        render_row(i, row_image, gender)
+
+    # 새 단어 묶음 받기 버튼
+    if st.button("새 단어 받기"):
+        schedule_batch(topic, gender, size=len(test))
 
 
     # 도움말
@@ -0,0 +1,234 @@
+"""음성 인식 백엔드와 작업 풀 (크기 제한, 대기열 상한, 시간 제한)
+
+speech_recognition, vosk는 백엔드를 처음 사용할 때 불러온다.
+"""
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import matcher
+import metrics
+import outbound
+
+
+class GoogleBackend:
+    """Google Web Speech API (speech_recognition.recognize_google)"""
+
+    name = 'google'
+
+    def __init__(self, timeout=10, language='en-US'):
+        self.timeout = timeout
+        self.language = language
+        self._local = threading.local()
+
+    def _recognizer(self):
+        """현재 스레드의 Recognizer (스레드마다 하나씩 만들어 재사용)"""
+        recognizer = getattr(self._local, 'recognizer', None)
+        if recognizer is None:
+            import speech_recognition as sr
+
+            recognizer = sr.Recognizer()
+            recognizer.operation_timeout = self.timeout
+            self._local.recognizer = recognizer
+        return recognizer
+
+    def recognize(self, audio_data, grammar=None):
+        """sr.AudioData → 텍스트 (grammar는 사용하지 않음)
+
+        서비스가 불안정하면 outbound.CircuitOpen (말소리 없음은 서비스 실패로 세지 않음)
+        """
+        backend = outbound.get('asr', is_failure=lambda error: type(error).__name__ != 'UnknownValueError')
+        return backend.call(None, lambda: self._recognizer().recognize_google(audio_data, language=self.language))
+
+    def score(self, audio_data, candidates):
+        """후보 단어별 점수 (받아쓰기 결과와의 matcher 유사도, vosk와 달리 합계가 1이 아님)
+
+        Google은 인식할 단어를 제한할 수 없으므로 한 번 받아쓴 뒤 후보마다 비교한다.
+        """
+        import speech_recognition as sr
+
+        candidates = list(candidates)
+        try:
+            transcript = self.recognize(audio_data)
+        except sr.UnknownValueError:
+            return dict.fromkeys(candidates, 0.0)
+        return {word: matcher.similarity(word, transcript) for word in candidates}
+
+
+class VoskBackend:
+    """Vosk 오프라인 인식 (모델은 프로세스당 한 번만 읽어 모든 세션이 공유)
+
+    grammar(단어 목록)가 주어지면 그 단어들 중에서만 인식하므로 빠르고 정확하다.
+    """
+
+    name = 'vosk'
+    sample_rate = 16000
+
+    def __init__(self, model_path):
+        from vosk import Model, SetLogLevel
+
+        SetLogLevel(-1)
+        self.model = Model(model_path)
+
+    def recognize(self, audio_data, grammar=None):
+        """sr.AudioData → 텍스트, 인식 결과가 없으면 sr.UnknownValueError"""
+        import speech_recognition as sr
+        from vosk import KaldiRecognizer
+
+        if grammar:
+            recognizer = KaldiRecognizer(self.model, self.sample_rate,
+                                         json.dumps(list(grammar) + ['[unk]']))
+        else:
+            recognizer = KaldiRecognizer(self.model, self.sample_rate)
+        recognizer.AcceptWaveform(audio_data.get_raw_data(convert_rate=self.sample_rate, convert_width=2))
+        text = json.loads(recognizer.FinalResult()).get('text', '').replace('[unk]', '').strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+    def score(self, audio_data, candidates):
+        """후보 단어들로 제한해 인식하고 단어별 신뢰도(합계 1) 반환"""
+        from vosk import KaldiRecognizer
+
+        candidates = list(candidates)
+        recognizer = KaldiRecognizer(self.model, self.sample_rate, json.dumps(candidates + ['[unk]']))
+        recognizer.SetMaxAlternatives(len(candidates) + 1)
+        recognizer.AcceptWaveform(audio_data.get_raw_data(convert_rate=self.sample_rate, convert_width=2))
+        alternatives = json.loads(recognizer.FinalResult()).get('alternatives', [])
+
+        # 가설별 점수(로그 스케일)를 softmax로 정규화
+        best = {}
+        for alternative in alternatives:
+            word = alternative.get('text', '').strip()
+            if word in candidates:
+                best[word] = max(best.get(word, float('-inf')), alternative.get('confidence', 0.0))
+        scores = dict.fromkeys(candidates, 0.0)
+        if best:
+            top = max(best.values())
+            weights = {word: math.exp(value - top) for word, value in best.items()}
+            total = sum(weights.values())
+            scores.update({word: weight / total for word, weight in weights.items()})
+        return scores
+
+
+def create_backend(name, timeout=10, language='en-US', vosk_model_path=None):
+    """설정 이름으로 인식 백엔드 생성"""
+    if name == 'google':
+        return GoogleBackend(timeout=timeout, language=language)
+    if name == 'vosk':
+        return VoskBackend(vosk_model_path)
+    raise ValueError(f"알 수 없는 음성 인식 백엔드: {name}")
+
+
+class RecognitionBusy(Exception):
+    """대기열이 가득 차 새 인식 요청을 받을 수 없음"""
+
+
+class RecognitionTimeout(Exception):
+    """제한 시간 안에 인식이 끝나지 않음"""
+
+
+class RecognitionJob:
+    """인식 작업 하나 (state: queued → running → done)"""
+
+    def __init__(self):
+        self.state = 'queued'
+        self.future = None
+
+
+class RecognizerPool:
+    """음성 인식을 고정 크기 스레드 풀에서 실행
+
+    동시에 처리 중이거나 대기 중인 작업이 max_workers + max_pending 개를 넘으면
+    RecognitionBusy를 발생시켜 스레드와 대기열이 끝없이 늘어나지 않게 한다.
+    """
+
+    def __init__(self, backend, max_workers=4, max_pending=16, timeout=10):
+        self.backend = backend
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='asr')
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(
+            ['submitted', 'rejected', 'completed', 'failed', 'timeouts'], 0)
+        self._in_flight = 0
+        self._active = 0
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+        metrics.incr(f'asr.{name}')
+
+    def submit(self, audio_data, grammar=None, score=False, scorer=None):
+        """인식 작업 등록, 대기열이 가득 차면 RecognitionBusy
+
+        grammar: 인식 후보 단어 목록 (지원하는 백엔드만 사용)
+        score: True면 텍스트 대신 grammar 단어별 신뢰도 dict를 결과로 돌려줌
+        scorer: score에 사용할 객체 (기본값은 인식 백엔드)
+        """
+        if not self._slots.acquire(blocking=False):
+            self._count('rejected')
+            raise RecognitionBusy()
+
+        job = RecognitionJob()
+        with self._lock:
+            self.counters['submitted'] += 1
+            self._in_flight += 1
+        job.future = self._executor.submit(self._run, job, audio_data, grammar, score, scorer)
+        return job
+
+    def _run(self, job, audio_data, grammar, score, scorer):
+        job.state = 'running'
+        with self._lock:
+            self._active += 1
+        try:
+            if score:
+                scorer = scorer or self.backend
+                with metrics.span(f'asr.score.{type(scorer).__name__}'):
+                    result = scorer.score(audio_data, grammar)
+            else:
+                with metrics.span(f'asr.{self.backend.name}'):
+                    result = self.backend.recognize(audio_data, grammar=grammar).lower()
+            self._count('completed')
+            return result
+        except Exception:
+            self._count('failed')
+            raise
+        finally:
+            job.state = 'done'
+            with self._lock:
+                self._active -= 1
+                self._in_flight -= 1
+            self._slots.release()
+
+    def wait(self, job, on_state=None, poll_interval=0.1):
+        """작업 결과를 기다림, 상태가 바뀔 때마다 on_state(state) 호출
+
+        제한 시간을 넘기면 RecognitionTimeout, 인식 중 예외는 그대로 전달된다.
+        """
+        deadline = time.monotonic() + self.timeout
+        state = None
+        while not job.future.done():
+            if job.state != state:
+                state = job.state
+                if on_state:
+                    on_state(state)
+            if time.monotonic() > deadline:
+                job.future.cancel()
+                self._count('timeouts')
+                raise RecognitionTimeout()
+            time.sleep(poll_interval)
+        return job.future.result()
+
+    def stats(self):
+        """풀 사용 현황 (saturation: 처리 중 + 대기 중 / 전체 수용량)"""
+        with self._lock:
+            stats = dict(self.counters)
+            stats['active'] = self._active
+            stats['queued'] = self._in_flight - self._active
+            stats['saturation'] = self._in_flight / (self.max_workers + self.max_pending)
+            return stats
@@ -0,0 +1,79 @@
+"""이미지 자원: 표시 크기에 맞게 한 번만 줄이고 WebP로 변환
+
+`python assets.py` 로 크기별 WebP 파일을 미리 만들어 image/build/에 함께 커밋해 두고,
+실행 중에는 그 파일을 읽기만 한다 (원본 PNG를 바꾸면 다시 실행해 커밋). 미리 만든 파일이
+없으면 처음 요청할 때 빠른 설정으로 변환한다.
+같은 이미지는 항상 같은 bytes를 돌려주므로 브라우저 캐시가 그대로 동작한다.
+"""
+import argparse
+import glob
+import os
+from io import BytesIO
+
+import config
+
+# 용도별 이미지 폭 (고해상도 화면을 고려해 실제 표시 폭보다 크게)
+WIDTHS = {
+    'topic': 320,       # 주제 선택 (5열)
+    'character': 512,   # 캐릭터 선택 (2열)
+    'row': 400,         # 듣고 따라 읽기 줄 (width=200으로 표시)
+}
+
+WEBP_QUALITY = 85
+# WebP 압축 노력 (0~6): 6은 이미지 하나에 1~3초 걸리므로 미리 만들 때만 쓰고,
+# 실행 중 변환은 크기가 거의 같으면서 수십 ms인 4를 씀
+BUILD_METHOD = 6
+RUNTIME_METHOD = 4
+
+
+def variant_path(path, width, build_dir):
+    """미리 만든 변환 파일 경로 (예: image/build/boy_400.webp)"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(build_dir, f'{name}_{width}.webp')
+
+
+def render(path, width, method=RUNTIME_METHOD):
+    """이미지를 width 폭으로 줄여 WebP bytes로 변환"""
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.load()
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+        fp = BytesIO()
+        image.save(fp, format='WEBP', quality=WEBP_QUALITY, method=method)
+    return fp.getvalue()
+
+
+def load(path, width, build_dir=config.IMAGE_BUILD_DIR):
+    """표시용 이미지 bytes (미리 만든 파일 → 즉석 변환 순서)"""
+    try:
+        with open(variant_path(path, width, build_dir), 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return render(path, width)
+
+
+def build(paths, widths, build_dir):
+    """모든 이미지의 크기별 WebP 파일 생성"""
+    os.makedirs(build_dir, exist_ok=True)
+    for path in paths:
+        for width in widths:
+            data = render(path, width, method=BUILD_METHOD)
+            with open(variant_path(path, width, build_dir), 'wb') as f:
+                f.write(data)
+            print(f"{variant_path(path, width, build_dir)} ({len(data) / 1024:.1f}KB)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="이미지 크기별 WebP 변환 파일 생성")
+    parser.add_argument('--src', default=config.IMAGE_DIR, help="원본 PNG 디렉터리")
+    parser.add_argument('--out', default=config.IMAGE_BUILD_DIR, help="변환 파일 디렉터리")
+    args = parser.parse_args(argv)
+
+    build(sorted(glob.glob(os.path.join(args.src, '*.png'))), sorted(set(WIDTHS.values())), args.out)
+
+
+if __name__ == "__main__":
+    main()
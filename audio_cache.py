@@ -0,0 +1,229 @@
+"""TTS 오디오 캐시 (메모리 LRU + 사전 합성 번들 + 디스크)"""
+import hashlib
+import json
+import os
+import queue
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+def cache_key(text, lang, tld):
+    """(text, lang, tld) 조합으로 캐시 키 생성"""
+    raw = '\x00'.join([text, lang, tld]).encode('utf-8')
+    return hashlib.sha256(raw).hexdigest()
+
+
+MANIFEST_NAME = 'manifest.json'
+
+# 디스크 캐시 파일 확장자 (합성 백엔드의 mimetype 기준)
+EXTENSIONS = {'audio/mpeg': '.mp3', 'audio/wav': '.wav', 'audio/ogg': '.ogg'}
+
+
+def load_manifest(bundle_dir):
+    """사전 합성 번들의 manifest 읽기 (없으면 빈 dict)"""
+    try:
+        with open(os.path.join(bundle_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(bundle_dir, manifest):
+    """manifest 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = os.path.join(bundle_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class AudioCache:
+    """메모리 LRU(bytes)와 용량 제한이 있는 디스크 캐시
+
+    bundle_dir가 주어지면 presynth.py로 미리 만든 번들을 읽기 전용 단계로 사용한다.
+    manifest에서 bundle_backend로 합성한 항목만 쓰고(stub 등 다른 백엔드 결과는 무시),
+    처음 읽을 때 sha256을 확인해 내용이 다르면 그 항목을 버린다.
+    디스크 파일 확장자는 mimetype(합성 백엔드의 출력 형식)을 따른다.
+    """
+
+    def __init__(self, directory, max_items=512, max_bytes=200 * 1024 * 1024, bundle_dir=None,
+                 bundle_backend='gtts', mimetype='audio/mpeg'):
+        self.directory = directory
+        self.extension = EXTENSIONS[mimetype]
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending = queue.Queue()
+        self._writer = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.bundle_hits = 0
+        self.misses = 0
+
+        self.bundle_dir = bundle_dir
+        self._bundle = {}
+        if bundle_dir:
+            self._bundle = {key: (os.path.join(bundle_dir, entry['file']), entry.get('sha256'))
+                            for key, entry in load_manifest(bundle_dir).items()
+                            if entry.get('backend', 'gtts') == bundle_backend}
+
+        os.makedirs(directory, exist_ok=True)
+        self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.extension)
+
+    def _disk_entries(self):
+        """디스크 캐시 파일 목록 (경로, 크기, 수정 시각)
+
+        백엔드를 바꾸기 전에 저장한 다른 형식의 파일도 용량에 넣어 함께 정리한다.
+        """
+        extensions = tuple(EXTENSIONS.values())
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(extensions):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _remember(self, key, data):
+        """메모리 LRU에 저장 (잠금 상태에서 호출)"""
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _read_bundle(self, key):
+        """사전 합성 번들에서 읽기, 없거나 manifest의 sha256과 다르면 None"""
+        entry = self._bundle.get(key)
+        if entry is None:
+            return None
+        path, digest = entry
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if digest and hashlib.sha256(data).hexdigest() != digest:
+            self._bundle.pop(key, None)   # 이후에는 합성/디스크 캐시 사용
+            return None
+        return data
+
+    def get(self, key):
+        """캐시 조회 (메모리 → 번들 → 디스크 순서), 없으면 None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+
+        data = self._read_bundle(key)
+        if data is not None:
+            with self._lock:
+                self.bundle_hits += 1
+                self._remember(key, data)
+            return data
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)  # 디스크 LRU 순서 갱신
+        except FileNotFoundError:
+            pass  # 읽은 직후 다른 스레드가 삭제한 경우
+
+        with self._lock:
+            self.disk_hits += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        """메모리에 저장하고 디스크 저장은 백그라운드 스레드에 맡김
+
+        요청 처리 경로에서는 파일을 쓰지 않으므로 여러 세션이 동시에 호출해도 안전하다.
+        """
+        with self._lock:
+            self._remember(key, data)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='audio-cache-writer', daemon=True)
+                self._writer.start()
+        self._pending.put((key, data))
+
+    def flush(self):
+        """대기 중인 디스크 저장이 끝날 때까지 기다림"""
+        self._pending.join()
+
+    def _write_loop(self):
+        while True:
+            key, data = self._pending.get()
+            try:
+                self._write_disk(key, data)
+            except OSError:
+                pass  # 디스크 저장 실패는 메모리 캐시에 영향 없음
+            finally:
+                self._pending.task_done()
+
+    def _write_disk(self, key, data):
+        """임시 파일에 쓴 뒤 교체해 읽는 쪽이 쓰다 만 파일을 보지 않도록 함"""
+        path = self._path(key)
+        existed = os.path.exists(path)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)   # 디스크가 가득 찬 경우 등 임시 파일을 남기지 않음
+            except FileNotFoundError:
+                pass
+            raise
+        if not existed:
+            with self._lock:
+                self._disk_bytes += len(data)
+        if self._disk_bytes > self.max_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """디스크 용량 상한을 넘으면 오래 사용하지 않은 파일부터 삭제"""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def stats(self):
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            hits = self.memory_hits + self.bundle_hits + self.disk_hits
+            total = hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'bundle_hits': self.bundle_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': hits / total if total else 0.0,
+                'memory_items': len(self._memory),
+                'bundle_items': len(self._bundle),
+                'disk_bytes': self._disk_bytes,
+            }
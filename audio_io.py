@@ -0,0 +1,157 @@
+"""녹음 데이터 변환: mic_recorder 결과(wav/webm) → 16kHz 모노 int16 PCM
+
+음성 인식에는 16kHz 모노면 충분하므로 44.1/48kHz 스테레오를 그대로 보내지 않는다.
+WAV는 헤더만 읽고 memoryview 위에서 numpy로 바로 처리하며(중간 복사 없음),
+webm/ogg 같은 압축 형식은 PyAV로 디코딩과 변환을 한 번에 한다.
+오프라인 음성 합성 결과(PCM)를 WAV/Opus로 감싸는 함수도 여기에 둔다.
+"""
+import struct
+import wave
+from io import BytesIO
+
+import numpy as np
+
+TARGET_RATE = 16000
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_FLOAT = 3
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class UnsupportedAudio(Exception):
+    """해석할 수 없는 오디오 형식"""
+
+
+def parse_wav(data):
+    """WAV 헤더 해석 → (샘플 dtype, 채널 수, 샘플링 레이트, data 청크 memoryview)"""
+    view = memoryview(data)
+    if bytes(view[0:4]) != b'RIFF' or bytes(view[8:12]) != b'WAVE':
+        raise UnsupportedAudio("WAV 파일이 아닙니다.")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        size = struct.unpack_from('<I', view, offset + 4)[0]
+        body = offset + 8
+        if chunk_id == b'fmt ':
+            fmt = struct.unpack_from('<HHIIHH', view, body)
+            if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and size >= 26:
+                # 실제 형식은 SubFormat GUID의 앞 2바이트
+                fmt = (struct.unpack_from('<H', view, body + 24)[0],) + fmt[1:]
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise UnsupportedAudio("fmt 청크가 없습니다.")
+            tag, channels, rate, _, _, bits = fmt
+            dtype = _dtype(tag, bits)
+            # 녹음 중단 등으로 size가 실제보다 클 수 있음 (0xFFFFFFFF 등)
+            end = min(len(view), body + size)
+            end -= (end - body) % (dtype.itemsize * channels)
+            return dtype, channels, rate, view[body:end]
+        offset = body + size + (size & 1)
+    raise UnsupportedAudio("data 청크가 없습니다.")
+
+
+def _dtype(tag, bits):
+    if tag == _WAVE_FORMAT_PCM and bits == 16:
+        return np.dtype('<i2')
+    if tag == _WAVE_FORMAT_PCM and bits == 32:
+        return np.dtype('<i4')
+    if tag == _WAVE_FORMAT_FLOAT and bits == 32:
+        return np.dtype('<f4')
+    raise UnsupportedAudio(f"지원하지 않는 WAV 형식입니다 (format={tag}, bits={bits}).")
+
+
+def to_mono(samples, channels):
+    """(샘플 수 * 채널 수) 배열 → 모노 float32"""
+    if channels == 1:
+        return samples.astype(np.float32, copy=False)
+    return samples.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+
+
+def resample(samples, rate, target_rate=TARGET_RATE):
+    """float32 모노 신호의 샘플링 레이트 변환
+
+    정수배(48k→16k)면 구간 평균으로 줄이고(간단한 저역 통과 효과), 그 외는 선형 보간.
+    """
+    if rate == target_rate or len(samples) == 0:
+        return samples
+    if rate % target_rate == 0:
+        factor = rate // target_rate
+        n = len(samples) // factor
+        return samples[:n * factor].reshape(n, factor).mean(axis=1)
+    n = int(len(samples) * target_rate / rate)
+    positions = np.arange(n, dtype=np.float64) * (rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def to_int16(samples, scale=1.0):
+    """float 신호 → int16 (범위를 넘으면 자름)"""
+    return np.clip(samples * scale, -32768, 32767).astype(np.int16)
+
+
+def wav_to_pcm16k(data, target_rate=TARGET_RATE):
+    """WAV bytes → 16kHz 모노 int16 배열"""
+    dtype, channels, rate, payload = parse_wav(data)
+    samples = np.frombuffer(payload, dtype=dtype)   # memoryview를 그대로 사용 (복사 없음)
+    if dtype == np.int16 and channels == 1 and rate == target_rate:
+        return samples
+    scale = {'f': 32767.0, 'i': 1.0 if dtype.itemsize == 2 else 1 / 65536}[dtype.kind]
+    return to_int16(resample(to_mono(samples, channels), rate, target_rate), scale)
+
+
+def encoded_to_pcm16k(data, target_rate=TARGET_RATE):
+    """webm/ogg 등 압축 오디오 → 16kHz 모노 int16 배열 (PyAV로 디코딩과 변환)"""
+    import av
+
+    chunks = []
+    with av.open(BytesIO(data)) as container:
+        resampler = av.AudioResampler(format='s16', layout='mono', rate=target_rate)
+        for frame in container.decode(audio=0):
+            for out in resampler.resample(frame):
+                chunks.append(out.to_ndarray().reshape(-1))
+        for out in resampler.resample(None):  # 남은 샘플 비우기
+            chunks.append(out.to_ndarray().reshape(-1))
+    if not chunks:
+        return np.empty(0, dtype=np.int16)
+    return np.concatenate(chunks).astype(np.int16, copy=False)
+
+
+def to_pcm16k(recording, target_rate=TARGET_RATE):
+    """mic_recorder 결과(dict) 또는 bytes → 16kHz 모노 int16 PCM bytes"""
+    data = recording['bytes'] if isinstance(recording, dict) else recording
+    if data[:4] == b'RIFF':
+        samples = wav_to_pcm16k(data, target_rate)
+    else:
+        samples = encoded_to_pcm16k(data, target_rate)
+    return samples.tobytes()
+
+
+def pcm16_to_wav(pcm, rate):
+    """16bit 모노 PCM bytes → WAV bytes"""
+    out = BytesIO()
+    with wave.open(out, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(pcm)
+    return out.getvalue()
+
+
+def pcm16_to_opus(pcm, rate, bit_rate=32000):
+    """16bit 모노 PCM bytes → ogg/opus bytes (PyAV, 48kHz로 자동 변환)"""
+    import av
+
+    samples = np.frombuffer(pcm, dtype=np.int16).reshape(1, -1)
+    out = BytesIO()
+    with av.open(out, 'w', format='ogg') as container:
+        stream = container.add_stream('libopus', rate=48000)
+        stream.layout = 'mono'
+        stream.bit_rate = bit_rate
+        frame = av.AudioFrame.from_ndarray(samples, format='s16', layout='mono')
+        frame.sample_rate = rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return out.getvalue()
@@ -0,0 +1,135 @@
+"""HTTP API(api.py)와 Streamlit 화면의 처리량 비교
+
+같은 가짜 백엔드(benchmarks/fakes.py) 위에서 "다음 단어 + 음성"과 "발음 확인"을
+  - api: Flask 테스트 클라이언트로 GET /api/word → GET /api/audio, POST /api/check
+  - streamlit: `streamlit run benchmarks/fake_app.py` 서버에 동시 요청 수만큼 세션(웹소켓)을
+    열고 PLAY, MIC 클릭 (브라우저처럼 해당 줄 fragment만 다시 실행, benchmarks/live.py)
+로 반복하고 동시 요청 수별 처리량과 p50/p95를 출력한다. API는 같은 프로세스의 테스트
+클라이언트, Streamlit은 같은 컴퓨터의 서버라 네트워크 비용은 거의 없으므로 서버 프레임워크와
+화면 다시 실행 비용의 차이를 본다. 세션을 처음 여는 비용(첫 화면)은 측정에서 뺀다.
+
+사용법:
+    python benchmarks/api.py --requests 200 --concurrency 1 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # 앱이 ./image, ./data 상대 경로를 사용
+
+
+def run(task, count, concurrency):
+    """task()를 count번 실행 → (초당 처리 수, 지연 시간 목록)"""
+    def timed(_):
+        start = time.perf_counter()
+        task()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(count)))
+    return count / (time.perf_counter() - start), latencies
+
+
+def api_tasks(recording):
+    from api import app
+
+    client = app.test_client()
+
+    def play():
+        word = client.get('/api/word?topic=Animals').get_json()
+        response = client.get(word['audio_url'])
+        assert response.status_code == 200, response.status_code
+
+    def check():
+        response = client.post('/api/check', data={'word': 'cat', 'topic': 'Animals',
+                                                   'audio': (BytesIO(recording), 'clip.wav')})
+        assert response.status_code == 200, response.status_code
+
+    return play, check
+
+
+def streamlit_tasks(server, sessions):
+    """실제 Streamlit 서버에 세션(웹소켓) sessions개를 미리 열고, 요청마다 쉬는 세션 하나로 PLAY/MIC 클릭"""
+    import queue
+
+    from benchmarks.live import Session
+
+    idle = queue.Queue()
+    for _ in range(sessions):
+        idle.put([Session(server), 0])   # 세션, 마지막으로 누른 줄
+
+    def clicks(*labels):
+        def task():
+            entry = idle.get()
+            try:
+                entry[1] = entry[1] % 5 + 1
+                for label in labels:
+                    entry[0].click(f'{label}_button_{entry[1]}')
+            finally:
+                idle.put(entry)
+        return task
+
+    def close():
+        while not idle.empty():
+            idle.get()[0].close()
+
+    # check: MIC는 현재 단어가 있어야 채점하므로 PLAY 다음에 누름
+    return clicks('play'), clicks('play', 'mic'), close
+
+
+def report(name, tasks, args):
+    play, check = tasks
+    for action, task in [('play', play), ('check', check)]:
+        for concurrency in args.concurrency:
+            throughput, latencies = run(task, args.requests, concurrency)
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2]
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(f"{name:10s} {action:6s} {concurrency:4d} {throughput:8.1f}/s "
+                  f"{p50 * 1000:6.1f}ms {p95 * 1000:6.1f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP API와 Streamlit 처리량 비교")
+    parser.add_argument('--requests', type=int, default=100, help="경로/동작마다 반복 횟수")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--tts-latency', type=float, default=0.0)
+    parser.add_argument('--asr-latency', type=float, default=0.0)
+    parser.add_argument('--skip-streamlit', action='store_true')
+    args = parser.parse_args(argv)
+
+    from benchmarks.load import configure
+
+    configure(tempfile.mkdtemp(prefix='wordfriends-api-'))
+
+    from benchmarks import fakes
+    from words import all_words
+
+    recording = fakes.fake_wav()
+    fakes.install(tts=fakes.FakeService(args.tts_latency), asr=fakes.FakeService(args.asr_latency),
+                  transcripts=all_words(), recording=recording)
+
+    print(f"{'경로':10s} {'동작':6s} {'동시':>4s} {'처리량':>10s} {'p50':>8s} {'p95':>8s}")
+    report('api', api_tasks(recording), args)
+    if not args.skip_streamlit:
+        from benchmarks.live import Server
+
+        with Server('benchmarks/fake_app.py', ['--tts-latency', str(args.tts_latency),
+                                               '--asr-latency', str(args.asr_latency)]) as server:
+            # 동시 요청 수만큼 세션을 미리 열어 첫 화면 비용을 측정에서 뺌
+            play, check, close = streamlit_tasks(server, max(args.concurrency))
+            try:
+                report('streamlit', (play, check), args)
+            finally:
+                close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""음성 인식 백엔드 지연 시간/정확도 비교
+
+녹음 세트 디렉터리의 WAV 파일 이름이 정답 단어여야 한다 (예: apple.wav, apple_2.wav).
+
+사용법:
+    python benchmarks/asr_backends.py DATASET_DIR --backends google vosk
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import speech_recognition as sr  # noqa: E402
+
+import config  # noqa: E402
+from asr import create_backend  # noqa: E402
+from words import all_words  # noqa: E402
+
+
+def load_dataset(directory):
+    """(정답 단어, sr.AudioData) 목록"""
+    samples = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.wav'):
+            continue
+        label = os.path.splitext(name)[0].split('_')[0].lower()
+        with sr.AudioFile(os.path.join(directory, name)) as source:
+            samples.append((label, sr.Recognizer().record(source)))
+    return samples
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def run(backend, samples, grammar=None):
+    """백엔드 하나로 전체 세트 인식, 결과 dict 반환"""
+    latencies = []
+    correct = 0
+    for label, audio_data in samples:
+        start = time.perf_counter()
+        try:
+            text = backend.recognize(audio_data, grammar=grammar).lower()
+        except (sr.UnknownValueError, sr.RequestError):
+            text = ''
+        latencies.append(time.perf_counter() - start)
+        correct += text.strip() == label
+    return {
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'accuracy': correct / len(samples),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="음성 인식 백엔드 비교")
+    parser.add_argument('dataset', help="녹음 세트 디렉터리")
+    parser.add_argument('--backends', nargs='+', default=['google', 'vosk'])
+    args = parser.parse_args(argv)
+
+    samples = load_dataset(args.dataset)
+    print(f"샘플 {len(samples)}개")
+    for name in args.backends:
+        backend = create_backend(name, timeout=config.ASR_TIMEOUT_SECONDS,
+                                 vosk_model_path=config.VOSK_MODEL_PATH)
+        result = run(backend, samples, grammar=all_words())
+        print(f"{name:8s} p50 {result['p50_ms']:8.1f}ms  p95 {result['p95_ms']:8.1f}ms  "
+              f"정확도 {result['accuracy']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""녹음 변환(디코딩 + 모노 + 16kHz) 처리량 측정
+
+mic_recorder가 만드는 형식을 흉내 낸 WAV를 만들어 audio_io.to_pcm16k 처리 속도를 잰다.
+PyAV가 설치되어 있으면 webm(opus)도 함께 측정한다.
+
+사용법:
+    python benchmarks/audio_io.py [--seconds 3] [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import time
+import wave
+from io import BytesIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np  # noqa: E402
+
+import audio_io  # noqa: E402
+
+# (이름, 샘플링 레이트, 채널 수)
+FORMATS = [
+    ('wav 44.1k stereo', 44100, 2),
+    ('wav 48k mono', 48000, 1),
+    ('wav 16k mono', 16000, 1),
+]
+
+
+def make_wav(rate, channels, seconds):
+    t = np.arange(int(rate * seconds)) / rate
+    tone = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+    frames = np.repeat(tone[:, None], channels, axis=1)
+    fp = BytesIO()
+    with wave.open(fp, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(frames.tobytes())
+    return fp.getvalue()
+
+
+def make_webm(wav_bytes):
+    """WAV → webm(opus) (PyAV 필요)"""
+    import av
+
+    out = BytesIO()
+    with av.open(BytesIO(wav_bytes)) as src, av.open(out, 'w', format='webm') as dst:
+        stream = dst.add_stream('libopus', rate=48000)
+        for frame in src.decode(audio=0):
+            for packet in stream.encode(frame):
+                dst.mux(packet)
+        for packet in stream.encode(None):
+            dst.mux(packet)
+    return out.getvalue()
+
+
+def measure(name, data, seconds, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pcm = audio_io.to_pcm16k(data)
+    elapsed = time.perf_counter() - start
+    print(f"{name:18s} {repeat / elapsed:9.1f} 클립/초  실시간 대비 {seconds * repeat / elapsed:8.0f}배  "
+          f"입력 {len(data) / 1024:7.1f}KB → 출력 {len(pcm) / 1024:6.1f}KB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="녹음 변환 처리량 측정")
+    parser.add_argument('--seconds', type=float, default=3)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    for name, rate, channels in FORMATS:
+        measure(name, make_wav(rate, channels, args.seconds), args.seconds, args.repeat)
+    try:
+        webm = make_webm(make_wav(48000, 1, args.seconds))
+    except ImportError:
+        print("PyAV가 없어 webm 측정을 건너뜁니다.")
+    else:
+        measure('webm opus 48k', webm, args.seconds, args.repeat // 10 or 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""채점 방식별 시도당 지연 시간 비교
+
+- similarity: 자유 받아쓰기 + 문자열 유사도 (현재 방식)
+- constrained: 목표 단어 + 헷갈리기 쉬운 단어만 후보로 채점
+
+사용법:
+    python benchmarks/constrained_scoring.py DATASET_DIR [--backend vosk]
+"""
+import argparse
+import difflib
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import speech_recognition as sr  # noqa: E402
+
+import config  # noqa: E402
+from asr import create_backend  # noqa: E402
+from asr_backends import load_dataset, percentile  # noqa: E402
+from matcher import PASS_THRESHOLD  # noqa: E402
+from scoring import best_candidate, candidates_for  # noqa: E402
+from words import all_words  # noqa: E402
+
+
+def attempt_similarity(backend, audio_data, target, vocabulary):
+    try:
+        text = backend.recognize(audio_data).lower()
+    except (sr.UnknownValueError, sr.RequestError):
+        return False
+    return difflib.SequenceMatcher(None, target, text).ratio() > PASS_THRESHOLD
+
+
+def attempt_constrained(backend, audio_data, target, vocabulary):
+    scores = backend.score(audio_data, candidates_for(target, vocabulary))
+    return best_candidate(scores) == target
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채점 방식별 지연 시간 비교")
+    parser.add_argument('dataset', help="녹음 세트 디렉터리 (파일 이름 = 정답 단어)")
+    parser.add_argument('--backend', default='vosk')
+    args = parser.parse_args(argv)
+
+    backend = create_backend(args.backend, timeout=config.ASR_TIMEOUT_SECONDS,
+                             vosk_model_path=config.VOSK_MODEL_PATH)
+    samples = load_dataset(args.dataset)
+    vocabulary = all_words()
+    for name, attempt in [('similarity', attempt_similarity), ('constrained', attempt_constrained)]:
+        latencies = []
+        correct = 0
+        for label, audio_data in samples:
+            start = time.perf_counter()
+            correct += attempt(backend, audio_data, label, vocabulary)
+            latencies.append(time.perf_counter() - start)
+        print(f"{name:12s} p50 {statistics.median(latencies) * 1000:8.1f}ms  "
+              f"p95 {percentile(latencies, 0.95) * 1000:8.1f}ms  정답 처리 {correct / len(samples):.1%}")
+
+
+if __name__ == "__main__":
+    main()
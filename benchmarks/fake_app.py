@@ -0,0 +1,57 @@
+"""외부 서비스를 가짜 백엔드(benchmarks/fakes.py)로 바꾼 뒤 app.py를 실행하는 Streamlit 스크립트
+
+    streamlit run benchmarks/fake_app.py -- --tts-latency 0.2 --asr-latency 0.6 --stats stats.json
+
+서버 프로세스에서 처음 실행될 때 한 번만 가짜 백엔드를 설치하고, --stats가 주어지면 서버가
+끝날 때 가짜 백엔드 호출 통계와 단계별 측정값(metrics.py)을 JSON으로 남긴다.
+캐시/DB 경로는 서버를 띄우기 전에 환경 변수로 정한다 (benchmarks/load.py의 configure).
+"""
+import argparse
+import atexit
+import json
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks import fakes  # noqa: E402
+
+
+def setup(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tts-latency', type=float, default=0.0)
+    parser.add_argument('--translate-latency', type=float, default=0.0)
+    parser.add_argument('--asr-latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--stats', default=None, help="서버가 끝날 때 통계를 쓸 JSON 경로")
+    args = parser.parse_args(argv)
+
+    import metrics
+    from words import all_words
+
+    services = fakes.install(
+        tts=fakes.FakeService(args.tts_latency, args.jitter, args.error_rate, seed=1),
+        translate=fakes.FakeService(args.translate_latency, args.jitter, args.error_rate, seed=2),
+        asr=fakes.FakeService(args.asr_latency, args.jitter, args.error_rate, seed=3),
+        transcripts=all_words(),
+    )
+
+    if args.stats:
+        def dump():
+            with open(args.stats, 'w', encoding='utf-8') as f:
+                json.dump({'services': {name: service.stats() for name, service in services.items()},
+                           'metrics': metrics.format_summary()}, f, ensure_ascii=False)
+        atexit.register(dump)
+
+
+# Streamlit은 다시 실행할 때마다(세션마다 동시에) 이 스크립트를 처음부터 실행하므로
+# app을 불러오기 전 한 번만 설치
+with fakes.install_lock:
+    if 'app' not in sys.modules:
+        setup(sys.argv[1:])
+    import app  # noqa: E402
+
+app.main()
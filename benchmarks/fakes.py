@@ -0,0 +1,180 @@
+"""외부 서비스(gTTS, googletrans, Google 음성 인식)를 대신하는 로컬 가짜 백엔드
+
+네트워크 없이 앱 전체 흐름을 반복 실행하기 위해 지연 시간과 오류를 원하는 대로 넣는다.
+install()은 반드시 app.py를 불러오기(AppTest 실행) 전에 호출해야 한다.
+
+    fakes.install(tts=FakeService(latency=0.2, error_rate=0.05))
+"""
+import math
+import random
+import struct
+import sys
+import threading
+import time
+import types
+
+
+# 여러 세션이 동시에 처음 실행될 때 한 번만 설치하도록 (benchmarks/fake_app.py)
+install_lock = threading.Lock()
+
+
+class InjectedError(Exception):
+    """가짜 백엔드가 일부러 낸 오류"""
+
+
+class TooManyRequests(Exception):
+    """HTTP 429 응답을 흉내 낸 오류"""
+
+    def __init__(self, message="429 (Too Many Requests)"):
+        super().__init__(message)
+
+
+class FakeService:
+    """호출마다 latency(±jitter)초 기다리고 error_rate 확률로 실패하는 가짜 서비스
+
+    error가 주어지면 그 예외를 만드는 함수로 실패를 알린다 (예: sr.RequestError).
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error=None, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error = error or InjectedError
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(['calls', 'errors', 'concurrent_max'], 0)
+        self._active = 0
+
+    def call(self):
+        """지연 후 오류 여부 결정 (오류면 예외 발생)"""
+        with self._lock:
+            self.counters['calls'] += 1
+            self._active += 1
+            self.counters['concurrent_max'] = max(self.counters['concurrent_max'], self._active)
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            failed = self._random.random() < self.error_rate
+        try:
+            time.sleep(delay)
+            if failed:
+                with self._lock:
+                    self.counters['errors'] += 1
+                raise self.error("injected failure")
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+
+
+def fake_mp3(text, size=6 * 1024):
+    """단어별로 고정된 mp3 크기의 bytes (실제 재생은 되지 않음)"""
+    seed = text.encode('utf-8')
+    return (b'ID3' + seed * (size // max(1, len(seed)) + 1))[:size]
+
+
+def split_text(text, max_chars=100):
+    """gTTS처럼 긴 문장을 max_chars 이하 조각으로 나눔 (조각마다 요청 한 번)"""
+    parts, current = [], ''
+    for token in text.split():
+        if current and len(current) + 1 + len(token) > max_chars:
+            parts.append(current)
+            current = token
+        else:
+            current = f'{current} {token}' if current else token
+    return parts + [current] if current else parts
+
+
+def fake_wav(seconds=1.0, rate=48000, channels=2, freq=220.0):
+    """mic_recorder가 돌려주는 것과 같은 44바이트 헤더 16bit PCM WAV"""
+    n = int(seconds * rate)
+    frame = bytearray()
+    for i in range(n):
+        sample = struct.pack('<h', int(8000 * math.sin(2 * math.pi * freq * i / rate)))
+        frame += sample * channels
+    header = struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 36 + len(frame), b'WAVE', b'fmt ', 16, 1, channels,
+                         rate, rate * channels * 2, channels * 2, 16, b'data', len(frame))
+    return header + bytes(frame)
+
+
+def install_tts(tts):
+    """gtts 모듈을 가짜로 교체 (조각마다 tts.call() 한 번)"""
+    gtts = types.ModuleType('gtts')
+
+    class gTTS:
+        def __init__(self, text, lang='en', tld='com', **kwargs):
+            self.text = text
+
+        def stream(self):
+            for part in split_text(self.text):
+                tts.call()
+                yield fake_mp3(part)
+
+        def write_to_fp(self, fp):
+            for chunk in self.stream():
+                fp.write(chunk)
+
+    gtts.gTTS = gTTS
+    sys.modules['gtts'] = gtts
+
+
+def install_translate(translate):
+    """googletrans 모듈을 가짜로 교체"""
+    googletrans = types.ModuleType('googletrans')
+
+    class Translated:
+        def __init__(self, text):
+            self.text = text
+
+    class Translator:
+        def __init__(self, timeout=None, **kwargs):
+            pass
+
+        def translate(self, text, dest='ko', **kwargs):
+            translate.call()
+            return Translated('\n'.join(f'[{dest}] {line}' for line in text.split('\n')))
+
+    googletrans.Translator = Translator
+    sys.modules['googletrans'] = googletrans
+
+
+def install_asr(asr, transcripts, recording):
+    """recognize_google과 mic_recorder를 가짜로 교체 (AudioData 등 나머지는 실제 speech_recognition 사용)"""
+    import speech_recognition as sr
+
+    if asr.error is InjectedError:
+        asr.error = sr.RequestError
+    picker = random.Random(0)
+    picker_lock = threading.Lock()
+
+    def recognize_google(self, audio_data, language='en-US', **kwargs):
+        asr.call()
+        with picker_lock:
+            return picker.choice(transcripts)
+
+    sr.Recognizer.recognize_google = recognize_google
+
+    # streamlit_mic_recorder: 누르면 바로 녹음이 끝난 것처럼 WAV를 돌려줌
+    mic = types.ModuleType('streamlit_mic_recorder')
+
+    def mic_recorder(**kwargs):
+        return {'bytes': recording, 'sample_rate': 48000, 'sample_width': 2, 'id': 1}
+
+    mic.mic_recorder = mic_recorder
+    sys.modules['streamlit_mic_recorder'] = mic
+
+
+def install(tts=None, translate=None, asr=None, transcripts=None, recording=None):
+    """gtts/googletrans 모듈과 recognize_google, mic_recorder를 모두 가짜로 교체
+
+    transcripts: 인식 결과로 돌려줄 단어 목록 (무작위 선택)
+    recording: 가짜 마이크가 돌려줄 WAV bytes
+    """
+    tts = tts or FakeService()
+    translate = translate or FakeService()
+    asr = asr or FakeService()
+    install_tts(tts)
+    install_translate(translate)
+    install_asr(asr, list(transcripts or ['apple']), recording or fake_wav())
+    return {'tts': tts, 'translate': translate, 'asr': asr}
@@ -0,0 +1,78 @@
+"""일괄 채점(grade.py) 처리량 측정
+
+가짜 녹음(benchmarks/fakes.py)으로 zip 묶음을 만들고 작업 프로세스 수별로 채점한다.
+음성 인식은 --asr-latency초 걸리는 가짜 채점기로 대신하므로 디코딩/정규화/프로세스 간
+전달 비용과 병렬 처리 효과를 본다. --real을 주면 설정된 채점 방식(config.SCORING_MODE)을 쓴다.
+
+사용법:
+    python benchmarks/grading.py --clips 2000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+import zipfile
+from functools import partial
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import grade  # noqa: E402
+from benchmarks.fakes import fake_wav  # noqa: E402
+from words import all_words  # noqa: E402
+
+
+class FakeGrader:
+    """latency초 쉬고 정답을 그대로 돌려주는 채점기"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+
+    def grade(self, samples, word):
+        time.sleep(self.latency)
+        return word, 1.0
+
+
+def make_archive(path, clips):
+    """단어_번호.wav 녹음 clips개를 담은 zip (1초, 48kHz 스테레오)"""
+    vocabulary = all_words()
+    recordings = [fake_wav(seconds=1.0, freq=150 + 50 * n) for n in range(4)]
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for n in range(clips):
+            archive.writestr(f'class1/{vocabulary[n % len(vocabulary)]}_{n}.wav', recordings[n % len(recordings)])
+    return os.path.getsize(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="일괄 채점 처리량 측정")
+    parser.add_argument('--clips', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--asr-latency', type=float, default=0.05, help="가짜 채점기 녹음당 시간(초)")
+    parser.add_argument('--real', action='store_true', help="설정된 채점 방식으로 채점")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='wordfriends-grade-')
+    archive = os.path.join(workdir, 'recordings.zip')
+    size = make_archive(archive, args.clips)
+    print(f"묶음: 녹음 {args.clips}개, {size / 1024 / 1024:.1f}MB")
+
+    factory = grade.Grader if args.real else partial(FakeGrader, args.asr_latency)
+    for workers in args.workers:
+        report = os.path.join(workdir, f'report-{workers}.csv')
+        start = time.perf_counter()
+        done, failed = grade.run(archive, report, workers=workers, factory=factory)
+        elapsed = time.perf_counter() - start
+        children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        print(f"작업 {workers}개: {done}개 {elapsed:.1f}s → {done / elapsed:.1f}개/s, 오류 {failed}개, "
+              f"작업 프로세스 최대 RSS {children / 1024:.0f}MB")
+
+    # 이어서 실행: 이미 채점한 파일은 건너뜀
+    start = time.perf_counter()
+    done, _ = grade.run(archive, report, workers=args.workers[-1], factory=factory)
+    print(f"다시 실행: 새로 채점 {done}개, {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""화면 한 번 그릴 때 이미지 처리 시간 비교
+
+- before: 매번 PNG 파일을 읽고 디코딩/인코딩 (경로를 st.image에 넘기던 방식)
+- after: 프로세스당 한 번 읽은 bytes 재사용 (get_image)
+
+after의 첫 실행(미리 만든 파일 읽기, 없으면 즉석 변환)은 프로세스당 한 번뿐이므로
+화면당 시간과 따로 출력한다.
+
+사용법:
+    python benchmarks/images.py [--reruns 50]
+"""
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PIL import Image  # noqa: E402
+
+import assets  # noqa: E402
+import config  # noqa: E402
+
+TOPICS = ['School', 'Family', 'Animals', 'Weather', 'Food']
+
+# 한 번 그릴 때 사용하는 (이미지, 용도) 목록: 주제 5 + 캐릭터 2 + 줄마다 Boy 5
+USES = ([(f'{topic}.png', 'topic') for topic in TOPICS]
+        + [('boy.png', 'character'), ('girl.png', 'character')]
+        + [('boy.png', 'row')] * 5)
+
+
+def rerun_before():
+    total = 0
+    for name, _ in USES:
+        with Image.open(os.path.join(config.IMAGE_DIR, name)) as image:
+            fp = BytesIO()
+            image.save(fp, format='PNG')
+            total += len(fp.getvalue())
+    return total
+
+
+def make_rerun_after():
+    cache = {}
+
+    def rerun_after():
+        total = 0
+        for name, use in USES:
+            key = (name, use)
+            if key not in cache:
+                cache[key] = assets.load(os.path.join(config.IMAGE_DIR, name), assets.WIDTHS[use])
+            total += len(cache[key])
+        return total
+    return rerun_after
+
+
+def measure(name, fn, reruns):
+    start = time.perf_counter()
+    for _ in range(reruns):
+        sent = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{name:7s} {elapsed / reruns * 1000:8.2f}ms/rerun  전송 {sent / 1024:8.1f}KB/rerun")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="이미지 처리 시간 비교")
+    parser.add_argument('--reruns', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    measure('before', rerun_before, args.reruns)
+    rerun_after = make_rerun_after()
+    start = time.perf_counter()
+    rerun_after()
+    print(f"after 첫 실행 (프로세스당 한 번): {(time.perf_counter() - start) * 1000:.1f}ms")
+    measure('after', rerun_after, args.reruns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""실제 Streamlit 서버에 브라우저 대신 웹소켓으로 접속하는 세션 (benchmarks 공용)
+
+AppTest는 실행할 때마다 전역 Runtime을 바꿔 끼우므로 한 프로세스에서 여러 세션을 동시에
+돌릴 수 없고, 클릭마다 스크립트 전체를 다시 실행해 fragment 범위 실행도 보여 주지 못한다.
+여기서는 `streamlit run`으로 띄운 서버에 세션마다 웹소켓을 열고 브라우저와 같은 실행 요청을
+보낸다 (PLAY처럼 fragment 안의 버튼은 그 fragment만 다시 실행).
+
+    with Server('benchmarks/fake_app.py', ['--tts-latency', '0.2']) as server:
+        session = Session(server)
+        session.click('play_button_3')
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# deltas: 서버가 보낸 화면 변경 목록, size: 받은 바이트, seconds: 요청부터 실행 완료까지
+Rerun = namedtuple('Rerun', ['deltas', 'size', 'seconds'])
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class Server:
+    """`streamlit run script -- args` 서버 (헤드리스, 빈 포트)"""
+
+    def __init__(self, script='app.py', args=(), timeout=60):
+        self.script = os.path.join(ROOT, script)
+        self.args = list(args)
+        self.timeout = timeout
+        self.port = free_port()
+        self._process = None
+
+    def __enter__(self):
+        command = [sys.executable, '-m', 'streamlit', 'run', self.script,
+                   '--server.headless', 'true', '--server.port', str(self.port),
+                   '--browser.gatherUsageStats', 'false']
+        if self.args:
+            command += ['--'] + self.args
+        self._process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(('127.0.0.1', self.port), 0.2).close()
+                return self
+            except OSError:
+                if self._process.poll() is not None:
+                    break
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"streamlit 서버를 시작하지 못했습니다: {self.script}")
+
+    def __exit__(self, *exc):
+        if self._process is not None:
+            self._process.terminate()   # SIGTERM: atexit 처리가 실행되도록 정상 종료
+            try:
+                self._process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+    @property
+    def url(self):
+        return f'ws://127.0.0.1:{self.port}/_stcore/stream'
+
+
+class Session:
+    """브라우저 탭 하나 (생성할 때 첫 실행까지 마침)"""
+
+    def __init__(self, server, timeout=60):
+        from websockets.sync.client import connect
+
+        self.timeout = timeout
+        self._ws = connect(server.url, subprotocols=['streamlit'], max_size=None)
+        self.buttons = {}   # key(없으면 글자) -> (위젯 id, fragment id)
+        self.first = self.rerun()
+
+    def rerun(self, widgets=(), fragment_id=''):
+        """스크립트(fragment_id가 있으면 그 fragment만) 실행 요청 → Rerun"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = BackMsg()
+        message.rerun_script.widget_states.widgets.extend(widgets)
+        if fragment_id:
+            message.rerun_script.fragment_id = fragment_id
+        start = time.perf_counter()
+        self._ws.send(message.SerializeToString())
+        deltas, size = [], 0
+        while True:
+            raw = self._ws.recv(timeout=self.timeout)
+            size += len(raw)
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof('type')
+            if kind == 'delta':
+                deltas.append(forward.delta)
+            elif kind == 'script_finished':
+                self._remember_buttons(deltas)
+                return Rerun(deltas, size, time.perf_counter() - start)
+
+    def _remember_buttons(self, deltas):
+        for delta in deltas:
+            if delta.WhichOneof('type') == 'new_element' and delta.new_element.WhichOneof('type') == 'button':
+                button = delta.new_element.button
+                key = button.id.rsplit('-', 1)[-1]
+                self.buttons[button.label if key == 'None' else key] = (button.id, delta.fragment_id)
+
+    def click(self, name, scoped=True):
+        """버튼 클릭 (scoped: 브라우저처럼 fragment 안의 버튼은 그 fragment만 다시 실행)"""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        widget_id, fragment_id = self.buttons[name]
+        return self.rerun([WidgetState(id=widget_id, trigger_value=True)], fragment_id if scoped else '')
+
+    def close(self):
+        self._ws.close()
@@ -0,0 +1,149 @@
+"""동시 세션 부하 측정 (실제 Streamlit 서버 + 가짜 gTTS/googletrans/Google 음성 인식)
+
+`streamlit run benchmarks/fake_app.py` 서버를 띄우고 세션마다 웹소켓으로 앱을 열어
+주제 선택 → 줄마다 PLAY → MIC를 차례로 누른다 (benchmarks/live.py, 브라우저처럼 줄 안의
+버튼은 그 줄 fragment만 다시 실행). AppTest는 전역 Runtime을 바꿔 끼우므로 세션을 동시에
+돌릴 수 없어 쓰지 않는다. 외부 서비스는 benchmarks/fakes.py의 가짜 백엔드로 바꾸고, 지연
+시간과 오류율을 옵션으로 정한다. 캐시/DB는 임시 디렉터리를 쓰므로 ./cache를 건드리지 않는다.
+
+결과: 동작별 처리량과 p50/p95/p99, 서버 프로세스의 세션당 CPU 시간과 최대 메모리,
+단계별 측정값(metrics.py).
+
+가짜 mic_recorder는 누르자마자 녹음이 끝난 WAV를 돌려주므로 'mic' 시간은 녹음 변환 → 인식 →
+채점 → 기록 구간만이다. 실제 흐름(컴포넌트가 뜨고, 녹음하고, 녹음이 끝나 다시 실행되는 것)은
+포함하지 않으므로 끝에서 끝까지의 지연 시간으로 보면 안 된다.
+
+사용법:
+    python benchmarks/load.py --sessions 50 --concurrency 10
+    python benchmarks/load.py --tts-latency 0.3 --asr-latency 0.8 --error-rate 0.05 --no-gloss-bundle
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # 앱이 ./image, ./data 상대 경로를 사용
+
+
+def configure(workdir, gloss_bundle=True):
+    """캐시/DB 경로를 임시 디렉터리로 (config를 불러오기 전에 호출)"""
+    os.environ['WORDFRIENDS_AUDIO_CACHE_DIR'] = os.path.join(workdir, 'audio')
+    os.environ['WORDFRIENDS_AUDIO_BUNDLE_DIR'] = os.path.join(workdir, 'bundle')
+    os.environ['WORDFRIENDS_GLOSS_STORE_PATH'] = os.path.join(workdir, 'glosses_ko.json')
+    os.environ['WORDFRIENDS_DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'progress.db')}"
+    os.environ.setdefault('WORDFRIENDS_CAPTURE_MODE', 'recorder')
+    if not gloss_bundle:
+        os.environ['WORDFRIENDS_GLOSS_BUNDLE_PATH'] = os.path.join(workdir, 'no_bundle.json')
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def failed(rerun):
+    """화면에 예외가 그려졌는지"""
+    return any(delta.WhichOneof('type') == 'new_element' and delta.new_element.WhichOneof('type') == 'exception'
+               for delta in rerun.deltas)
+
+
+def run_session(server, topic, rows, timeout):
+    """세션 하나 실행 → [(동작, 걸린 시간, 오류 여부)]"""
+    from benchmarks.live import Session
+
+    start = time.perf_counter()
+    try:
+        session = Session(server, timeout=timeout)
+    except Exception:
+        return [('load', time.perf_counter() - start, True)]
+    results = [('load', time.perf_counter() - start, failed(session.first))]
+
+    def act(name, run):
+        start = time.perf_counter()
+        try:
+            error = failed(run())
+        except Exception:
+            error = True
+        results.append((name, time.perf_counter() - start, error))
+
+    try:
+        act('topic', lambda: session.click(topic))
+        for i in rows:
+            act('play', lambda: session.click(f'play_button_{i}'))
+            act('mic', lambda: session.click(f'mic_button_{i}'))
+    finally:
+        session.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="동시 세션 부하 측정")
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=5, help="동시에 진행하는 세션 수")
+    parser.add_argument('--rows', type=int, default=5, help="세션마다 PLAY/MIC를 누를 줄 수")
+    parser.add_argument('--topic', default='Animals')
+    parser.add_argument('--tts-latency', type=float, default=0.2)
+    parser.add_argument('--translate-latency', type=float, default=0.3)
+    parser.add_argument('--asr-latency', type=float, default=0.6)
+    parser.add_argument('--jitter', type=float, default=0.1, help="지연 시간 ± 범위(초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="가짜 백엔드 호출 실패 확률")
+    parser.add_argument('--no-gloss-bundle', action='store_true', help="기본 뜻 없이 번역기로만 조회")
+    parser.add_argument('--timeout', type=float, default=60, help="동작 하나의 최대 시간(초)")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='wordfriends-load-')
+    configure(workdir, gloss_bundle=not args.no_gloss_bundle)
+    stats_path = os.path.join(workdir, 'stats.json')
+
+    from benchmarks.live import Server
+
+    fake_args = ['--tts-latency', args.tts_latency, '--translate-latency', args.translate_latency,
+                 '--asr-latency', args.asr_latency, '--jitter', args.jitter, '--error-rate', args.error_rate,
+                 '--stats', stats_path]
+    rows = range(1, args.rows + 1)
+    with Server('benchmarks/fake_app.py', [str(arg) for arg in fake_args]) as server:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = [executor.submit(run_session, server, args.topic, rows, args.timeout) for _ in range(args.sessions)]
+            sessions = [future.result() for future in futures]
+        wall = time.perf_counter() - start
+    # 서버가 끝난 뒤의 자식 프로세스 사용량 (서버 시작/첫 실행 비용 포함)
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = usage.ru_utime + usage.ru_stime
+
+    by_action = defaultdict(list)
+    errors = defaultdict(int)
+    for results in sessions:
+        for name, elapsed, error in results:
+            by_action[name].append(elapsed)
+            errors[name] += error
+
+    total = sum(len(values) for values in by_action.values())
+    print(f"세션 {args.sessions}개 (동시 {args.concurrency}), 동작 {total}개, {wall:.1f}s → {total / wall:.1f} 동작/s, "
+          f"{args.sessions / wall:.2f} 세션/s")
+    print(f"{'동작':6s} {'횟수':>5s} {'오류':>4s} {'p50':>8s} {'p95':>8s} {'p99':>8s}")
+    for name in ['load', 'topic', 'play', 'mic']:
+        values = by_action[name]
+        if values:
+            print(f"{name:6s} {len(values):5d} {errors[name]:4d} "
+                  + ' '.join(f"{percentile(values, p) * 1000:6.0f}ms" for p in (0.5, 0.95, 0.99)))
+    print(f"서버 CPU {cpu:.1f}s (세션당 {cpu / args.sessions * 1000:.0f}ms), 최대 RSS {usage.ru_maxrss / 1024:.0f}MB")
+    try:
+        with open(stats_path, encoding='utf-8') as f:
+            stats = json.load(f)
+        print("가짜 백엔드: " + ', '.join(f"{name} {values}" for name, values in stats['services'].items()))
+        print(f"단계별: {stats['metrics']}")
+    except FileNotFoundError:
+        print("서버 통계를 받지 못했습니다 (서버가 정상 종료되지 않음).")
+    print("mic: 가짜 마이크가 녹음을 바로 돌려주므로 녹음/컴포넌트 왕복 시간은 빠짐 (끝에서 끝까지 지연 시간 아님)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""유사도 계산 처리량 비교: difflib (기존) vs matcher.similarity
+
+사용법:
+    python benchmarks/matcher.py [--pairs 200000]
+"""
+import argparse
+import difflib
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import matcher  # noqa: E402
+from words import all_words  # noqa: E402
+
+
+def mutate(word, rng):
+    """오타/잡음이 섞인 받아쓰기 결과 흉내"""
+    chars = list(word)
+    for _ in range(rng.randint(0, 2)):
+        pos = rng.randrange(len(chars))
+        op = rng.choice('sdi')
+        if op == 's':
+            chars[pos] = rng.choice(string.ascii_lowercase)
+        elif op == 'd' and len(chars) > 1:
+            del chars[pos]
+        else:
+            chars.insert(pos, rng.choice(string.ascii_lowercase))
+    text = ''.join(chars)
+    if rng.random() < 0.3:
+        text = text.capitalize() + '.'
+    if rng.random() < 0.2:
+        text = f"i said {text}"
+    return text
+
+
+def make_pairs(n, seed=0):
+    rng = random.Random(seed)
+    vocabulary = all_words()
+    return [(target, mutate(target, rng)) for target in (rng.choice(vocabulary) for _ in range(n))]
+
+
+def measure(name, fn, pairs):
+    start = time.perf_counter()
+    for target, transcript in pairs:
+        fn(target, transcript)
+    elapsed = time.perf_counter() - start
+    print(f"{name:10s} {len(pairs) / elapsed:12,.0f} 쌍/초  ({elapsed:.2f}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="유사도 계산 처리량 비교")
+    parser.add_argument('--pairs', type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    pairs = make_pairs(args.pairs)
+    print(f"백엔드: {'rapidfuzz' if matcher.fuzz is not None else 'difflib (RapidFuzz 없음)'}")
+    measure('difflib', lambda a, b: difflib.SequenceMatcher(None, a, b).ratio(), pairs)
+    measure('matcher', matcher.similarity, pairs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""외부 호출 계층(outbound.py) 동작 확인: 요청 합치기, 호출 제한, 회로 차단
+
+가짜 서비스(benchmarks/fakes.py)에 지연 시간과 429 오류를 넣고 다음을 측정한다.
+  1. 한 반(--clients명)이 같은 단어를 동시에 요청할 때 실제 호출 수와 걸린 시간
+  2. 서비스가 429만 돌려줄 때 회로 차단 유무에 따른 호출당 지연 시간
+  3. 번역이 막혔을 때 만료된 뜻으로 대신 응답하는지 (GlossStore)
+  4. reset 시간이 지난 뒤 시험 호출로 회복하는지
+
+사용법:
+    python benchmarks/outbound.py [--clients 30] [--latency 0.3]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from benchmarks.fakes import FakeService, TooManyRequests  # noqa: E402
+from outbound import CircuitOpen, OutboundBackend  # noqa: E402
+
+
+def concurrent_calls(backend, service, clients, key):
+    """clients개 스레드가 동시에 같은 호출 → (실제 호출 수, 걸린 시간)"""
+    before = service.stats()['calls']
+    barrier = threading.Barrier(clients)
+
+    def client():
+        barrier.wait()
+        backend.call(key, service.call)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return service.stats()['calls'] - before, time.perf_counter() - start
+
+
+def failing_calls(backend, service, count):
+    """순서대로 count번 호출 → 호출당 지연 시간 목록과 결과별 횟수"""
+    latencies = []
+    outcomes = {'429': 0, 'circuit_open': 0}
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            backend.call(None, service.call)
+        except TooManyRequests:
+            outcomes['429'] += 1
+        except CircuitOpen:
+            outcomes['circuit_open'] += 1
+        latencies.append(time.perf_counter() - start)
+    return latencies, outcomes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="외부 호출 계층 동작 확인")
+    parser.add_argument('--clients', type=int, default=30)
+    parser.add_argument('--latency', type=float, default=0.3, help="가짜 서비스 응답 시간(초)")
+    parser.add_argument('--calls', type=int, default=40, help="429 구간 호출 수")
+    args = parser.parse_args(argv)
+
+    # 1. 같은 요청 합치기
+    service = FakeService(latency=args.latency, jitter=args.latency / 10, seed=1)
+    plain = OutboundBackend('plain', max_concurrency=args.clients)
+    sent, elapsed = concurrent_calls(plain, service, args.clients, key=None)
+    print(f"합치기 없음: 학생 {args.clients}명 → 호출 {sent}번, {elapsed * 1000:.0f}ms")
+    coalesced = OutboundBackend('tts', max_concurrency=args.clients)
+    sent, elapsed = concurrent_calls(coalesced, service, args.clients, key=('apple', 'en', 'com'))
+    print(f"합치기:      학생 {args.clients}명 → 호출 {sent}번, {elapsed * 1000:.0f}ms  {coalesced.stats()}")
+
+    # 동시 호출 제한 + token bucket
+    limited = OutboundBackend('limited', max_concurrency=2, rate=10, burst=5)
+    sent, elapsed = concurrent_calls(limited, FakeService(latency=0.05), args.clients, key=None)
+    print(f"제한 (동시 2, 초당 10, burst 5): 호출 {sent}번, {elapsed:.1f}s, "
+          f"대기 {limited.stats()['throttled_seconds']:.1f}s")
+
+    # 2. 429만 돌려주는 서비스
+    for name, threshold in [('차단 없음', args.calls + 1), ('회로 차단', 5)]:
+        throttled = FakeService(latency=args.latency, error_rate=1.0, error=TooManyRequests, seed=2)
+        backend = OutboundBackend('asr', failure_threshold=threshold, reset_timeout=60)
+        latencies, outcomes = failing_calls(backend, throttled, args.calls)
+        print(f"429 ({name}): 서비스 호출 {throttled.stats()['calls']}번, {outcomes}, "
+              f"p50 {statistics.median(latencies) * 1000:.1f}ms, 합계 {sum(latencies):.1f}s")
+
+    # 3. 만료된 뜻으로 대신 응답
+    import outbound
+    from translation import GlossStore
+
+    outbound._backends['translate'] = OutboundBackend('translate', failure_threshold=3, reset_timeout=60)
+    throttled = FakeService(latency=args.latency, error_rate=1.0, error=TooManyRequests, seed=3)
+
+    class Translator:
+        def translate(self, text, dest='ko'):
+            throttled.call()
+
+    workdir = tempfile.mkdtemp(prefix='wordfriends-outbound-')
+    store = GlossStore(os.path.join(workdir, 'glosses.json'), ttl=0)
+    store._entries['apple'] = {'text': '사과', 'source': 'google', 'ts': 0}   # 이미 만료된 값
+    store._translator = Translator()
+    start = time.perf_counter()
+    results = [store.lookup('apple') for _ in range(10)]
+    print(f"번역 429: 응답 {set(results)}, 10번 {time.perf_counter() - start:.2f}s, "
+          f"서비스 호출 {throttled.stats()['calls']}번, {store.stats()}")
+
+    # 4. 회복
+    backend = OutboundBackend('recover', failure_threshold=2, reset_timeout=0.5)
+    flaky = FakeService(error_rate=1.0, error=TooManyRequests)
+    failing_calls(backend, flaky, 3)
+    flaky.error_rate = 0.0
+    time.sleep(0.6)
+    backend.call(None, flaky.call)
+    print(f"회복: reset 후 시험 호출 성공 → 상태 {backend.breaker.state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""버튼 클릭당 다시 실행되는 화면 구역 측정
+
+기본은 `streamlit run`으로 띄운 실제 서버에 브라우저 대신 웹소켓으로 접속해
+(benchmarks/live.py), PLAY를 fragment 범위로 누를 때(브라우저가 보내는 것과 같이
+fragment_id 포함)와 앱 전체를 다시 실행할 때(fragment가 없을 때와 같음) 서버가 보내는
+화면 변경(delta) 수, 바이트, 걸린 시간을 비교한다. fragment가 적용되면 PLAY 클릭은 그 줄의 delta만 보내야 한다.
+
+--apptest는 Streamlit AppTest로 app.py의 count_render 횟수(main, row_1..row_5)를 본다.
+AppTest는 클릭마다 스크립트 전체를 다시 실행하므로(fragment 범위 실행 없음) 모든 구역이
+늘어나며, fragment 효과를 보여 주지 못한다. 화면 구역이 예상대로 그려지는지 확인하는 용도.
+
+사용법:
+    python benchmarks/reruns.py [--row 3] [--clicks 5]
+    python benchmarks/reruns.py --apptest
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # 앱이 ./image, ./data 상대 경로를 사용
+
+
+def measure_live(row, clicks):
+    from benchmarks.live import Server, Session
+
+    with Server('app.py') as server:
+        session = Session(server)
+        first = session.first
+        print(f"첫 실행: delta {len(first.deltas)}개 {first.size / 1024:.1f}KB {first.seconds * 1000:.0f}ms")
+        _, fragment_id = session.buttons[f'play_button_{row}']
+        if not fragment_id:
+            print("PLAY 버튼이 fragment 안에 있지 않습니다.")
+        results = {'fragment': [], 'full': []}
+        for _ in range(clicks):
+            for scope in results:
+                rerun = session.click(f'play_button_{row}', scoped=scope == 'fragment')
+                outside = sum(delta.fragment_id != fragment_id for delta in rerun.deltas)
+                results[scope].append((len(rerun.deltas), outside, rerun.size, rerun.seconds))
+        session.close()
+
+    for scope, values in results.items():
+        print(f"PLAY (row {row}, {scope:8s}): delta {values[-1][0]}개 (줄 밖 {values[-1][1]}개) "
+              f"{values[-1][2] / 1024:.1f}KB  중앙값 {statistics.median(v[3] for v in values) * 1000:.0f}ms")
+
+
+def measure_apptest(row):
+    from streamlit.testing.v1 import AppTest
+
+    def counts():
+        return dict(at.session_state['render_counts'])
+
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=30)
+    at.run()
+    print(f"첫 실행: {counts()}")
+    print("(AppTest는 클릭마다 스크립트 전체를 다시 실행하므로 fragment 효과는 보이지 않음)")
+    for label in ['play', 'mic']:
+        before = counts()
+        start = time.perf_counter()
+        at.button(key=f'{label}_button_{row}').click().run()
+        elapsed = time.perf_counter() - start
+        after = counts()
+        delta = {name: after[name] - before.get(name, 0) for name in after if after[name] != before.get(name, 0)}
+        print(f"{label.upper():4s} (row {row}): 실행 {delta}  요소 {len(list(at.main))}개  {elapsed * 1000:.0f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="클릭당 다시 실행되는 구역 측정")
+    parser.add_argument('--row', type=int, default=3)
+    parser.add_argument('--clicks', type=int, default=5, help="범위별 클릭 횟수 (실제 서버)")
+    parser.add_argument('--apptest', action='store_true', help="실제 서버 대신 AppTest로 구역별 실행 횟수 확인")
+    args = parser.parse_args(argv)
+
+    if args.apptest:
+        measure_apptest(args.row)
+    else:
+        measure_live(args.row, args.clicks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""앱 시작 비용 점검: app 모듈 import 시간과 메모리(RSS)가 기준을 넘으면 실패
+
+python -X importtime 으로 새 프로세스에서 `import app` 을 측정한다.
+
+사용법:
+    python benchmarks/startup.py [--max-import-ms 1500] [--max-rss-mb 200]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+PROBE = "import resource, app; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+
+
+def measure():
+    """(app import 누적 시간 ms, 최대 RSS MB, 느린 import 목록)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    rss_kb = int(result.stdout.strip().splitlines()[-1])
+
+    app_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        cumulative = int(cumulative)
+        if name.strip() == 'app':
+            app_us = cumulative
+        if not name[1:].startswith(' '):  # 최상위 import만 (하위 import는 들여쓰기됨)
+            modules.append((cumulative, name.strip()))
+    modules.sort(reverse=True)
+
+    rss_mb = rss_kb / 1024 if sys.platform != 'darwin' else rss_kb / 1024 / 1024
+    return app_us / 1000, rss_mb, modules[:10]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="앱 시작 시간/메모리 점검")
+    parser.add_argument('--max-import-ms', type=float, default=1500)
+    parser.add_argument('--max-rss-mb', type=float, default=200)
+    args = parser.parse_args(argv)
+
+    import_ms, rss_mb, slowest = measure()
+    print(f"import app: {import_ms:.0f}ms (기준 {args.max_import_ms:.0f}ms)")
+    print(f"최대 RSS: {rss_mb:.0f}MB (기준 {args.max_rss_mb:.0f}MB)")
+    print("느린 import:")
+    for cumulative, name in slowest:
+        print(f"  {cumulative / 1000:8.1f}ms  {name}")
+
+    failed = import_ms > args.max_import_ms or rss_mb > args.max_rss_mb
+    if failed:
+        print("기준 초과", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
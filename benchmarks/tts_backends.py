@@ -0,0 +1,80 @@
+"""음성 합성 백엔드 지연 시간/처리량 비교 (단어장 전체 × Boy/Girl)
+
+캐시 없이 백엔드의 synthesize()를 직접 호출한다. gTTS는 실제 네트워크를 쓰므로
+--fake-gtts-latency를 주면 가짜 gTTS(benchmarks/fakes.py)로 대신한다.
+
+사용법:
+    python benchmarks/tts_backends.py --backends gtts piper --workers 1 4
+    python benchmarks/tts_backends.py --backends piper --limit 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import config  # noqa: E402
+from tts import create_backend  # noqa: E402
+from words import all_words  # noqa: E402
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def run(backend, jobs, workers):
+    """(단어, 목소리 키) 목록 합성 → 결과 dict"""
+    def synthesize(job):
+        start = time.perf_counter()
+        audio = backend.synthesize(job[0], 'en', job[1])
+        return time.perf_counter() - start, len(audio)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(synthesize, jobs))
+    wall = time.perf_counter() - start
+    latencies = [latency for latency, _ in results]
+    return {
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'per_sec': len(jobs) / wall,
+        'avg_kb': sum(size for _, size in results) / len(results) / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="음성 합성 백엔드 비교")
+    parser.add_argument('--backends', nargs='+', default=['gtts', 'piper'], choices=['gtts', 'piper'])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--limit', type=int, default=None, help="단어 수 제한")
+    parser.add_argument('--output', default=config.PIPER_OUTPUT, choices=['wav', 'opus'], help="piper 출력 형식")
+    parser.add_argument('--fake-gtts-latency', type=float, default=None, help="가짜 gTTS 응답 시간(초)")
+    args = parser.parse_args(argv)
+
+    if args.fake_gtts_latency is not None:
+        from benchmarks.fakes import FakeService, install_tts
+
+        install_tts(FakeService(latency=args.fake_gtts_latency))
+
+    vocabulary = all_words()[:args.limit]
+    for name in args.backends:
+        start = time.perf_counter()
+        backend = create_backend(name, boy_model=config.PIPER_BOY_MODEL,
+                                 girl_model=config.PIPER_GIRL_MODEL, output=args.output)
+        load = time.perf_counter() - start
+        jobs = [(word, backend.voice_key(gender)) for word in vocabulary for gender in ['Boy', 'Girl']]
+        # 첫 호출(모델 초기화, 연결 수립)은 측정에서 제외
+        backend.synthesize(vocabulary[0], 'en', jobs[0][1])
+        for workers in args.workers:
+            result = run(backend, jobs, workers)
+            print(f"{name:6s} 작업 {workers}개: {len(jobs)}개 p50 {result['p50_ms']:.0f}ms "
+                  f"p95 {result['p95_ms']:.0f}ms  {result['per_sec']:.1f}개/s  "
+                  f"평균 {result['avg_kb']:.1f}KB  (불러오기 {load * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""스트리밍 음성 합성의 첫 소리까지 걸리는 시간 (느린 가짜 gTTS)
+
+gTTS는 100자 정도마다 요청을 나누므로 문장이 길수록 조각이 많다. 가짜 gTTS
+(benchmarks/fakes.py)가 조각마다 --latency초 걸리도록 하고, 캐시가 빈 상태에서
+  - buffered: tts.render (전부 받은 뒤 재생)
+  - stream:   tts.stream (첫 조각부터 재생)
+의 첫 소리까지 시간과 전체 시간을 비교한다. --http를 주면 api.py를 로컬 서버로 띄워
+chunked 응답의 첫 바이트까지 시간도 잰다.
+
+사용법:
+    python benchmarks/tts_stream.py [--latency 0.4] [--http]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+PHRASES = {
+    'word': "apple",
+    'sentence': "The little cat is sleeping under the warm blanket because it is very cold outside today. "
+                "It will wake up when the sun comes out.",
+    'story': ' '.join(["My family goes to the park every weekend and we bring sandwiches, juice and a big ball."] * 5),
+}
+
+
+def measure(run):
+    """run()이 돌려주는 조각들 → (첫 조각까지 초, 전체 초)"""
+    start = time.perf_counter()
+    first = None
+    for _ in run():
+        if first is None:
+            first = time.perf_counter() - start
+    return first, time.perf_counter() - start
+
+
+def serve(port):
+    from werkzeug.serving import make_server
+
+    from api import app
+
+    server = make_server('127.0.0.1', port, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def http_chunks(url):
+    with urllib.request.urlopen(url) as response:
+        while True:
+            chunk = response.read1(64 * 1024)
+            if not chunk:
+                return
+            yield chunk
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스트리밍 음성 합성 첫 소리 시간")
+    parser.add_argument('--latency', type=float, default=0.4, help="가짜 gTTS 조각당 응답 시간(초)")
+    parser.add_argument('--http', action='store_true', help="api.py 로컬 서버로도 측정")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='wordfriends-stream-')
+    os.environ['WORDFRIENDS_AUDIO_CACHE_DIR'] = os.path.join(workdir, 'audio')
+    os.environ['WORDFRIENDS_AUDIO_BUNDLE_DIR'] = os.path.join(workdir, 'bundle')
+    os.environ['WORDFRIENDS_OUTBOUND_RATE'] = '0'
+    os.environ['WORDFRIENDS_API_TTS_MAX_CHARS'] = '1000'
+
+    from benchmarks.fakes import FakeService, install_tts, split_text
+
+    install_tts(FakeService(latency=args.latency))
+
+    import metrics
+    import tts
+    from audio_cache import AudioCache
+
+    server = serve(args.port) if args.http else None
+
+    print(f"{'문장':9s} {'조각':>4s} {'방식':9s} {'첫 소리':>9s} {'전체':>9s}")
+    for n, (name, text) in enumerate(PHRASES.items()):
+        parts = len(split_text(text))
+        runs = [
+            ('buffered', lambda cache, tld: [tts.render(cache, text, tld)]),
+            ('stream', lambda cache, tld: tts.stream(cache, text, tld)),
+        ]
+        if server:
+            query = urllib.parse.urlencode({'text': text, 'voice': 'Girl'})
+            runs.append(('http', lambda cache, tld: http_chunks(f'http://127.0.0.1:{args.port}/api/speech?{query}')))
+        for mode, run in runs:
+            # 방식마다 빈 캐시와 다른 목소리로 시작 (캐시 적중 방지)
+            cache = AudioCache(os.path.join(workdir, f'{name}-{mode}'), mimetype=tts.default_backend().mimetype)
+            tld = f'fake{n}-{mode}' if mode != 'http' else tts.VOICES['Girl']
+            first, total = measure(lambda: run(cache, tld))
+            print(f"{name:9s} {parts:4d} {mode:9s} {first * 1000:7.0f}ms {total * 1000:7.0f}ms")
+
+    stage = metrics.snapshot()['stages'].get('tts.time_to_first_audio')
+    if stage:
+        print(f"tts.time_to_first_audio: n={stage['count']} p50 {stage['p50'] * 1000:.0f}ms")
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""기준 발음 음향 특징(MFCC) 저장소와 DTW 발음 점수
+
+presynth.py로 만든 (단어, 목소리) 기준 음성에서 MFCC를 미리 뽑아 float16 파일 하나에
+이어 붙여 저장하고, 실행 중에는 np.memmap으로 열어 여러 작업 프로세스가 같은 메모리를
+공유한다. 채점할 때는 학습자 녹음의 MFCC와 기준 MFCC 사이의 DTW 거리를 점수로 바꾸므로
+음성 인식 서버를 호출하지 않는다.
+
+DTW 거리는 녹음 환경(잡음, 마이크)에 따라 전체가 커지거나 작아지므로 그대로 쓰지 않고,
+철자가 비슷한 다른 단어(scoring.confusion_set)의 기준 발음까지의 거리로 나눈 비율을 점수로
+바꾼다. 비율 1.0은 목표 단어와 헷갈리는 단어의 중간이라는 뜻이다. 저장소를 만들 때 같은
+단어를 다른 목소리로 읽은 기준 음성끼리의 비율을 재어 calibration.json에 저장하고, 그 값과
+1.0의 중간이 정답 기준(0.8)이 되도록 맞춘다.
+
+사용법:
+    python features.py                     # ./cache/bundle → ./cache/features
+    python features.py --bundle DIR --out DIR
+"""
+import argparse
+import json
+import math
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+import config
+from audio_cache import cache_key, load_manifest
+from matcher import PASS_THRESHOLD
+from tts import VOICES
+
+SAMPLE_RATE = 16000
+FRAME_LEN = 400     # 25ms
+HOP_LEN = 160       # 10ms
+N_FFT = 512
+N_MELS = 26
+N_MFCC = 13
+
+DATA_NAME = 'mfcc.f16'
+INDEX_NAME = 'index.json'
+CALIBRATION_NAME = 'calibration.json'
+
+# 보정 파일이 없을 때 쓰는 거리 비율 (gTTS 기준 음성에서 잰 대략적인 값, 같은 단어 거리 약 1.1 /
+# 다른 단어 거리 약 2.5). 이 값이면 비율 0.67 이하는 1.0, 0.73은 0.8, 1.0은 0.25가 된다.
+DEFAULT_SAME_RATIO = 0.45
+WRONG_SCORE = 0.25         # 비율 1.0(헷갈리는 단어와 같은 거리)에 주는 점수
+CONFUSABLE_WORDS = 3       # 비율 계산에 쓰는 헷갈리는 단어 수
+CALIBRATION_PAIRS = 200    # 보정에 쓰는 단어 수 상한
+
+
+@lru_cache(maxsize=None)
+def _mel_filterbank():
+    """(N_MELS, N_FFT // 2 + 1) 삼각 필터"""
+    def hz_to_mel(hz):
+        return 2595 * np.log10(1 + hz / 700)
+
+    def mel_to_hz(mel):
+        return 700 * (10 ** (mel / 2595) - 1)
+
+    mels = np.linspace(hz_to_mel(0), hz_to_mel(SAMPLE_RATE / 2), N_MELS + 2)
+    bins = np.floor((N_FFT + 1) * mel_to_hz(mels) / SAMPLE_RATE).astype(int)
+    fbank = np.zeros((N_MELS, N_FFT // 2 + 1), dtype=np.float32)
+    for m in range(1, N_MELS + 1):
+        left, center, right = bins[m - 1], bins[m], bins[m + 1]
+        if center > left:
+            fbank[m - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+        if right > center:
+            fbank[m - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+    return fbank
+
+
+@lru_cache(maxsize=None)
+def _dct_matrix():
+    """DCT-II (N_MFCC, N_MELS)"""
+    n = np.arange(N_MELS)
+    k = np.arange(N_MFCC)[:, None]
+    return (np.cos(np.pi * k * (2 * n + 1) / (2 * N_MELS)) * math.sqrt(2 / N_MELS)).astype(np.float32)
+
+
+def mfcc(samples):
+    """16kHz int16 신호 → (프레임 수, N_MFCC) float32, 발화 단위 평균/분산 정규화"""
+    signal = np.asarray(samples, dtype=np.float32) / 32768.0
+    if len(signal) < FRAME_LEN:
+        signal = np.pad(signal, (0, FRAME_LEN - len(signal)))
+    signal = np.append(signal[0], signal[1:] - 0.97 * signal[:-1])   # 고역 강조
+
+    n_frames = 1 + (len(signal) - FRAME_LEN) // HOP_LEN
+    frames = np.lib.stride_tricks.as_strided(
+        signal, shape=(n_frames, FRAME_LEN),
+        strides=(signal.strides[0] * HOP_LEN, signal.strides[0]))
+    frames = frames * np.hamming(FRAME_LEN).astype(np.float32)
+
+    power = np.abs(np.fft.rfft(frames, N_FFT)) ** 2 / N_FFT
+    log_mel = np.log(np.maximum(power @ _mel_filterbank().T, 1e-10))
+    coeffs = log_mel @ _dct_matrix().T
+
+    coeffs -= coeffs.mean(axis=0)
+    coeffs /= coeffs.std(axis=0) + 1e-5
+    return coeffs.astype(np.float32)
+
+
+def dtw_distance(a, b):
+    """두 특징 행렬의 DTW 거리 (경로 길이로 나눈 평균 프레임 거리)
+
+    같은 반대각선(i + j = k) 위의 칸은 서로 의존하지 않으므로 한 번에 계산한다.
+    """
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    n, m = len(a), len(b)
+    sq = (a * a).sum(axis=1)[:, None] + (b * b).sum(axis=1)[None, :] - 2 * (a @ b.T)
+    cost = np.sqrt(np.maximum(sq, 0))
+
+    acc = np.full((n + 1, m + 1), np.inf, dtype=np.float32)
+    acc[0, 0] = 0
+    for k in range(2, n + m + 1):
+        i = np.arange(max(1, k - m), min(n, k - 1) + 1)
+        j = k - i
+        acc[i, j] = cost[i - 1, j - 1] + np.minimum(np.minimum(acc[i - 1, j], acc[i, j - 1]), acc[i - 1, j - 1])
+    return float(acc[n, m] / (n + m))
+
+
+class FeatureStore:
+    """메모리 맵으로 연 기준 발음 MFCC 저장소 (읽기 전용, 프로세스 간 공유)"""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, INDEX_NAME), encoding='utf-8') as f:
+            self.index = json.load(f)    # 캐시 키 -> [시작 프레임, 프레임 수]
+        data_path = os.path.join(directory, DATA_NAME)
+        if os.path.getsize(data_path):
+            self.data = np.memmap(data_path, dtype=np.float16, mode='r').reshape(-1, N_MFCC)
+        else:
+            # 모든 항목을 건너뛰어 빈 파일 (길이 0인 파일은 메모리 맵으로 열 수 없음)
+            self.data = np.zeros((0, N_MFCC), dtype=np.float16)
+        try:
+            with open(os.path.join(directory, CALIBRATION_NAME), encoding='utf-8') as f:
+                self.calibration = json.load(f)
+        except FileNotFoundError:
+            from words import all_words
+
+            self.calibration = {'same_ratio': DEFAULT_SAME_RATIO, 'pairs': 0, 'words': all_words()}
+
+    def __len__(self):
+        return len(self.index)
+
+    def get(self, key):
+        """캐시 키의 MFCC (없으면 None)"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        start, length = entry
+        return self.data[start:start + length]
+
+    def references(self, word, lang='en'):
+        """단어의 목소리별 기준 MFCC 목록"""
+        refs = (self.get(cache_key(word, lang, tld)) for tld in VOICES.values())
+        return [ref for ref in refs if ref is not None]
+
+
+def fit_scale(same_ratio):
+    """같은 단어 거리 비율 → (offset, scale)
+
+    same_ratio와 1.0의 중간에서 PASS_THRESHOLD, 1.0에서 WRONG_SCORE가 되도록
+    exp(-(비율 - offset) / scale)을 맞춘다 (offset보다 작으면 1.0).
+    """
+    if not 0 < same_ratio < 1:
+        same_ratio = DEFAULT_SAME_RATIO
+    boundary = (same_ratio + 1) / 2
+    scale = (1 - boundary) / math.log(PASS_THRESHOLD / WRONG_SCORE)
+    return boundary - scale * math.log(1 / PASS_THRESHOLD), scale
+
+
+class AcousticScorer:
+    """학습자 녹음과 기준 발음의 DTW 거리로 점수 계산 (RecognizerPool scorer로 사용)
+
+    후보 단어마다 헷갈리는 단어 CONFUSABLE_WORDS개의 기준 발음과도 비교하므로 DTW를
+    (1 + CONFUSABLE_WORDS) × 목소리 수만큼 계산한다.
+    """
+
+    def __init__(self, store):
+        from scoring import confusion_set
+
+        self.store = store
+        self.vocabulary = store.calibration['words']
+        self._confusion_set = confusion_set
+        self.offset, self.scale = fit_scale(store.calibration['same_ratio'])
+
+    def score(self, audio_data, candidates):
+        """sr.AudioData → 후보 단어별 유사도 (0~1, 기준 발음이 없으면 0)"""
+        from vad import trim_silence
+
+        pcm = np.frombuffer(audio_data.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2), dtype=np.int16)
+        features = mfcc(trim_silence(pcm, SAMPLE_RATE))
+        distances = {}
+
+        def distance(word):
+            if word not in distances:
+                refs = self.store.references(word)
+                distances[word] = min(dtw_distance(features, ref) for ref in refs) if refs else None
+            return distances[word]
+
+        scores = {}
+        for word in candidates:
+            target = distance(word)
+            if target is None:
+                scores[word] = 0.0
+                continue
+            others = [distance(other) for other in self._confusion_set(word, self.vocabulary, CONFUSABLE_WORDS)]
+            others = [d for d in others if d is not None]
+            scores[word] = self.to_score(target / max(min(others), 1e-6)) if others else 0.0
+        return scores
+
+    def to_score(self, ratio):
+        """목표 단어 거리 / 가장 가까운 헷갈리는 단어 거리 → 0~1"""
+        return math.exp(-max(0.0, ratio - self.offset) / self.scale)
+
+
+def calibrate(manifest, features, limit=CALIBRATION_PAIRS):
+    """번들 기준 음성으로 재는 보정값 {'same_ratio', 'pairs', 'words'}
+
+    same_ratio: 한 목소리의 기준 음성을 녹음으로 보고 다른 목소리의 같은 단어까지 거리를
+    같은 목소리의 헷갈리는 단어까지 거리로 나눈 값의 중앙값
+    """
+    from scoring import confusion_set
+
+    by_word = {}   # 단어 -> {tld: MFCC}
+    for key, entry in manifest.items():
+        if key in features:
+            by_word.setdefault(entry['text'], {})[entry['tld']] = features[key]
+    vocabulary = sorted(by_word)
+    ratios = []
+    for word in vocabulary[:limit]:
+        voices = by_word[word]
+        if len(voices) < 2:
+            continue
+        (tld, recording), (_, other_voice) = list(voices.items())[:2]
+        others = [dtw_distance(recording, by_word[other][tld])
+                  for other in confusion_set(word, vocabulary, CONFUSABLE_WORDS) if tld in by_word[other]]
+        if others and min(others) > 0:
+            ratios.append(dtw_distance(recording, other_voice) / min(others))
+    same_ratio = float(np.median(ratios)) if ratios else DEFAULT_SAME_RATIO
+    return {'same_ratio': same_ratio, 'pairs': len(ratios), 'words': vocabulary}
+
+
+def build(bundle_dir, out_dir):
+    """번들의 모든 기준 음성에서 MFCC를 뽑아 저장, 저장한 항목 수 반환
+
+    읽거나 디코딩하지 못한 항목은 건너뛰고 경고만 출력한다.
+    """
+    from audio_io import encoded_to_pcm16k, wav_to_pcm16k
+    from vad import trim_silence
+
+    manifest = load_manifest(bundle_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    index = {}
+    features_by_key = {}
+    offset = skipped = 0
+    tmp_path = os.path.join(out_dir, DATA_NAME + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        for key, entry in sorted(manifest.items()):
+            if entry.get('backend', 'gtts') != 'gtts':
+                continue   # stub 등 실제 음성이 아닌 항목
+            try:
+                with open(os.path.join(bundle_dir, entry['file']), 'rb') as audio:
+                    data = audio.read()
+                # mp3(gTTS) 또는 wav(piper)
+                pcm = wav_to_pcm16k(data) if data[:4] == b'RIFF' else encoded_to_pcm16k(data, SAMPLE_RATE)
+                features = mfcc(trim_silence(pcm, SAMPLE_RATE)).astype(np.float16)
+            except ImportError:
+                raise   # PyAV가 없으면 모든 항목이 실패하므로 멈춤
+            except Exception as e:
+                skipped += 1
+                print(f"건너뜀: {entry.get('text', key)} ({entry.get('file')}) - {type(e).__name__}: {e}",
+                      file=sys.stderr)
+                continue
+            f.write(features.tobytes())
+            index[key] = [offset, len(features)]
+            features_by_key[key] = features
+            offset += len(features)
+    os.replace(tmp_path, os.path.join(out_dir, DATA_NAME))
+    with open(os.path.join(out_dir, INDEX_NAME), 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+
+    calibration = calibrate(manifest, features_by_key)
+    with open(os.path.join(out_dir, CALIBRATION_NAME), 'w', encoding='utf-8') as f:
+        json.dump(calibration, f, ensure_ascii=False)
+    print(f"기준 발음 {len(index)}개, {offset}프레임 저장 ({offset * N_MFCC * 2 / 1024:.0f}KB), 건너뜀 {skipped}개")
+    if not index:
+        print("경고: 저장한 기준 발음이 없습니다. acoustic 채점은 유사도 채점으로 대신합니다.", file=sys.stderr)
+    print(f"보정: 같은 단어 거리 비율 {calibration['same_ratio']:.2f} ({calibration['pairs']}쌍)")
+    return len(index)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기준 발음 MFCC 저장소 생성")
+    parser.add_argument('--bundle', default=config.AUDIO_BUNDLE_DIR, help="presynth.py 번들 디렉터리")
+    parser.add_argument('--out', default=config.FEATURE_STORE_DIR, help="저장소 디렉터리")
+    args = parser.parse_args(argv)
+    return 0 if build(args.bundle, args.out) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""선생님이 올린 녹음 묶음(폴더 또는 zip)을 한꺼번에 채점하는 명령
+
+녹음 파일 이름이 정답 단어이거나(apple.wav, apple_2.webm), 묶음 안의 targets.csv에
+file,word[,learner_id] 열로 정답을 적는다. zip은 풀지 않고 파일을 하나씩 읽어 작업 프로세스로
+보내며, 동시에 들고 있는 녹음 수를 제한해 묶음 크기와 무관하게 메모리가 일정하다.
+결과는 한 줄씩 바로 기록하므로(.csv 또는 .jsonl) 중간에 끊겨도 다시 실행하면 채점하지 않은
+파일부터 이어서 한다. 오류로 끝난 파일도 다시 실행할 때 다시 채점한다.
+
+채점 방식은 config.SCORING_MODE를 따른다 (similarity / constrained / acoustic).
+
+사용법:
+    python grade.py recordings.zip --out report.csv
+    python grade.py recordings/ --out report.jsonl --workers 8
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import config
+import matcher
+
+AUDIO_EXTENSIONS = ('.wav', '.webm', '.ogg', '.mp3', '.m4a')
+TARGETS_NAME = 'targets.csv'
+FIELDS = ['file', 'word', 'learner_id', 'transcript', 'similarity', 'correct', 'error', 'seconds']
+
+# name: 묶음 안 경로, word: 정답 단어
+Clip = namedtuple('Clip', ['name', 'word', 'learner_id'])
+
+
+class Archive:
+    """폴더 또는 zip 안의 녹음 파일 (zip은 풀지 않고 파일 단위로 읽음)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path) if zipfile.is_zipfile(path) else None
+
+    def names(self):
+        if self._zip is not None:
+            return [info.filename for info in self._zip.infolist() if not info.is_dir()]
+        names = []
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                names.append(os.path.relpath(os.path.join(root, name), self.path).replace(os.sep, '/'))
+        return sorted(names)
+
+    def read(self, name):
+        if self._zip is not None:
+            return self._zip.read(name)
+        with open(os.path.join(self.path, name), 'rb') as f:
+            return f.read()
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+
+
+def load_clips(archive):
+    """채점할 녹음 목록 (targets.csv가 있으면 그 목록, 없으면 파일 이름의 첫 '_' 앞부분이 정답)"""
+    names = archive.names()
+    targets = [name for name in names if os.path.basename(name).lower() == TARGETS_NAME]
+    if targets:
+        base = os.path.dirname(targets[0])
+        rows = csv.DictReader(io.StringIO(archive.read(targets[0]).decode('utf-8-sig')))
+        return [Clip(os.path.join(base, row['file']).replace(os.sep, '/') if base else row['file'],
+                     row['word'].strip().lower(), row.get('learner_id') or '')
+                for row in rows]
+    return [Clip(name, os.path.splitext(os.path.basename(name))[0].split('_')[0].lower(), '')
+            for name in names if name.lower().endswith(AUDIO_EXTENSIONS)]
+
+
+def normalize(data, peak=0.9):
+    """녹음 bytes → 16kHz 모노 int16, 앞뒤 무음 제거 후 최대 음량을 peak로 맞춤"""
+    import numpy as np
+
+    import audio_io
+    from vad import trim_silence
+
+    if data[:4] == b'RIFF':
+        samples = audio_io.wav_to_pcm16k(data)
+    else:
+        samples = audio_io.encoded_to_pcm16k(data)
+    samples = trim_silence(samples, audio_io.TARGET_RATE)
+    if samples.size == 0:
+        return samples
+    loudest = int(np.abs(samples.astype(np.int32)).max())
+    return audio_io.to_int16(samples.astype(np.float32), peak * 32767 / max(loudest, 1))
+
+
+class Grader:
+    """작업 프로세스 하나의 채점기 (인식 모델/기준 발음은 프로세스당 한 번만 읽음)"""
+
+    def __init__(self, mode=None):
+        from asr import create_backend
+        from words import all_words
+
+        self.mode = mode or config.SCORING_MODE
+        self.vocabulary = all_words()
+        if self.mode == 'acoustic':
+            from features import AcousticScorer, FeatureStore
+
+            self.scorer = AcousticScorer(FeatureStore(config.FEATURE_STORE_DIR))
+        else:
+            self.backend = create_backend(config.ASR_BACKEND, timeout=config.ASR_TIMEOUT_SECONDS,
+                                          vosk_model_path=config.VOSK_MODEL_PATH)
+
+    def grade(self, samples, word):
+        """16kHz int16 배열 → (인식 결과, 유사도)"""
+        import speech_recognition as sr
+
+        import audio_io
+        from scoring import best_candidate, candidates_for
+
+        if samples.size == 0:
+            return None, 0.0
+        audio_data = sr.AudioData(samples.tobytes(), sample_rate=audio_io.TARGET_RATE, sample_width=2)
+        if self.mode == 'acoustic':
+            return None, self.scorer.score(audio_data, [word])[word]
+        if self.mode == 'constrained':
+            scores = self.backend.score(audio_data, candidates_for(word, self.vocabulary))
+            heard = best_candidate(scores)
+            if heard is None:   # 인식 결과 없음 (UnknownValueError와 같게 처리)
+                return None, 0.0
+            return heard, scores.get(word, 0.0)
+        try:
+            transcript = self.backend.recognize(audio_data, grammar=self.vocabulary).lower()
+        except sr.UnknownValueError:
+            return None, 0.0
+        return transcript, matcher.similarity(word, transcript)
+
+
+_grader = None
+
+
+def _init_worker(factory):
+    global _grader
+    _grader = factory()
+
+
+def _row(clip, error=None):
+    row = dict.fromkeys(FIELDS, '')
+    row.update(file=clip.name, word=clip.word, learner_id=clip.learner_id)
+    if error is not None:
+        row['error'] = f'{type(error).__name__}: {error}'
+    return row
+
+
+def _grade(clip, data):
+    """작업 프로세스에서 녹음 하나 채점 → 결과 한 줄"""
+    start = time.perf_counter()
+    row = _row(clip)
+    try:
+        transcript, similarity = _grader.grade(normalize(data), clip.word)
+        row.update(transcript=transcript or '', similarity=round(similarity, 4), correct=similarity > matcher.PASS_THRESHOLD)
+    except Exception as e:
+        row = _row(clip, e)
+    row['seconds'] = round(time.perf_counter() - start, 3)
+    return row
+
+
+class Report:
+    """결과 파일 (.csv 또는 .jsonl), 이미 채점된 파일은 건너뛰고 이어서 씀
+
+    오류로 끝난 줄(네트워크 오류, 디코딩 실패 등)은 채점된 것으로 보지 않으므로 다시 실행하면
+    그 파일을 다시 채점해 새 줄을 덧붙인다 (같은 파일이 여러 줄이면 마지막 줄이 결과).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.jsonl = path.endswith('.jsonl')
+        self.done = set()
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, encoding='utf-8', newline='') as f:
+                if self.jsonl:
+                    rows = []
+                    for line in f:
+                        try:
+                            rows.append(json.loads(line))
+                        except ValueError:
+                            pass   # 중간에 끊긴 마지막 줄
+                else:
+                    rows = csv.DictReader(f)
+                for row in rows:
+                    if row.get('file') and row.get('seconds') not in (None, '') and not row.get('error'):
+                        self.done.add(row['file'])
+        self._file = open(path, 'a', encoding='utf-8', newline='')
+        if exists and not self._ends_with_newline():
+            self._file.write('\n')   # 끊긴 마지막 줄 뒤에 이어 쓰지 않도록
+        self._writer = None if self.jsonl else csv.DictWriter(self._file, FIELDS)
+        if self._writer is not None and not exists:
+            self._writer.writeheader()
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def write(self, row):
+        if self.jsonl:
+            self._file.write(json.dumps(row, ensure_ascii=False) + '\n')
+        else:
+            self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def _progress(done, total, correct, failed, start):
+    elapsed = time.perf_counter() - start
+    rate = done / elapsed if elapsed else 0.0
+    eta = (total - done) / rate if rate else 0.0
+    print(f"\r{done}/{total}  정답 {correct}  오류 {failed}  {rate:.1f}개/s  남은 시간 {eta:.0f}s",
+          end='', file=sys.stderr, flush=True)
+
+
+def run(source, report_path, workers=4, max_in_flight=None, factory=Grader):
+    """묶음 채점, (채점 수, 오류 수) 반환
+
+    max_in_flight: 작업 프로세스로 보냈지만 끝나지 않은 녹음 수 상한 (메모리 상한)
+    factory: 작업 프로세스마다 한 번 호출해 grade(samples, word)를 가진 채점기를 만듦
+    """
+    max_in_flight = max_in_flight or workers * 2
+    archive = Archive(source)
+    report = Report(report_path)
+    clips = [clip for clip in load_clips(archive) if clip.name not in report.done]
+    print(f"채점 대상 {len(clips)}개 (이미 채점 {len(report.done)}개)", file=sys.stderr)
+
+    counts = dict.fromkeys(['done', 'correct', 'failed'], 0)
+    start = time.perf_counter()
+    pending = set()
+
+    def record(row):
+        report.write(row)
+        counts['done'] += 1
+        counts['correct'] += row['correct'] is True
+        counts['failed'] += bool(row['error'])
+        _progress(counts['done'], len(clips), counts['correct'], counts['failed'], start)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(factory,)) as executor:
+            clips_iter = iter(clips)
+            while True:
+                # 상한까지 녹음을 읽어 보냄 (zip에서 필요할 때 하나씩 읽음)
+                for clip in clips_iter:
+                    try:
+                        data = archive.read(clip.name)
+                    except (KeyError, OSError, zipfile.BadZipFile) as e:
+                        record(_row(clip, e))   # targets.csv에만 있는 파일, 손상된 zip 항목
+                        continue
+                    pending.add(executor.submit(_grade, clip, data))
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    break
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record(future.result())
+    finally:
+        report.close()
+        archive.close()
+    print(file=sys.stderr)
+    done, failed = counts['done'], counts['failed']
+    elapsed = time.perf_counter() - start
+    print(f"완료: 채점 {done}개, 오류 {failed}개, {elapsed:.1f}s ({done / elapsed if elapsed else 0:.1f}개/s)",
+          file=sys.stderr)
+    return done, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="녹음 묶음 일괄 채점")
+    parser.add_argument('source', help="녹음 폴더 또는 zip 파일")
+    parser.add_argument('--out', default='report.csv', help="결과 파일 (.csv 또는 .jsonl)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help="작업 프로세스 수")
+    parser.add_argument('--max-in-flight', type=int, default=None, help="동시에 들고 있는 녹음 수 (기본: 작업 수 × 2)")
+    args = parser.parse_args(argv)
+
+    _, failed = run(args.source, args.out, args.workers, args.max_in_flight)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""발음 결과 비교: 정규화 + 편집 거리 + 발음 키
+
+RapidFuzz(C 구현)가 있으면 사용하고 없으면 difflib으로 동작한다.
+"""
+import difflib
+import re
+import unicodedata
+from functools import lru_cache
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - RapidFuzz가 없는 환경
+    fuzz = process = None
+
+# 정답 기준 (app.py/api.py/grade.py에서 similarity가 이 값보다 커야 정답)
+PASS_THRESHOLD = 0.8
+
+# 발음 키가 같을 때 줄 수 있는 최고 점수. 발음 키만 같은 답(two/too, nite/night)은
+# 부분 점수일 뿐 정답으로 치지 않도록 PASS_THRESHOLD보다 낮게 둔다.
+PHONETIC_WEIGHT = 0.75
+
+_NON_WORD = re.compile(r"[^a-z0-9' ]+")
+
+
+@lru_cache(maxsize=8192)
+def normalize(text):
+    """소문자, 악센트/문장부호 제거, 공백 정리 ("Apple." → "apple")"""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = _NON_WORD.sub(' ', text.lower()).replace("'", '')
+    return ' '.join(text.split())
+
+
+def ratio(a, b):
+    """두 문자열의 유사도 (0~1)"""
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+# 발음이 비슷한 철자 묶음 (Soundex 계열 규칙을 단순화)
+_DIGRAPHS = [('ph', 'f'), ('ck', 'k'), ('gh', 'g'), ('kn', 'n'), ('wr', 'r'), ('wh', 'w'),
+             ('sch', 'sk'), ('th', '0'), ('sh', 'x'), ('ch', 'x'), ('qu', 'kw')]
+_CLASSES = str.maketrans({
+    'b': 'p', 'v': 'f', 'd': 't', 'g': 'k', 'q': 'k', 'c': 'k', 'z': 's', 'j': 'x',
+})
+
+
+@lru_cache(maxsize=8192)
+def phonetic_key(word):
+    """발음 키 (비슷한 자음을 묶고 연속 중복 제거)
+
+    모음은 남긴다. cat/cut, ship/sheep처럼 모음 하나만 다른 단어는 발음 연습에서
+    가려내야 하는 차이이기 때문이다 (ee/oo 같은 겹모음은 중복 제거로 하나가 됨).
+    """
+    word = normalize(word).replace(' ', '')
+    if not word:
+        return ''
+    for src, dst in _DIGRAPHS:
+        word = word.replace(src, dst)
+    word = word.translate(_CLASSES)
+    key = [word[0]]
+    for char in word[1:]:
+        if char in 'hw':
+            continue
+        if char != key[-1]:
+            key.append(char)
+    return ''.join(key)
+
+
+def best_match(target, transcript):
+    """받아쓰기 결과에서 목표 단어와 가장 비슷한 부분 (토큰 또는 전체)"""
+    tokens = normalize(transcript).split()
+    if not tokens:
+        return ''
+    choices = tokens if len(tokens) == 1 else tokens + [' '.join(tokens)]
+    if process is not None:
+        return process.extractOne(target, choices, scorer=fuzz.ratio)[0]
+    return max(choices, key=lambda choice: ratio(target, choice))
+
+
+def similarity(target, transcript):
+    """목표 단어와 받아쓰기 결과의 유사도 (0~1)
+
+    철자 유사도와 발음 키 유사도(PHONETIC_WEIGHT 배) 중 높은 값을 쓴다. 발음 키 점수는
+    PASS_THRESHOLD를 넘지 않으므로 철자가 충분히 가까울 때만 정답이 된다.
+    """
+    target = normalize(target)
+    match = best_match(target, transcript)
+    if not target or not match:
+        return 0.0
+    spelling = ratio(target, match)
+    if spelling == 1.0:
+        return spelling
+    sound = ratio(phonetic_key(target), phonetic_key(match)) * PHONETIC_WEIGHT
+    return max(spelling, sound)
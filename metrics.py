@@ -0,0 +1,170 @@
+"""단계별 지연 시간/횟수 측정 (TTS, 번역, 음성 인식, 유사도 계산)
+
+    with metrics.span('tts.synthesize'):
+        ...
+    metrics.incr('tts.retries')
+
+꺼져 있으면 span()은 미리 만든 빈 객체를 돌려주기만 하므로 호출 비용이 거의 없다.
+render_prometheus()는 Prometheus 텍스트 형식으로, start_log_dump()는 주기적으로 로그에
+단계별 p50/p95/p99를 남긴다.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+import config
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# 단계별로 최근 측정값만 보관 (분위수 계산용)
+RESERVOIR_SIZE = 2048
+
+enabled = config.METRICS_ENABLED
+
+_lock = threading.Lock()
+_durations = defaultdict(lambda: deque(maxlen=RESERVOIR_SIZE))   # 단계 -> 최근 소요 시간(초)
+_totals = defaultdict(lambda: [0, 0.0, 0])                       # 단계 -> [횟수, 합계(초), 오류 수]
+_counters = defaultdict(int)
+_collectors = {}                                                 # 이름 -> stats() 같은 dict 반환 함수
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe(self.name, time.perf_counter() - self.start, error=exc_type is not None)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name):
+    """단계 소요 시간 측정용 context manager"""
+    if not enabled:
+        return _NOOP
+    return _Span(name)
+
+
+def observe(name, seconds, error=False):
+    """단계 소요 시간 기록"""
+    if not enabled:
+        return
+    with _lock:
+        _durations[name].append(seconds)
+        total = _totals[name]
+        total[0] += 1
+        total[1] += seconds
+        total[2] += error
+
+
+def incr(name, n=1):
+    """횟수 증가 (캐시 적중, 재시도, 실패 등)"""
+    if not enabled:
+        return
+    with _lock:
+        _counters[name] += n
+
+
+def register_collector(name, collect):
+    """stats()처럼 숫자 dict를 돌려주는 함수를 등록해 함께 내보냄"""
+    _collectors[name] = collect
+
+
+def _quantile(values, q):
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def snapshot():
+    """현재 측정값 {'stages': {...}, 'counters': {...}, 'collectors': {...}}"""
+    with _lock:
+        stages = {}
+        for name, values in _durations.items():
+            ordered = sorted(values)
+            count, total, errors = _totals[name]
+            stages[name] = {
+                'count': count,
+                'sum': total,
+                'errors': errors,
+                **{f'p{int(q * 100)}': _quantile(ordered, q) for q in QUANTILES if ordered},
+            }
+        counters = dict(_counters)
+    collected = {}
+    for name, collect in list(_collectors.items()):
+        try:
+            collected[name] = {key: value for key, value in collect().items()
+                               if isinstance(value, (int, float))}
+        except Exception:
+            logger.exception("metrics collector %s failed", name)
+    return {'stages': stages, 'counters': counters, 'collectors': collected}
+
+
+def _metric_name(name):
+    return 'wordfriends_' + ''.join(char if char.isalnum() else '_' for char in name)
+
+
+def render_prometheus():
+    """Prometheus 텍스트 형식"""
+    data = snapshot()
+    lines = ['# TYPE wordfriends_stage_seconds summary']
+    for stage, values in sorted(data['stages'].items()):
+        for q in QUANTILES:
+            key = f'p{int(q * 100)}'
+            if key in values:
+                lines.append(f'wordfriends_stage_seconds{{stage="{stage}",quantile="{q}"}} {values[key]:.6f}')
+        lines.append(f'wordfriends_stage_seconds_sum{{stage="{stage}"}} {values["sum"]:.6f}')
+        lines.append(f'wordfriends_stage_seconds_count{{stage="{stage}"}} {values["count"]}')
+        lines.append(f'wordfriends_stage_errors_total{{stage="{stage}"}} {values["errors"]}')
+    for name, value in sorted(data['counters'].items()):
+        lines.append(f'{_metric_name(name)}_total {value}')
+    for collector, values in sorted(data['collectors'].items()):
+        for key, value in sorted(values.items()):
+            lines.append(f'{_metric_name(collector + "_" + key)} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+def format_summary():
+    """로그용 한 줄 요약 (단계별 횟수, p50/p95/p99 ms)"""
+    parts = []
+    for stage, values in sorted(snapshot()['stages'].items()):
+        quantiles = '/'.join(f"{values.get(f'p{int(q * 100)}', 0) * 1000:.0f}" for q in QUANTILES)
+        parts.append(f"{stage} n={values['count']} err={values['errors']} p50/95/99={quantiles}ms")
+    return '; '.join(parts)
+
+
+_dump_thread = None
+
+
+def start_log_dump(interval):
+    """interval초마다 요약을 로그로 남기는 스레드 시작 (한 번만)"""
+    global _dump_thread
+    if interval <= 0 or _dump_thread is not None:
+        return
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            logger.info("metrics: %s", format_summary())
+
+    _dump_thread = threading.Thread(target=loop, name='metrics-dump', daemon=True)
+    _dump_thread.start()
@@ -0,0 +1,207 @@
+"""외부 서비스(gTTS, 번역, 음성 인식) 호출 공용 계층
+
+서비스마다 하나씩 OutboundBackend를 두고 모든 호출을 call()로 보낸다.
+  - 같은 키로 진행 중인 호출이 있으면 새로 보내지 않고 그 결과를 함께 받는다 (single-flight).
+  - 동시 호출 수와 초당 호출 수(token bucket)를 제한한다.
+  - 연속으로 실패하면 회로를 열어 reset_timeout 동안 바로 CircuitOpen을 낸다.
+    호출하는 쪽은 이때 캐시의 (만료된) 값을 쓰거나 바로 오류를 보여 준다.
+"""
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+import config
+import metrics
+
+
+class CircuitOpen(Exception):
+    """서비스가 불안정해 호출을 보내지 않음 (retry_after: 회로가 다시 시험 호출을 받기까지 남은 초)"""
+
+    def __init__(self, message, retry_after=0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 호출 허가 (rate가 0이면 제한 없음)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """허가 하나를 얻을 때까지 기다림, 기다린 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """연속 실패 failure_threshold번이면 열림 → reset_timeout 뒤 시험 호출 하나만 허용 (half_open)"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """호출을 보내도 되는지 (half_open에서는 첫 호출만 허용, 그 결과가 오지 않으면 reset_timeout 뒤 다시 허용)"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                self._opened_at = now
+                return True
+            return False
+
+    def retry_after(self):
+        """다시 호출을 받기까지 남은 초 (닫혀 있으면 0)"""
+        with self._lock:
+            if self.state == 'closed':
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record(self, success):
+        with self._lock:
+            if success:
+                self.state = 'closed'
+                self._failures = 0
+                return
+            self._failures += 1
+            if self.state == 'half_open' or self._failures >= self.failure_threshold:
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+
+
+class OutboundBackend:
+    """외부 서비스 하나의 호출 제어 (single-flight + 동시 호출/초당 호출 제한 + 회로 차단)
+
+    is_failure(error): 서비스 이상으로 볼 예외인지 (예: 말소리 없음은 서비스 이상이 아님)
+    """
+
+    def __init__(self, name, max_concurrency=4, rate=0, burst=1, failure_threshold=5, reset_timeout=30,
+                 is_failure=None):
+        self.name = name
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.bucket = TokenBucket(rate, burst)
+        self.is_failure = is_failure or (lambda error: True)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._in_flight = {}   # 키 -> Future
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(['calls', 'coalesced', 'sent', 'failures', 'rejected'], 0)
+        self.throttled_seconds = 0.0
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+        metrics.incr(f'outbound.{self.name}.{name}')
+
+    def call(self, key, fn):
+        """fn()을 호출해 결과 반환 (key가 같은 호출이 진행 중이면 그 결과를 공유, key=None이면 공유 안 함)"""
+        self._count('calls')
+        if key is not None:
+            with self._lock:
+                future = self._in_flight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._in_flight[key] = Future()
+            if not leader:
+                self._count('coalesced')
+                return future.result()
+        try:
+            result = self._send(fn)
+        except BaseException as e:
+            if key is not None:
+                self._finish(key, future, error=e)
+            raise
+        if key is not None:
+            self._finish(key, future, result=result)
+        return result
+
+    def _finish(self, key, future, result=None, error=None):
+        with self._lock:
+            del self._in_flight[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    @contextmanager
+    def _guard(self):
+        """회로 확인 → 동시 호출 자리와 호출 허가를 얻고 → 결과를 회로에 기록"""
+        if not self.breaker.allow():
+            self._count('rejected')
+            raise CircuitOpen(f"{self.name} 서비스가 불안정해 잠시 호출을 멈췄습니다.", self.breaker.retry_after())
+        with self._slots:
+            waited = self.bucket.acquire()
+            if waited:
+                with self._lock:
+                    self.throttled_seconds += waited
+            self._count('sent')
+            try:
+                yield
+            except Exception as e:
+                failure = self.is_failure(e)
+                if failure:
+                    self._count('failures')
+                self.breaker.record(not failure)
+                raise
+        self.breaker.record(True)
+
+    def _send(self, fn):
+        with self._guard():
+            return fn()
+
+    def stream(self, fn):
+        """fn()이 돌려주는 조각(iterable)을 차례로 내보냄 (합치기 없이 제한/회로 차단만 적용, 끝까지 받아야 성공)"""
+        self._count('calls')
+        with self._guard():
+            yield from fn()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats['in_flight'] = len(self._in_flight)
+            stats['throttled_seconds'] = self.throttled_seconds
+        stats['circuit_open'] = int(self.breaker.state != 'closed')
+        return stats
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get(name, **overrides):
+    """서비스 이름별 공용 OutboundBackend (설정값으로 처음 한 번 생성)"""
+    with _backends_lock:
+        backend = _backends.get(name)
+        if backend is None:
+            options = dict(max_concurrency=config.OUTBOUND_MAX_CONCURRENCY,
+                           rate=config.OUTBOUND_RATE,
+                           burst=config.OUTBOUND_BURST,
+                           failure_threshold=config.BREAKER_FAILURES,
+                           reset_timeout=config.BREAKER_RESET_SECONDS)
+            options.update(overrides)
+            backend = _backends[name] = OutboundBackend(name, **options)
+            metrics.register_collector(f'outbound_{name}', backend.stats)
+        return backend
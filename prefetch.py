@@ -0,0 +1,109 @@
+"""세션별 미리 준비 대기열: 다음 단어들의 음성과 뜻을 백그라운드에서 준비
+
+학습자가 현재 단어를 연습하는 동안 다음 단어들을 준비해 두었다가 PLAY를 누르면
+바로 꺼내 쓴다. 주제/목소리가 바뀌면 준비 중인 작업을 취소하고, 세션마다 보관 개수와
+음성 용량에 상한을 둔다.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+
+import metrics
+
+PreparedWord = namedtuple('PreparedWord', ['word', 'audio', 'gloss'])
+
+
+def prepare_word(word, render_audio, lookup_gloss, gloss_ready=None):
+    """단어 하나의 음성(bytes)과 뜻 준비 (gloss_ready: 묶음 뜻 조회 작업이 있으면 먼저 기다림)"""
+    audio = render_audio(word)
+    if gloss_ready is not None:
+        try:
+            gloss_ready.result()
+        except Exception:
+            pass  # 묶음 조회가 실패해도 단어별 조회로 대신함
+    return PreparedWord(word, audio, lookup_gloss(word))
+
+
+class Prefetcher:
+    """세션 하나의 미리 준비 대기열"""
+
+    def __init__(self, executor, max_items=10, max_bytes=2 * 1024 * 1024):
+        self.executor = executor
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.context = None
+        self._items = OrderedDict()   # 단어 -> Future
+        self._lock = threading.RLock()   # 이미 끝난 작업은 add_done_callback이 잠금 안에서 바로 부름
+        self.counters = dict.fromkeys(['scheduled', 'hits', 'waits', 'misses', 'failures', 'cancelled', 'evicted'], 0)
+
+    def reset(self, context):
+        """주제/목소리 등 준비 조건이 바뀌면 기존 작업을 모두 취소"""
+        if context == self.context:
+            return
+        with self._lock:
+            for future in self._items.values():
+                if future.cancel():
+                    self.counters['cancelled'] += 1
+            self._items.clear()
+            self.context = context
+
+    def schedule(self, words, prepare, *args):
+        """아직 준비하지 않은 단어마다 prepare(word, *args)를 백그라운드로 실행"""
+        with self._lock:
+            for word in words:
+                if word in self._items:
+                    continue
+                future = self.executor.submit(prepare, word, *args)
+                self._items[word] = future
+                self.counters['scheduled'] += 1
+                future.add_done_callback(self._on_done)
+            self._enforce_limits()
+
+    def _on_done(self, future):
+        """작업이 끝날 때마다 용량 상한 확인 (다음 schedule까지 상한을 넘은 채로 두지 않도록)"""
+        if future.cancelled():
+            return
+        with self._lock:
+            self._enforce_limits()
+
+    def _enforce_limits(self):
+        """보관 개수/음성 용량 상한을 넘으면 나중에 쓸 단어부터 버림 (잠금 상태에서 호출)
+
+        예약 순서가 출제 순서이므로 먼저 예약한 단어가 곧 PLAY할 단어다.
+        """
+        def size():
+            return sum(len(future.result().audio) for future in self._items.values()
+                       if future.done() and not future.cancelled() and future.exception() is None)
+
+        while self._items and (len(self._items) > self.max_items or size() > self.max_bytes):
+            _, future = self._items.popitem(last=True)
+            future.cancel()
+            self.counters['evicted'] += 1
+
+    def take(self, word, timeout=None):
+        """준비된 단어 꺼내기 (아직 준비 중이면 timeout 동안 기다림), 없거나 실패하면 None"""
+        with self._lock:
+            future = self._items.pop(word, None)
+            if future is None:
+                self.counters['misses'] += 1
+                metrics.incr('prefetch.misses')
+                return None
+            result = 'hits' if future.done() else 'waits'
+            self.counters[result] += 1
+        metrics.incr(f'prefetch.{result}')
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            with self._lock:
+                self.counters['failures'] += 1
+            metrics.incr('prefetch.failures')
+            return None
+
+    def stats(self):
+        """준비 대기열 통계 (hit_rate: 꺼낼 때 이미 준비되어 있던 비율)"""
+        with self._lock:
+            stats = dict(self.counters)
+            stats['pending'] = sum(not future.done() for future in self._items.values())
+            stats['ready'] = len(self._items) - stats['pending']
+        taken = stats['hits'] + stats['waits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / taken if taken else 0.0
+        return stats
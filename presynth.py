@@ -0,0 +1,131 @@
+"""단어장 전체를 미리 음성 합성해 번들로 저장하는 명령
+
+사용법:
+    python presynth.py                      # gTTS로 ./cache/bundle 에 생성
+    python presynth.py --backend stub       # 네트워크 없이 가짜 합성으로 실행
+    python presynth.py --out DIR --workers 8
+
+이미 manifest에 같은 백엔드로 있는 (단어, 목소리)는 건너뛰므로 다시 실행하면 새로
+추가되거나 바뀐 단어만 합성한다. 파일은 백엔드별 하위 디렉터리(gtts/, stub/)에 저장하고,
+다른 백엔드로 만든 항목은 다시 합성해 덮어쓴다 (앱은 gtts 항목만 사용).
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import config
+import metrics
+from audio_cache import cache_key, load_manifest, save_manifest
+from outbound import CircuitOpen
+from tts import BACKENDS, VOICES
+from words import all_words
+
+LANG = 'en'
+
+
+def plan_jobs(words, manifest, bundle_dir, backend_name='gtts', force=False):
+    """합성이 필요한 (단어, 목소리, tld, 키) 목록 (없거나 다른 백엔드로 만든 항목)"""
+    jobs = []
+    for word in words:
+        for voice, tld in VOICES.items():
+            key = cache_key(word, LANG, tld)
+            entry = manifest.get(key)
+            if (not force and entry is not None
+                    and entry.get('backend') == backend_name
+                    and os.path.exists(os.path.join(bundle_dir, entry['file']))):
+                continue
+            jobs.append((word, voice, tld, key))
+    return jobs
+
+
+def synthesize_with_retry(backend, text, tld, retries=4, base_delay=0.5, circuit_poll=5.0, max_circuit_wait=None):
+    """지수 백오프(+지터)로 재시도하며 합성
+
+    연속 실패로 'tts' 회로가 열리면(CircuitOpen) reset_timeout(기본 30초) 동안 모든 호출이 바로
+    실패하는데 이는 백오프보다 길다. 그래서 회로가 열려 있는 동안은 재시도 횟수를 쓰지 않고
+    최대 circuit_poll초 간격으로 기다린다 (모두 합쳐 max_circuit_wait초, 기본 retries × reset_timeout).
+    """
+    if max_circuit_wait is None:
+        max_circuit_wait = retries * config.BREAKER_RESET_SECONDS
+    attempt = 0
+    waited = 0.0
+    while True:
+        try:
+            return backend(text, lang=LANG, tld=tld)
+        except CircuitOpen as e:
+            if waited >= max_circuit_wait:
+                raise
+            delay = min(max(e.retry_after, 0.1), circuit_poll) * (1 + 0.2 * random.random())
+            metrics.incr('tts.circuit_waits')
+            time.sleep(delay)
+            waited += delay
+        except Exception:
+            attempt += 1
+            if attempt == retries:
+                raise
+            metrics.incr('tts.retries')
+            time.sleep(base_delay * (2 ** (attempt - 1)) * (1 + random.random()))
+
+
+def run(bundle_dir, backend_name='gtts', workers=4, retries=4, force=False):
+    """번들 생성, (합성 수, 실패 수) 반환"""
+    backend = BACKENDS[backend_name]
+    os.makedirs(os.path.join(bundle_dir, backend_name), exist_ok=True)
+    manifest = load_manifest(bundle_dir)
+    jobs = plan_jobs(all_words(), manifest, bundle_dir, backend_name, force=force)
+    print(f"합성 대상 {len(jobs)}개 (manifest {len(manifest)}개)")
+
+    done = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(synthesize_with_retry, backend, word, tld, retries): (word, voice, tld, key)
+                   for word, voice, tld, key in jobs}
+        for future in as_completed(futures):
+            word, voice, tld, key = futures[future]
+            try:
+                audio = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"실패: {word} ({voice}) - {e}", file=sys.stderr)
+                continue
+
+            filename = f'{backend_name}/{key}.mp3'
+            with open(os.path.join(bundle_dir, filename), 'wb') as f:
+                f.write(audio)
+            manifest[key] = {
+                'file': filename,
+                'text': word,
+                'lang': LANG,
+                'tld': tld,
+                'voice': voice,
+                'backend': backend_name,
+                'sha256': hashlib.sha256(audio).hexdigest(),
+                'size': len(audio),
+            }
+            done += 1
+            if done % 50 == 0:
+                save_manifest(bundle_dir, manifest)  # 중간에 끊겨도 다시 이어서 실행 가능
+
+    save_manifest(bundle_dir, manifest)
+    print(f"완료: 합성 {done}개, 실패 {failed}개")
+    return done, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="단어장 전체 TTS 사전 합성")
+    parser.add_argument('--out', default=config.AUDIO_BUNDLE_DIR, help="번들 디렉터리")
+    parser.add_argument('--backend', default='gtts', choices=sorted(BACKENDS), help="합성 백엔드")
+    parser.add_argument('--workers', type=int, default=4, help="동시 합성 개수")
+    parser.add_argument('--retries', type=int, default=4, help="단어별 최대 시도 횟수")
+    parser.add_argument('--force', action='store_true', help="manifest를 무시하고 전부 다시 합성")
+    args = parser.parse_args(argv)
+
+    _, failed = run(args.out, args.backend, args.workers, args.retries, args.force)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""학습 기록 저장소 (SQLAlchemy, 로컬은 SQLite / 운영은 Postgres)
+
+발음 시도 기록은 대기열에 넣고 백그라운드 스레드가 모아서 한 번에 저장하므로
+DB가 느려도 버튼 처리 경로가 멈추지 않는다.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import timezone
+from functools import lru_cache
+
+from sqlalchemy import (Boolean, Column, DateTime, Float, Index, Integer, MetaData, String, Table,
+                        create_engine, func, select)
+from sqlalchemy.pool import StaticPool
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+attempts = Table(
+    'attempts', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('learner_id', String(64), nullable=False),
+    Column('word', String(128), nullable=False),
+    Column('topic', String(64)),
+    Column('similarity', Float, nullable=False),
+    Column('correct', Boolean, nullable=False),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Index('ix_attempts_learner_word', 'learner_id', 'word'),
+    Index('ix_attempts_word', 'word'),
+)
+
+
+@lru_cache(maxsize=None)
+def get_engine(url):
+    """URL별 엔진 (프로세스당 하나, 연결 풀 공유)"""
+    if url.startswith('sqlite'):
+        path = url.split(':///', 1)[-1] if ':///' in url else ''
+        if path in ('', ':memory:'):
+            # 메모리 DB는 연결마다 따로 생기므로 모든 스레드(저장 스레드 포함)가 연결 하나를 공유
+            engine = create_engine(url, connect_args={'check_same_thread': False}, poolclass=StaticPool)
+        else:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            engine = create_engine(url, connect_args={'check_same_thread': False})
+    else:
+        engine = create_engine(url, pool_size=5, max_overflow=10, pool_pre_ping=True, pool_recycle=1800)
+    metadata.create_all(engine)
+    return engine
+
+
+class ProgressStore:
+    """발음 시도 기록의 비동기 일괄 저장과 정확도 조회"""
+
+    def __init__(self, url, batch_size=100, flush_interval=1.0, max_queue=10000):
+        self.engine = get_engine(url)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(['queued', 'written', 'dropped', 'failed_batches'], 0)
+        self._writer = threading.Thread(target=self._write_loop, name='progress-writer', daemon=True)
+        self._writer.start()
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def record_attempt(self, learner_id, word, similarity, correct, topic=None):
+        """시도 기록을 대기열에 추가 (가득 차면 버리고 dropped 증가)"""
+        row = {'learner_id': learner_id, 'word': word, 'topic': topic,
+               'similarity': float(similarity), 'correct': bool(correct)}
+        try:
+            self._queue.put_nowait(row)
+            self._count('queued')
+        except queue.Full:
+            self._count('dropped')
+
+    def _write_loop(self):
+        while True:
+            rows = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(rows) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(attempts.insert(), rows)
+                self._count('written', len(rows))
+            except Exception:
+                logger.exception("학습 기록 %d개를 저장하지 못했습니다", len(rows))
+                self._count('failed_batches')
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+
+    def flush(self):
+        """대기 중인 기록이 모두 저장될 때까지 기다림"""
+        self._queue.join()
+
+    def learner_accuracy(self, learner_id):
+        """학습자의 (맞힌 횟수, 전체 시도 횟수)"""
+        query = (select(func.count().filter(attempts.c.correct), func.count())
+                 .where(attempts.c.learner_id == learner_id))
+        with self.engine.connect() as conn:
+            correct, total = conn.execute(query).one()
+        return correct or 0, total
+
+    def word_accuracy(self, learner_id=None, limit=None):
+        """단어별 (단어, 맞힌 횟수, 전체 시도 횟수), 정확도 낮은 순"""
+        correct = func.count().filter(attempts.c.correct)
+        total = func.count()
+        query = select(attempts.c.word, correct, total).group_by(attempts.c.word)
+        if learner_id is not None:
+            query = query.where(attempts.c.learner_id == learner_id)
+        query = query.order_by((correct * 1.0 / total).asc(), attempts.c.word)
+        if limit:
+            query = query.limit(limit)
+        with self.engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(query)]
+
+    def word_history(self, learner_id, words=None):
+        """학습자의 시도 기록 [(단어, 맞혔는지, 시각(epoch 초))], 오래된 순
+
+        words가 주어지면 그 단어들만 (주제별 복습 일정을 다시 만들 때 사용).
+        """
+        query = (select(attempts.c.word, attempts.c.correct, attempts.c.created_at)
+                 .where(attempts.c.learner_id == learner_id)
+                 .order_by(attempts.c.created_at, attempts.c.id))
+        if words is not None:
+            query = query.where(attempts.c.word.in_(list(words)))
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).all()
+        # func.now()는 시간대 없는 UTC 시각으로 저장됨
+        return [(word, bool(correct), created_at.replace(tzinfo=created_at.tzinfo or timezone.utc).timestamp())
+                for word, correct, created_at in rows]
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+        stats['pending'] = self._queue.qsize()
+        return stats
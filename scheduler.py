@@ -0,0 +1,96 @@
+"""간격 반복(Leitner 방식) 단어 선택
+
+맞히면 다음 상자로 올라가 더 오래 뒤에 다시 나오고, 틀리면 첫 상자로 돌아간다.
+복습 시각 순서의 힙을 사용하므로 다음 단어 선택은 O(log n)이다.
+"""
+import heapq
+import random
+import time
+
+# 상자별 다시 나올 때까지의 시간 (초)
+INTERVALS = [0, 60, 10 * 60, 60 * 60, 24 * 60 * 60]
+
+# 한 번 출제한 단어를 결과가 기록되기 전까지 다시 내지 않는 시간 (초)
+IN_FLIGHT_SECONDS = 5 * 60
+
+
+class LeitnerScheduler:
+    """학습자 한 명의 단어 복습 일정"""
+
+    def __init__(self, words, seed=None):
+        self._unseen = list(words)
+        self._words = set(self._unseen)
+        random.Random(seed).shuffle(self._unseen)
+        self._heap = []     # (복습 시각, 순번, 단어)
+        self._state = {}    # 단어 -> [상자, 복습 시각, 순번]
+        self._seq = 0
+
+    def _push(self, word, box, due):
+        self._seq += 1
+        self._state[word] = [box, due, self._seq]
+        heapq.heappush(self._heap, (due, self._seq, word))
+
+    def _pop_due(self, now):
+        """복습 시각이 지난 단어 하나 (힙의 오래된 항목은 건너뜀)"""
+        while self._heap and self._heap[0][0] <= now:
+            due, seq, word = heapq.heappop(self._heap)
+            if self._state[word][2] == seq:
+                return word
+        return None
+
+    def _pop_earliest(self):
+        while self._heap:
+            due, seq, word = heapq.heappop(self._heap)
+            if self._state[word][2] == seq:
+                return word
+        return None
+
+    def next_word(self, now=None):
+        """다음에 낼 단어: 복습할 단어 → 새 단어 → 가장 먼저 복습할 단어 순서"""
+        now = time.time() if now is None else now
+        word = self._pop_due(now)
+        if word is None and self._unseen:
+            word = self._unseen.pop()
+            self._state[word] = [0, now, 0]
+        if word is None:
+            word = self._pop_earliest()
+        if word is None:
+            return None
+        # 결과가 기록될 때까지 잠시 뒤로 미뤄 같은 묶음에 중복으로 나오지 않게 함
+        self._push(word, self._state[word][0], now + IN_FLIGHT_SECONDS)
+        return word
+
+    def next_batch(self, n, now=None):
+        """서로 다른 단어 n개를 한 번에 선택 (음성/뜻을 함께 미리 준비할 수 있도록)"""
+        now = time.time() if now is None else now
+        batch = []
+        for _ in range(n):
+            word = self.next_word(now)
+            if word is None or word in batch:
+                break
+            batch.append(word)
+        return batch
+
+    def record(self, word, correct, now=None):
+        """발음 결과 기록 후 다음 복습 시각 계산"""
+        now = time.time() if now is None else now
+        box = self._state.get(word, [0])[0]
+        box = min(box + 1, len(INTERVALS) - 1) if correct else 0
+        if word in self._unseen:
+            self._unseen.remove(word)
+        self._push(word, box, now + INTERVALS[box])
+
+    def replay(self, history):
+        """저장된 시도 기록 [(단어, 맞혔는지, 시각)]을 오래된 순으로 다시 적용
+
+        복습 일정은 세션 상태에만 있으므로 다시 접속하면 학습 기록 저장소(progress.py)에서
+        상자와 복습 시각을 복원한다. 이 일정에 없는 단어는 무시.
+        """
+        for word, correct, at in history:
+            if word in self._words:
+                self.record(word, correct, now=at)
+        return self
+
+    def box(self, word):
+        """단어의 현재 상자 번호 (처음 보는 단어는 0)"""
+        return self._state.get(word, [0])[0]
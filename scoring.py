@@ -0,0 +1,31 @@
+"""후보 단어 제한 발음 채점
+
+목표 단어와 단어장에서 고른 헷갈리기 쉬운 단어 몇 개만 후보로 두고 인식해
+목표 단어의 신뢰도를 점수로 쓴다. 자유 받아쓰기 후 문자열 비교보다 빠르고 정확하다.
+"""
+import difflib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _confusion_set(target, vocabulary, k):
+    return tuple(word for word in difflib.get_close_matches(target, vocabulary, n=k + 1, cutoff=0)
+                 if word != target)[:k]
+
+
+def confusion_set(target, vocabulary, k=4):
+    """목표 단어와 철자가 비슷한 단어 k개 (단어장에서 선택)"""
+    return list(_confusion_set(target, tuple(vocabulary), k))
+
+
+def candidates_for(target, vocabulary, k=4):
+    """채점 후보 단어 목록 (목표 단어 + 헷갈리기 쉬운 단어)"""
+    return [target] + confusion_set(target, vocabulary, k)
+
+
+def best_candidate(scores, floor=0.0):
+    """신뢰도가 가장 높은 단어 (모든 후보가 floor 이하면 아무것도 인식하지 못한 것으로 보고 None)"""
+    if not scores:
+        return None
+    word = max(scores, key=scores.get)
+    return word if scores[word] > floor else None
@@ -0,0 +1,61 @@
+"""녹음기 형식 WAV 만들기 (0.1초 440Hz, 왼쪽 채널 크기 0.5 / 오른쪽 0.25)
+
+    python tests/fixtures/make_audio_fixtures.py
+"""
+import os
+import struct
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SECONDS = 0.1
+
+PCM, FLOAT, EXTENSIBLE = 1, 3, 0xFFFE
+# KSDATAFORMAT_SUBTYPE_* GUID의 앞 2바이트 뒤에 붙는 공통 부분
+GUID_TAIL = b'\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
+
+def tone(rate, channels):
+    t = np.arange(int(rate * SECONDS)) / rate
+    left = 0.5 * np.sin(2 * np.pi * 440 * t)
+    return np.stack([left, left / 2][:channels], axis=1)
+
+
+def wav(samples, rate, tag, bits, extensible=False, data_size=None, extra_chunk=False):
+    channels = samples.shape[1]
+    if tag == FLOAT:
+        data = samples.astype('<f4').tobytes()
+    else:
+        data = (samples * 32767).astype('<i2').tobytes()
+    block = channels * bits // 8
+    fmt = struct.pack('<HHIIHH', EXTENSIBLE if extensible else tag, channels, rate, rate * block, block, bits)
+    if extensible:
+        mask = 0x3 if channels == 2 else 0x4
+        fmt += struct.pack('<HHI', 22, bits, mask) + struct.pack('<H', tag) + GUID_TAIL
+    chunks = b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+    if extra_chunk:
+        info = b'INFOISFT\x05\x00\x00\x00test\x00\x00'   # 홀수 길이 → 패딩 바이트
+        chunks += b'LIST' + struct.pack('<I', len(info) - 1) + info
+    chunks += b'data' + struct.pack('<I', len(data) if data_size is None else data_size) + data
+    return b'RIFF' + struct.pack('<I', 4 + len(chunks)) + b'WAVE' + chunks
+
+
+FIXTURES = {
+    'pcm16_44k_stereo.wav': lambda: wav(tone(44100, 2), 44100, PCM, 16, extra_chunk=True),
+    'pcm16_48k_stereo.wav': lambda: wav(tone(48000, 2), 48000, PCM, 16),
+    'float32_48k_mono.wav': lambda: wav(tone(48000, 1), 48000, FLOAT, 32),
+    'extensible_pcm16_48k_stereo.wav': lambda: wav(tone(48000, 2), 48000, PCM, 16, extensible=True),
+    'extensible_float32_44k_stereo.wav': lambda: wav(tone(44100, 2), 44100, FLOAT, 32, extensible=True),
+    # 녹음이 중간에 끊겨 data 크기가 채워지지 않은 파일 (브라우저 녹음기에서 흔함)
+    'oversized_data_48k_mono.wav': lambda: wav(tone(48000, 1), 48000, PCM, 16, data_size=0xFFFFFFFF),
+}
+
+
+def main():
+    for name, make in FIXTURES.items():
+        with open(os.path.join(HERE, name), 'wb') as f:
+            f.write(make())
+
+
+if __name__ == "__main__":
+    main()
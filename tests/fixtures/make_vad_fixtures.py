@@ -0,0 +1,52 @@
+"""VAD 테스트용 WAV 만들기 (16kHz 모노 16bit, 고정 시드라 다시 만들어도 같은 파일)
+
+    python tests/fixtures/make_vad_fixtures.py
+"""
+import os
+import wave
+
+import numpy as np
+
+RATE = 16000
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def db(level_db, samples):
+    """RMS가 level_db(dBFS)가 되도록 크기 조정"""
+    rms = np.sqrt(np.mean(np.square(samples)))
+    return samples * (32768 * 10 ** (level_db / 20) / rms)
+
+
+def voiced(seconds, rng):
+    """말소리 흉내: 음높이가 변하는 배음 + 음절 단위 진폭 변화 (-20dBFS)"""
+    t = np.arange(int(seconds * RATE)) / RATE
+    pitch = 180 + 40 * np.sin(2 * np.pi * 2 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / RATE
+    tone = sum(np.sin(h * phase) / h for h in range(1, 6))
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t) ** 2
+    return db(-20, tone * envelope + rng.normal(0, 0.05, len(t)))
+
+
+def write(name, samples):
+    with wave.open(os.path.join(HERE, name), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(RATE)
+        f.writeframes(np.clip(samples, -32768, 32767).astype('<i2').tobytes())
+
+
+def main():
+    rng = np.random.default_rng(0)
+    write('silence.wav', db(-75, rng.normal(0, 1, RATE // 2)))
+    # 무음 0.4s + 말소리 0.6s + 무음 0.8s
+    write('speech_padded.wav', np.concatenate([
+        db(-70, rng.normal(0, 1, int(0.4 * RATE))),
+        voiced(0.6, rng),
+        db(-70, rng.normal(0, 1, int(0.8 * RATE))),
+    ]))
+    # 말소리 기준(-45dBFS)보다 조용한 배경 잡음
+    write('noise.wav', db(-55, rng.normal(0, 1, RATE)))
+
+
+if __name__ == "__main__":
+    main()
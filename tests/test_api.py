@@ -0,0 +1,87 @@
+import pytest
+
+import api
+from audio_cache import AudioCache, cache_key
+
+
+class FakeBackend:
+    """조각 목록을 그대로 내보내는 합성 백엔드 (fail_after번째 조각 뒤에 실패)"""
+
+    mimetype = 'audio/mpeg'
+
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    def voice_key(self, gender):
+        return 'com'
+
+    def stream(self, text, lang, voice):
+        for n, chunk in enumerate(self.chunks):
+            if n == self.fail_after:
+                raise RuntimeError("합성 실패")
+            yield chunk
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    cache = AudioCache(str(tmp_path / 'audio'))
+    monkeypatch.setattr(api, 'get_audio_cache', lambda: cache)
+    api.app.config['TESTING'] = True
+    with api.app.test_client() as client:
+        client.cache = cache
+        yield client
+
+
+def use_backend(monkeypatch, backend):
+    monkeypatch.setattr(api, 'get_tts_backend', lambda: backend)
+
+
+def test_streamed_miss_is_not_cached_by_clients(client, monkeypatch):
+    use_backend(monkeypatch, FakeBackend([b'a', b'b']))
+    response = client.get('/api/speech?text=hello')
+    assert response.status_code == 200
+    assert response.data == b'ab'
+    assert response.headers.get('ETag') is None
+    assert response.cache_control.no_store
+    assert not response.cache_control.immutable
+
+
+def test_cached_hit_is_immutable(client, monkeypatch):
+    use_backend(monkeypatch, FakeBackend([b'a', b'b']))
+    assert client.get('/api/speech?text=hello').data == b'ab'
+
+    response = client.get('/api/speech?text=hello')
+    assert response.data == b'ab'
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age > 0
+    etag = response.headers['ETag'].strip('"')
+    assert etag == cache_key('hello', 'en', 'com')
+
+    again = client.get('/api/speech?text=hello', headers={'If-None-Match': f'"{etag}"'})
+    assert again.status_code == 304
+
+
+def test_failure_mid_stream_is_not_cached(client, monkeypatch):
+    use_backend(monkeypatch, FakeBackend([b'a', b'b'], fail_after=1))
+    with pytest.raises(RuntimeError):
+        client.get('/api/speech?text=hello').get_data()
+    assert client.cache.get(cache_key('hello', 'en', 'com')) is None
+
+
+def test_empty_stream(client, monkeypatch):
+    use_backend(monkeypatch, FakeBackend([]))
+    response = client.get('/api/speech?text=hello')
+    assert response.status_code == 502
+    assert client.cache.get(cache_key('hello', 'en', 'com')) is None
+
+
+def test_fallback_audio_is_never_served_as_immutable(client, monkeypatch):
+    import tts
+
+    use_backend(monkeypatch, FakeBackend([tts.FallbackAudio(b'gtts')]))
+    for _ in range(2):
+        response = client.get('/api/speech?text=hello')
+        assert response.data == b'gtts'
+        assert response.cache_control.no_store
+        assert response.headers.get('ETag') is None
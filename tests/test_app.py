@@ -0,0 +1,131 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('streamlit')
+
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import config  # noqa: E402
+from benchmarks import fakes  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """임시 캐시/DB와 가짜 gTTS로 app.py 실행"""
+    monkeypatch.chdir(ROOT)   # 앱이 ./image, ./data 상대 경로를 사용
+    monkeypatch.setattr(config, 'AUDIO_CACHE_DIR', str(tmp_path / 'audio'))
+    monkeypatch.setattr(config, 'AUDIO_BUNDLE_DIR', str(tmp_path / 'bundle'))
+    monkeypatch.setattr(config, 'GLOSS_STORE_PATH', str(tmp_path / 'glosses_ko.json'))
+    monkeypatch.setattr(config, 'DATABASE_URL', 'sqlite://')
+    monkeypatch.delitem(sys.modules, 'gtts', raising=False)
+    fakes.install_tts(fakes.FakeService())
+    st.cache_resource.clear()
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=30)
+    at.run()
+    yield at
+    st.cache_resource.clear()
+
+
+def click(at, label):
+    next(button for button in at.button if button.label == label).click().run()
+
+
+def test_character_choice_keeps_the_topic(app):
+    import words
+
+    click(app, 'Animals')
+    click(app, 'Girl')
+
+    assert not app.exception
+    assert app.session_state['selected_topic'] == 'Animals'
+    assert app.session_state['selected_gender'] == 'Girl'
+    animals = set(words.load(config.WORD_BANK_PATH).words_for('Animals'))
+    assert app.session_state['batch'] and set(app.session_state['batch']) <= animals
+    assert app.session_state['batch_topic'] == 'Animals'
+    assert app.session_state['batch_gender'] == 'Girl'
+
+
+def test_character_change_reschedules_with_new_voice(app):
+    click(app, 'Food')
+    assert app.session_state['batch_gender'] == 'Boy'
+    assert app.session_state['prefetcher'].context == ('Food', 'Boy')
+
+    click(app, 'Girl')
+    assert app.session_state['prefetcher'].context == ('Food', 'Girl')
+
+
+def fake_microphone(monkeypatch, recordings, heard):
+    """mic_recorder가 recordings를 차례로 돌려주고 음성 인식 결과는 heard"""
+    import types
+
+    import speech_recognition as sr
+
+    mic = types.ModuleType('streamlit_mic_recorder')
+    mic.mic_recorder = lambda **kwargs: recordings.pop(0) if recordings else None
+    monkeypatch.setitem(sys.modules, 'streamlit_mic_recorder', mic)
+    monkeypatch.setattr(sr.Recognizer, 'recognize_google', lambda self, audio_data, **kwargs: heard)
+
+
+def recording():
+    """mic_recorder가 돌려주는 녹음 dict"""
+    return {'bytes': fakes.fake_wav(seconds=0.5), 'sample_rate': 48000, 'sample_width': 2, 'id': 1}
+
+
+def test_recorder_stays_mounted_until_a_recording_arrives(app, monkeypatch):
+    # 처음엔 아직 녹음 전, 다음 실행에 녹음 도착
+    fake_microphone(monkeypatch, [None, recording()], 'zebra')
+
+    app.button(key='play_button_1').click().run()
+    app.button(key='mic_button_1').click().run()
+    assert app.session_state['recording'] == {1: True}
+    assert app.session_state['total_attempts'] == 0
+
+    app.run()   # 녹음 컴포넌트 값이 바뀌어 다시 실행됨 (MIC 버튼 값은 False)
+    assert not app.exception
+    assert app.session_state['total_attempts'] == 1
+    assert app.session_state['recording'] == {1: False}
+    assert any('zebra' in element.value for element in app.markdown)
+
+
+def test_acoustic_mode_without_feature_store_falls_back_to_similarity(app, monkeypatch, tmp_path):
+    monkeypatch.setattr(config, 'SCORING_MODE', 'acoustic')
+    monkeypatch.setattr(config, 'FEATURE_STORE_DIR', str(tmp_path / 'no-features'))
+    fake_microphone(monkeypatch, [recording()], 'zebra')
+
+    app.button(key='play_button_1').click().run()
+    word = app.session_state['current_word']
+    app.button(key='mic_button_1').click().run()
+
+    assert not app.exception
+    assert app.session_state['total_attempts'] == 1
+    assert any('zebra' in element.value for element in app.markdown)
+    assert any(f'목표 단어: {word}' in element.value for element in app.markdown)
+
+
+def test_topic_click_does_not_wait_for_gloss_prefetch(app, monkeypatch):
+    import threading
+
+    from translation import GlossStore
+
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_prefetch(self, words):
+        started.set()
+        release.wait(60)
+        return 0
+
+    monkeypatch.setattr(GlossStore, 'prefetch', slow_prefetch)
+    try:
+        # 번역이 끝나지 않아도 클릭 처리는 끝나야 함 (기다리면 AppTest 시간 초과)
+        next(button for button in app.button if button.label == 'Weather').click().run(timeout=10)
+        assert not app.exception
+        assert app.session_state['selected_topic'] == 'Weather'
+        assert started.wait(5)
+    finally:
+        release.set()
@@ -0,0 +1,53 @@
+import pytest
+import speech_recognition as sr
+
+from asr import GoogleBackend
+from scoring import best_candidate
+
+
+class FakeRecognizer:
+    def __init__(self, transcript):
+        self.transcript = transcript
+
+    def recognize_google(self, audio_data, language='en-US'):
+        if self.transcript is None:
+            raise sr.UnknownValueError()
+        return self.transcript
+
+
+@pytest.fixture
+def audio():
+    return sr.AudioData(b'\x00\x00' * 1600, sample_rate=16000, sample_width=2)
+
+
+def google(monkeypatch, transcript):
+    backend = GoogleBackend()
+    monkeypatch.setattr(backend, '_recognizer', lambda: FakeRecognizer(transcript))
+    return backend
+
+
+def test_google_scores_candidates_from_transcript(monkeypatch, audio):
+    scores = google(monkeypatch, 'Cat').score(audio, ['cat', 'cut', 'hat'])
+    assert set(scores) == {'cat', 'cut', 'hat'}
+    assert scores['cat'] == 1.0
+    assert scores['cut'] <= 0.8
+    assert best_candidate(scores) == 'cat'
+
+
+def test_google_score_for_other_word(monkeypatch, audio):
+    scores = google(monkeypatch, 'cut').score(audio, ['cat', 'cut'])
+    assert scores['cat'] <= 0.8
+    assert best_candidate(scores) == 'cut'
+
+
+def test_google_score_without_speech(monkeypatch, audio):
+    scores = google(monkeypatch, None).score(audio, ['cat', 'cut'])
+    assert scores == {'cat': 0.0, 'cut': 0.0}
+    # 목표 단어('cat')를 들은 것으로 보면 안 됨
+    assert best_candidate(scores) is None
+
+
+def test_best_candidate_floor():
+    assert best_candidate({}) is None
+    assert best_candidate({'cat': 0.2, 'cut': 0.1}, floor=0.3) is None
+    assert best_candidate({'cat': 0.2, 'cut': 0.4}, floor=0.3) == 'cut'
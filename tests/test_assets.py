@@ -0,0 +1,35 @@
+import glob
+import os
+
+import assets
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+IMAGE_DIR = os.path.join(ROOT, 'image')
+BUILD_DIR = os.path.join(IMAGE_DIR, 'build')
+
+
+def test_every_image_has_committed_variants():
+    # 실행 중 즉석 변환(프로세스마다 첫 화면이 느려짐)을 피하려면 모든 크기가 있어야 함
+    for path in glob.glob(os.path.join(IMAGE_DIR, '*.png')):
+        for width in set(assets.WIDTHS.values()):
+            variant = assets.variant_path(path, width, BUILD_DIR)
+            assert os.path.exists(variant), variant
+
+
+def test_load_reads_built_variant():
+    path = os.path.join(IMAGE_DIR, 'boy.png')
+    with open(assets.variant_path(path, assets.WIDTHS['row'], BUILD_DIR), 'rb') as f:
+        built = f.read()
+    assert assets.load(path, assets.WIDTHS['row'], BUILD_DIR) == built
+
+
+def test_load_falls_back_to_runtime_render(tmp_path):
+    from io import BytesIO
+
+    from PIL import Image
+
+    path = os.path.join(IMAGE_DIR, 'girl.png')
+    data = assets.load(path, 200, str(tmp_path))
+    with Image.open(BytesIO(data)) as image:
+        assert image.format == 'WEBP'
+        assert image.width == 200
@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tts
+from audio_cache import AudioCache, cache_key
+
+
+class SlowBackend:
+    """입력마다 고정된 bytes를 조금 늦게 돌려주는 합성 백엔드"""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text, lang, voice):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.002)
+        return f'{lang}:{voice}:{text}'.encode('utf-8') * 50
+
+
+def test_concurrent_render_and_put(tmp_path):
+    directory = tmp_path / 'audio'
+    cache = AudioCache(str(directory), max_items=8)
+    backend = SlowBackend()
+    texts = [f'word{n}' for n in range(20)]
+    jobs = [(texts[n % len(texts)], 'com' if n % 3 else 'co.uk') for n in range(400)]
+
+    def work(job):
+        text, voice = job
+        audio = tts.render(cache, text, voice, backend=backend)
+        # 같은 키에 다른 스레드가 같은 내용을 다시 저장해도 결과는 같아야 함
+        cache.put(cache_key(text, 'en', voice), audio)
+        return job, audio
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(work, jobs))
+    cache.flush()
+
+    for (text, voice), audio in results:
+        assert audio == backend.synthesize(text, 'en', voice)
+    assert not [name for name in os.listdir(directory) if name.endswith('.tmp')]
+
+    # 디스크에서 다시 읽어도 (메모리 캐시가 작아 대부분 밀려남) 키마다 맞는 내용
+    fresh = AudioCache(str(directory))
+    for text, voice in set(jobs):
+        assert fresh.get(cache_key(text, 'en', voice)) == backend.synthesize(text, 'en', voice)
+
+
+def test_disk_cap_with_concurrent_puts(tmp_path):
+    directory = tmp_path / 'audio'
+    cache = AudioCache(str(directory), max_items=4, max_bytes=20 * 1024)
+    payloads = {cache_key(f'w{n}', 'en', 'com'): bytes([n]) * 1024 for n in range(100)}
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda item: cache.put(*item), payloads.items()))
+    cache.flush()
+
+    names = os.listdir(directory)
+    assert not [name for name in names if name.endswith('.tmp')]
+    assert sum(os.path.getsize(directory / name) for name in names) <= 20 * 1024
+    for name in names:
+        assert (directory / name).read_bytes() == payloads[name[:-len('.mp3')]]
+
+
+def test_disk_files_use_backend_format_extension(tmp_path):
+    directory = tmp_path / 'audio'
+    old = AudioCache(str(directory))   # gTTS(mp3)로 저장해 둔 파일
+    old.put(cache_key('old', 'en', 'com'), b'x' * 100)
+    old.flush()
+
+    cache = AudioCache(str(directory), mimetype='audio/wav')
+    key = cache_key('apple', 'en', 'piper-boy.wav')
+    cache.put(key, b'RIFF' + b'\x00' * 100)
+    cache.flush()
+
+    assert os.path.exists(directory / f'{key}.wav')
+    assert not os.path.exists(directory / f'{key}.mp3')
+    assert AudioCache(str(directory), mimetype='audio/wav').get(key) == b'RIFF' + b'\x00' * 100
+    # 다른 형식의 파일도 디스크 용량에 들어감
+    assert cache.stats()['disk_bytes'] == 100 + 104
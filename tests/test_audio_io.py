@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+import pytest
+
+import audio_io
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 파일 이름 → (dtype, 채널 수, 샘플링 레이트, 16kHz 모노 변환 후 최대 크기)
+RECORDINGS = {
+    'pcm16_44k_stereo.wav': ('<i2', 2, 44100, 0.375),
+    'pcm16_48k_stereo.wav': ('<i2', 2, 48000, 0.375),
+    'float32_48k_mono.wav': ('<f4', 1, 48000, 0.5),
+    'extensible_pcm16_48k_stereo.wav': ('<i2', 2, 48000, 0.375),
+    'extensible_float32_44k_stereo.wav': ('<f4', 2, 44100, 0.375),
+    'oversized_data_48k_mono.wav': ('<i2', 1, 48000, 0.5),
+}
+
+
+def load(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def dominant_hz(samples, rate=audio_io.TARGET_RATE):
+    spectrum = np.abs(np.fft.rfft(samples.astype(np.float32)))
+    return np.fft.rfftfreq(len(samples), 1 / rate)[spectrum.argmax()]
+
+
+@pytest.mark.parametrize('name', sorted(RECORDINGS))
+def test_parse_wav_header(name):
+    dtype, channels, rate, _ = RECORDINGS[name]
+    parsed_dtype, parsed_channels, parsed_rate, payload = audio_io.parse_wav(load(name))
+    assert (parsed_dtype, parsed_channels, parsed_rate) == (np.dtype(dtype), channels, rate)
+    # data 크기가 실제보다 커도 파일 끝까지만, 샘플 단위로 잘림
+    assert len(payload) == int(rate * 0.1) * channels * np.dtype(dtype).itemsize
+
+
+@pytest.mark.parametrize('name', sorted(RECORDINGS))
+def test_wav_to_16k_mono(name):
+    *_, peak = RECORDINGS[name]
+    samples = audio_io.wav_to_pcm16k(load(name))
+    assert samples.dtype == np.int16
+    assert samples.ndim == 1                      # 모노
+    assert samples.size == 1600                   # 0.1초 × 16kHz
+    assert abs(np.abs(samples).max() / 32767 - peak) < 0.01
+    assert abs(dominant_hz(samples) - 440) <= 10
+
+
+@pytest.mark.parametrize('name', sorted(RECORDINGS))
+def test_mic_recorder_dict(name):
+    pcm = audio_io.to_pcm16k({'bytes': load(name), 'sample_rate': RECORDINGS[name][2]})
+    assert len(pcm) == 1600 * 2
+
+
+def test_wav_without_data_chunk():
+    with pytest.raises(audio_io.UnsupportedAudio):
+        audio_io.wav_to_pcm16k(b'RIFF\x00\x00\x00\x00WAVEjunk')
+
+
+def encode(container_format, codec, rate=48000, channels=2, seconds=0.5):
+    """PyAV로 440Hz 녹음 만들기 (브라우저 녹음기 출력 흉내)"""
+    av = pytest.importorskip('av')
+    from io import BytesIO
+
+    layout = 'stereo' if channels == 2 else 'mono'
+    t = np.arange(int(rate * seconds)) / rate
+    tone = (0.5 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
+    out = BytesIO()
+    with av.open(out, 'w', format=container_format) as container:
+        stream = container.add_stream(codec, rate=rate)
+        stream.layout = layout
+        # packed s16: 채널이 번갈아 오는 한 줄
+        frame = av.AudioFrame.from_ndarray(np.repeat(tone, channels).reshape(1, -1), format='s16', layout=layout)
+        frame.sample_rate = rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return out.getvalue()
+
+
+# 브라우저 녹음기 출력: Chrome/Firefox webm·ogg(opus), Safari mp4(aac)
+@pytest.mark.parametrize('container_format, codec, channels', [
+    ('webm', 'libopus', 2), ('webm', 'libopus', 1), ('ogg', 'libopus', 2), ('mp4', 'aac', 2),
+])
+def test_encoded_to_16k_mono(container_format, codec, channels):
+    samples = audio_io.encoded_to_pcm16k(encode(container_format, codec, channels=channels))
+    assert samples.dtype == np.int16
+    assert samples.ndim == 1
+    # 코덱 지연/패딩만큼 오차 허용 (0.5초 = 8000샘플)
+    assert abs(samples.size - 8000) <= 800
+    assert abs(dominant_hz(samples) - 440) <= 10
+    assert len(audio_io.to_pcm16k(encode(container_format, codec, channels=channels))) == samples.size * 2
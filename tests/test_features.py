@@ -0,0 +1,105 @@
+import json
+
+import numpy as np
+import pytest
+import speech_recognition as sr
+
+import features
+from audio_cache import save_manifest
+from audio_io import pcm16_to_wav
+from matcher import PASS_THRESHOLD
+from tts import VOICES
+
+RATE = 16000
+
+# 단어마다 다른 음높이 변화 (Hz, 구간별)
+WORDS = {
+    'apple': [200, 400, 300],
+    'ample': [200, 420, 600],
+    'cat': [500, 250],
+    'cut': [500, 900],
+    'dog': [150, 150, 700],
+    'dig': [350, 150, 700],
+}
+
+
+def utterance(pitches, shift=1.0, noise=0.0, seed=0):
+    """구간마다 음높이가 다른 '단어' 신호 (앞뒤 무음 포함), shift로 목소리 차이를 흉내 냄"""
+    rng = np.random.default_rng(seed)
+    parts = [np.zeros(RATE // 5)]
+    for pitch in pitches:
+        t = np.arange(RATE // 5) / RATE
+        tone = sum(np.sin(2 * np.pi * pitch * shift * h * t) / h for h in (1, 2, 3))
+        parts.append(tone * 6000)
+    parts.append(np.zeros(RATE // 5))
+    signal = np.concatenate(parts) + rng.normal(0, noise, sum(len(p) for p in parts))
+    return np.clip(signal, -32768, 32767).astype(np.int16)
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    bundle = tmp_path / 'bundle'
+    bundle.mkdir()
+    manifest = {}
+    for word, pitches in WORDS.items():
+        for n, (voice, tld) in enumerate(VOICES.items()):
+            key = features.cache_key(word, 'en', tld)
+            (bundle / f'{key}.wav').write_bytes(pcm16_to_wav(utterance(pitches, shift=1 + 0.04 * n).tobytes(), RATE))
+            manifest[key] = {'file': f'{key}.wav', 'text': word, 'tld': tld, 'voice': voice}
+    # 깨진 항목 하나: 저장소 생성은 계속되어야 함
+    (bundle / 'broken.wav').write_bytes(b'RIFF\x00\x00\x00\x00WAVEjunk')
+    manifest['broken'] = {'file': 'broken.wav', 'text': 'broken', 'tld': 'com', 'voice': 'Girl'}
+    manifest['missing'] = {'file': 'missing.wav', 'text': 'missing', 'tld': 'com', 'voice': 'Girl'}
+    save_manifest(str(bundle), manifest)
+
+    out = tmp_path / 'features'
+    assert features.build(str(bundle), str(out)) == len(WORDS) * len(VOICES)
+    return out
+
+
+def audio(samples):
+    return sr.AudioData(samples.tobytes(), sample_rate=RATE, sample_width=2)
+
+
+def test_build_writes_calibration(store_dir):
+    calibration = json.loads((store_dir / features.CALIBRATION_NAME).read_text())
+    assert calibration['pairs'] == len(WORDS)
+    assert 0 < calibration['same_ratio'] < 1
+    assert calibration['words'] == sorted(WORDS)
+
+
+@pytest.mark.parametrize('noise', [0, 150])
+def test_calibrated_scores_pass_same_word_only(store_dir, noise):
+    scorer = features.AcousticScorer(features.FeatureStore(str(store_dir)))
+    for word, pitches in WORDS.items():
+        # 기준 음성과 다른 목소리 + 잡음
+        scores = scorer.score(audio(utterance(pitches, shift=1.02, noise=noise, seed=1)), list(WORDS))
+        assert scores[word] > PASS_THRESHOLD, (word, scores)
+        assert all(score <= PASS_THRESHOLD for other, score in scores.items() if other != word), (word, scores)
+
+
+def test_unknown_word_scores_zero(store_dir):
+    scorer = features.AcousticScorer(features.FeatureStore(str(store_dir)))
+    assert scorer.score(audio(utterance(WORDS['cat'])), ['zebra']) == {'zebra': 0.0}
+
+
+def test_default_calibration():
+    offset, scale = features.fit_scale(features.DEFAULT_SAME_RATIO)
+    scorer = features.AcousticScorer.__new__(features.AcousticScorer)
+    scorer.offset, scorer.scale = offset, scale
+    assert scorer.to_score(features.DEFAULT_SAME_RATIO) == 1.0
+    assert scorer.to_score((features.DEFAULT_SAME_RATIO + 1) / 2) == pytest.approx(PASS_THRESHOLD)
+    assert scorer.to_score(1.0) == pytest.approx(features.WRONG_SCORE)
+
+
+def test_store_with_every_entry_skipped_is_empty(tmp_path):
+    bundle = tmp_path / 'bundle'
+    bundle.mkdir()
+    (bundle / 'broken.wav').write_bytes(b'RIFF\x00\x00\x00\x00WAVEjunk')
+    save_manifest(str(bundle), {'broken': {'file': 'broken.wav', 'text': 'broken', 'tld': 'com', 'voice': 'Girl'}})
+
+    out = tmp_path / 'features'
+    assert features.build(str(bundle), str(out)) == 0
+    store = features.FeatureStore(str(out))
+    assert len(store) == 0
+    assert store.references('broken') == []
@@ -0,0 +1,157 @@
+import csv
+import io
+import json
+import wave
+import zipfile
+from functools import partial
+
+import numpy as np
+import pytest
+
+import grade
+
+
+class FakeGrader:
+    """정답을 그대로 돌려주는 채점기 (fail에 있는 단어는 오류)"""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+
+    def grade(self, samples, word):
+        if word in self.fail:
+            raise ConnectionError("recognition service unavailable")
+        return word, 1.0
+
+
+def wav_bytes(seconds=0.5, rate=16000):
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def recordings(tmp_path):
+    folder = tmp_path / 'recordings'
+    folder.mkdir()
+    for name in ['apple_1.wav', 'cat_1.wav', 'dog_1.wav']:
+        (folder / name).write_bytes(wav_bytes())
+    return folder
+
+
+def read_rows(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        if str(path).endswith('.jsonl'):
+            return [json.loads(line) for line in f]
+        return list(csv.DictReader(f))
+
+
+def read_rows_lenient(path):
+    """끊긴 줄은 건너뛰고 읽음"""
+    if str(path).endswith('.jsonl'):
+        rows = []
+        for line in path.read_text(encoding='utf-8').splitlines():
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                pass
+        return rows
+    return read_rows(path)
+
+
+@pytest.mark.parametrize('report_name', ['report.csv', 'report.jsonl'])
+def test_error_rows_are_retried(recordings, tmp_path, report_name):
+    report = str(tmp_path / report_name)
+    assert grade.run(str(recordings), report, workers=1, factory=partial(FakeGrader, ['dog'])) == (3, 1)
+    assert grade.run(str(recordings), report, workers=1, factory=FakeGrader) == (1, 0)
+    assert grade.run(str(recordings), report, workers=1, factory=FakeGrader) == (0, 0)
+
+    rows = read_rows(report)
+    assert sorted(row['file'] for row in rows[:3]) == ['apple_1.wav', 'cat_1.wav', 'dog_1.wav']
+    assert len(rows) == 4
+    assert rows[-1]['file'] == 'dog_1.wav'
+    assert not rows[-1]['error']
+
+
+@pytest.mark.parametrize('report_name', ['report.csv', 'report.jsonl'])
+def test_resume_after_truncated_last_line(recordings, tmp_path, report_name):
+    report = tmp_path / report_name
+    assert grade.run(str(recordings), str(report), workers=2, factory=FakeGrader) == (3, 0)
+
+    # 마지막 줄을 쓰다가 끊긴 상태로 만듦
+    lines = report.read_text(encoding='utf-8').splitlines(keepends=True)
+    last = json.loads(lines[-1])['file'] if report_name.endswith('.jsonl') else lines[-1].split(',')[0]
+    report.write_text(''.join(lines[:-1]) + lines[-1][:8], encoding='utf-8')
+
+    assert grade.run(str(recordings), str(report), workers=2, factory=FakeGrader) == (1, 0)
+    assert grade.Report(str(report)).done == {'apple_1.wav', 'cat_1.wav', 'dog_1.wav'}
+    rows = [row for row in read_rows_lenient(report) if row.get('seconds') not in (None, '')]
+    assert sorted(row['file'] for row in rows) == ['apple_1.wav', 'cat_1.wav', 'dog_1.wav']
+    assert rows[-1]['file'] == last
+
+
+def test_targets_csv_maps_files_to_words(tmp_path):
+    source = tmp_path / 'class1.zip'
+    with zipfile.ZipFile(source, 'w') as archive:
+        archive.writestr('class1/targets.csv', 'file,word,learner_id\nkim.wav, Apple ,kim\nlee.wav,cat,lee\n'
+                                               'missing.wav,dog,park\n')
+        archive.writestr('class1/kim.wav', wav_bytes())
+        archive.writestr('class1/lee.wav', wav_bytes())
+        archive.writestr('class1/extra_1.wav', wav_bytes())   # targets.csv에 없으면 채점하지 않음
+
+    clips = grade.load_clips(grade.Archive(str(source)))
+    assert clips == [grade.Clip('class1/kim.wav', 'apple', 'kim'), grade.Clip('class1/lee.wav', 'cat', 'lee'),
+                     grade.Clip('class1/missing.wav', 'dog', 'park')]
+
+    report = tmp_path / 'report.csv'
+    assert grade.run(str(source), str(report), workers=1, factory=FakeGrader) == (3, 1)
+    rows = {row['file']: row for row in read_rows(report)}
+    assert rows['class1/kim.wav']['transcript'] == 'apple'
+    assert rows['class1/kim.wav']['learner_id'] == 'kim'
+    assert rows['class1/kim.wav']['correct'] == 'True'
+    assert rows['class1/missing.wav']['error'].startswith('KeyError')
+
+
+def test_file_name_prefix_is_target_word(recordings):
+    clips = grade.load_clips(grade.Archive(str(recordings)))
+    assert [(clip.name, clip.word) for clip in clips] == [
+        ('apple_1.wav', 'apple'), ('cat_1.wav', 'cat'), ('dog_1.wav', 'dog')]
+
+
+class ScoringBackend:
+    def __init__(self, scores):
+        self.scores = scores
+
+    def score(self, audio_data, candidates):
+        return {word: self.scores.get(word, 0.0) for word in candidates}
+
+
+def constrained_grader(scores):
+    grader = grade.Grader.__new__(grade.Grader)   # 인식 모델 없이
+    grader.mode = 'constrained'
+    grader.vocabulary = ['cat', 'cut', 'hat', 'bat']
+    grader.backend = ScoringBackend(scores)
+    return grader
+
+
+def test_constrained_grade_with_nothing_recognized():
+    samples = np.full(1600, 1000, dtype=np.int16)
+    assert constrained_grader({}).grade(samples, 'cat') == (None, 0.0)
+    assert constrained_grader({'cut': 0.9, 'cat': 0.2}).grade(samples, 'cat') == ('cut', 0.2)
+
+
+def test_correct_follows_pass_threshold(monkeypatch):
+    class CloseGrader:
+        def grade(self, samples, word):
+            return word, 0.85
+
+    grade._init_worker(CloseGrader)
+    clip = grade.Clip('cat_1.wav', 'cat', '')
+    assert grade._grade(clip, wav_bytes())['correct'] is True
+    monkeypatch.setattr('matcher.PASS_THRESHOLD', 0.9)
+    assert grade._grade(clip, wav_bytes())['correct'] is False
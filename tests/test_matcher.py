@@ -0,0 +1,37 @@
+import pytest
+
+import matcher
+
+# 모음 하나만 다른 단어 쌍: 발음 연습에서 틀렸다고 알려줘야 함
+MINIMAL_PAIRS = [
+    ('cat', 'cut'), ('bed', 'bad'), ('dog', 'dig'), ('book', 'bike'),
+    ('ship', 'sheep'), ('hot', 'hat'), ('rain', 'run'), ('pen', 'pin'),
+]
+
+
+@pytest.mark.parametrize('target, heard', MINIMAL_PAIRS)
+def test_minimal_pairs_are_not_correct(target, heard):
+    assert matcher.similarity(target, heard) <= matcher.PASS_THRESHOLD
+    assert matcher.similarity(heard, target) <= matcher.PASS_THRESHOLD
+
+
+@pytest.mark.parametrize('target, heard', MINIMAL_PAIRS)
+def test_phonetic_key_keeps_vowels(target, heard):
+    assert matcher.phonetic_key(target) != matcher.phonetic_key(heard)
+
+
+@pytest.mark.parametrize('target, heard', [('two', 'too'), ('phone', 'fone'), ('night', 'nite')])
+def test_phonetic_match_is_capped_below_pass(target, heard):
+    assert matcher.similarity(target, heard) <= matcher.PASS_THRESHOLD
+
+
+@pytest.mark.parametrize('target, heard', [
+    ('apple', 'apple'), ('apple', 'Apple.'), ('apple', 'I said apple'), ('café', 'cafe'),
+])
+def test_same_word_is_correct(target, heard):
+    assert matcher.similarity(target, heard) == 1.0
+
+
+def test_empty_transcript():
+    assert matcher.similarity('apple', '') == 0.0
+    assert matcher.similarity('apple', '...') == 0.0
@@ -0,0 +1,19 @@
+import metrics
+
+
+def test_disabled_metrics_record_nothing(monkeypatch):
+    monkeypatch.setattr(metrics, 'enabled', False)
+    metrics.observe('test.disabled', 0.5)
+    metrics.incr('test.disabled')
+    with metrics.span('test.disabled'):
+        pass
+
+    snapshot = metrics.snapshot()
+    assert 'test.disabled' not in snapshot['stages']
+    assert 'test.disabled' not in snapshot['counters']
+
+
+def test_enabled_metrics_record_observations(monkeypatch):
+    monkeypatch.setattr(metrics, 'enabled', True)
+    metrics.observe('test.enabled', 0.5)
+    assert metrics.snapshot()['stages']['test.enabled']['count'] >= 1
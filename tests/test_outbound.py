@@ -0,0 +1,171 @@
+import threading
+import time
+
+import pytest
+
+import outbound
+from benchmarks.fakes import FakeService, TooManyRequests
+from outbound import CircuitOpen, OutboundBackend, TokenBucket
+from translation import GlossStore
+
+
+def concurrent(clients, fn):
+    """clients개 스레드가 동시에 fn() 호출 → 결과 목록"""
+    barrier = threading.Barrier(clients)
+    results = [None] * clients
+
+    def client(n):
+        barrier.wait()
+        results[n] = fn()
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_same_key_calls_are_coalesced():
+    service = FakeService(latency=0.1)
+    backend = OutboundBackend('test', max_concurrency=10)
+
+    def call():
+        service.call()
+        return 'audio'
+
+    results = concurrent(10, lambda: backend.call(('apple', 'en', 'com'), call))
+    assert results == ['audio'] * 10
+    assert service.stats()['calls'] == 1
+    assert backend.stats()['coalesced'] == 9
+    assert backend.stats()['in_flight'] == 0
+
+
+def test_coalesced_callers_share_the_error():
+    backend = OutboundBackend('test', max_concurrency=10, failure_threshold=100)
+    service = FakeService(latency=0.1, error_rate=1.0, error=TooManyRequests)
+    errors = []
+
+    def call():
+        try:
+            backend.call('apple', service.call)
+        except TooManyRequests as e:
+            errors.append(e)
+
+    concurrent(10, call)
+    assert len(errors) == 10
+    assert service.stats()['calls'] == 1
+
+
+def test_calls_without_key_are_not_coalesced():
+    service = FakeService(latency=0.05)
+    backend = OutboundBackend('test', max_concurrency=10)
+    concurrent(10, lambda: backend.call(None, service.call))
+    assert service.stats()['calls'] == 10
+
+
+def test_concurrency_limit():
+    service = FakeService(latency=0.05)
+    backend = OutboundBackend('test', max_concurrency=2)
+    concurrent(8, lambda: backend.call(None, service.call))
+    assert service.stats()['concurrent_max'] <= 2
+
+
+def test_token_bucket_spaces_calls():
+    bucket = TokenBucket(rate=20, burst=2)
+    start = time.monotonic()
+    waited = sum(bucket.acquire() for _ in range(8))
+    # burst 2개는 바로, 나머지 6개는 초당 20개씩
+    assert time.monotonic() - start >= 6 / 20 * 0.9
+    assert waited > 0
+
+
+def test_token_bucket_disabled():
+    assert TokenBucket(rate=0, burst=1).acquire() == 0.0
+
+
+def test_breaker_opens_after_consecutive_429():
+    service = FakeService(error_rate=1.0, error=TooManyRequests)
+    backend = OutboundBackend('test', failure_threshold=3, reset_timeout=60)
+    for _ in range(3):
+        with pytest.raises(TooManyRequests):
+            backend.call(None, service.call)
+    start = time.monotonic()
+    for _ in range(10):
+        with pytest.raises(CircuitOpen):
+            backend.call(None, service.call)
+    assert time.monotonic() - start < 0.1     # 열린 뒤에는 서비스를 기다리지 않음
+    assert service.stats()['calls'] == 3
+    assert backend.stats()['rejected'] == 10
+    assert backend.stats()['circuit_open'] == 1
+
+
+def test_non_failures_do_not_open_breaker():
+    backend = OutboundBackend('test', failure_threshold=2, is_failure=lambda e: not isinstance(e, KeyError))
+    for _ in range(5):
+        with pytest.raises(KeyError):
+            backend.call(None, lambda: {}['missing'])
+    assert backend.breaker.state == 'closed'
+
+
+def test_half_open_trial_recovers():
+    service = FakeService(error_rate=1.0, error=TooManyRequests)
+    backend = OutboundBackend('test', failure_threshold=2, reset_timeout=0.2)
+    for _ in range(2):
+        with pytest.raises(TooManyRequests):
+            backend.call(None, service.call)
+    with pytest.raises(CircuitOpen):
+        backend.call(None, service.call)
+
+    time.sleep(0.25)
+    service.error_rate = 0.0
+    backend.call(None, service.call)       # 시험 호출 성공 → 닫힘
+    assert backend.breaker.state == 'closed'
+    backend.call(None, service.call)
+    assert service.stats()['calls'] == 4
+
+
+def test_half_open_allows_single_trial_and_reopens_on_failure():
+    service = FakeService(latency=0.1, error_rate=1.0, error=TooManyRequests)
+    backend = OutboundBackend('test', max_concurrency=5, failure_threshold=1, reset_timeout=0.2)
+    with pytest.raises(TooManyRequests):
+        backend.call(None, service.call)
+
+    time.sleep(0.25)
+    outcomes = []
+
+    def call():
+        try:
+            backend.call(None, service.call)
+        except (TooManyRequests, CircuitOpen) as e:
+            outcomes.append(type(e))
+
+    concurrent(5, call)
+    assert sorted(outcomes, key=lambda error: error.__name__) == [CircuitOpen] * 4 + [TooManyRequests]
+    assert backend.breaker.state == 'open'
+    assert service.stats()['calls'] == 2
+
+
+class BlockedTranslator:
+    def __init__(self, service):
+        self.service = service
+
+    def translate(self, text, dest='ko'):
+        self.service.call()
+
+
+def test_stale_gloss_is_served_while_translation_is_blocked(tmp_path, monkeypatch):
+    monkeypatch.setitem(outbound._backends, 'translate',
+                        OutboundBackend('translate', failure_threshold=3, reset_timeout=60))
+    service = FakeService(error_rate=1.0, error=TooManyRequests)
+    store = GlossStore(str(tmp_path / 'glosses.json'), ttl=0)
+    store._entries['apple'] = {'text': '사과', 'source': 'google', 'ts': 0}   # 이미 만료된 값
+    store._translator = BlockedTranslator(service)
+
+    assert [store.lookup('apple') for _ in range(10)] == ['사과'] * 10
+    assert store.lookup('banana') is None
+    assert service.stats()['calls'] == 3
+    stats = store.stats()
+    assert stats['stale_fallbacks'] == 10
+    assert stats['failures'] == 3
+    assert stats['circuit_open'] == 8
@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from prefetch import Prefetcher, PreparedWord
+
+
+def gated(release, size):
+    """release가 열릴 때까지 기다렸다가 size바이트 음성을 돌려주는 준비 함수"""
+    def prepare(word):
+        release.wait(5)
+        return PreparedWord(word, b'x' * size, word)
+    return prepare
+
+
+def ready_bytes(prefetcher):
+    with prefetcher._lock:
+        return sum(len(future.result().audio) for future in prefetcher._items.values()
+                   if future.done() and not future.cancelled() and future.exception() is None)
+
+
+def test_byte_limit_is_enforced_when_items_complete():
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        prefetcher = Prefetcher(executor, max_items=10, max_bytes=250)
+        prefetcher.schedule(['a', 'b', 'c', 'd'], gated(release, 100))
+        assert prefetcher.stats()['pending'] == 4   # 예약할 때는 아직 용량이 0
+
+        release.set()   # 다음 schedule 없이 작업만 끝남
+        executor.shutdown(wait=True)
+
+    assert ready_bytes(prefetcher) <= 250
+    stats = prefetcher.stats()
+    assert stats['ready'] == 2
+    assert stats['evicted'] == 2
+    # 나중에 쓸 단어부터 버림
+    assert prefetcher.take('a').word == 'a'
+    assert prefetcher.take('b').word == 'b'
+    assert prefetcher.take('d') is None
+
+
+def test_already_finished_items_do_not_deadlock():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        prefetcher = Prefetcher(executor, max_items=2, max_bytes=1000)
+        done = threading.Event()
+        done.set()
+        for word in ['a', 'b', 'c', 'd']:
+            prefetcher.schedule([word], gated(done, 10))
+        executor.shutdown(wait=True)
+
+    stats = prefetcher.stats()
+    assert stats['ready'] + stats['pending'] <= 2
+    assert prefetcher.take('a').audio == b'x' * 10
+
+
+def test_cancelled_items_are_ignored():
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prefetcher = Prefetcher(executor, max_items=10, max_bytes=1000)
+        prefetcher.schedule(['a', 'b', 'c'], gated(release, 10))
+        prefetcher.reset(('Animals', 'Girl'))
+        release.set()
+        executor.shutdown(wait=True)
+
+    stats = prefetcher.stats()
+    assert stats['cancelled'] == 2   # 실행 중이던 'a'는 취소되지 않음
+    assert stats['ready'] == stats['pending'] == 0
+
+
+def test_next_word_survives_eviction():
+    done = threading.Event()
+    done.set()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        prefetcher = Prefetcher(executor, max_items=3, max_bytes=1000)
+        prefetcher.schedule(['next', 'second', 'third'], gated(done, 10))
+        prefetcher.schedule(['fourth', 'fifth'], gated(done, 10))   # 개수 상한 초과
+        executor.shutdown(wait=True)
+
+    assert prefetcher.stats()['evicted'] == 2
+    assert prefetcher.take('next').word == 'next'
+    assert prefetcher.take('second').word == 'second'
+    assert prefetcher.take('fifth') is None
@@ -0,0 +1,93 @@
+import hashlib
+import json
+
+import pytest
+
+import presynth
+from audio_cache import AudioCache, MANIFEST_NAME, cache_key, load_manifest
+from tts import VOICES
+from words import all_words
+
+
+def fake_gtts(text, lang='en', tld='com'):
+    return b'ID3' + f'{lang}:{tld}:{text}'.encode('utf-8')
+
+
+def test_stub_bundle_is_not_served(tmp_path):
+    bundle = tmp_path / 'bundle'
+    done, failed = presynth.run(str(bundle), 'stub', workers=2)
+    assert failed == 0 and done == len(all_words()) * len(VOICES)
+
+    cache = AudioCache(str(tmp_path / 'audio'), bundle_dir=str(bundle))
+    assert cache.get(cache_key(all_words()[0], 'en', VOICES['Boy'])) is None
+    assert cache.stats()['bundle_hits'] == 0
+
+
+def test_gtts_run_replaces_stub_entries(tmp_path, monkeypatch):
+    monkeypatch.setitem(presynth.BACKENDS, 'gtts', fake_gtts)
+    bundle = tmp_path / 'bundle'
+    presynth.run(str(bundle), 'stub', workers=2)
+    assert len(presynth.plan_jobs(all_words(), load_manifest(str(bundle)), str(bundle), 'stub')) == 0
+    assert len(presynth.plan_jobs(all_words(), load_manifest(str(bundle)), str(bundle), 'gtts')) == \
+        len(all_words()) * len(VOICES)
+
+    done, _ = presynth.run(str(bundle), 'gtts', workers=2)
+    assert done == len(all_words()) * len(VOICES)
+    manifest = load_manifest(str(bundle))
+    assert {entry['backend'] for entry in manifest.values()} == {'gtts'}
+    assert all(entry['file'].startswith('gtts/') for entry in manifest.values())
+    assert presynth.run(str(bundle), 'gtts', workers=2) == (0, 0)
+
+    word = all_words()[0]
+    cache = AudioCache(str(tmp_path / 'audio'), bundle_dir=str(bundle))
+    assert cache.get(cache_key(word, 'en', VOICES['Girl'])) == fake_gtts(word, tld=VOICES['Girl'])
+    assert cache.stats()['bundle_hits'] == 1
+
+
+def test_bundle_entry_with_wrong_sha256_is_ignored(tmp_path):
+    bundle = tmp_path / 'bundle'
+    (bundle / 'gtts').mkdir(parents=True)
+    key = cache_key('apple', 'en', 'com')
+    (bundle / 'gtts' / f'{key}.mp3').write_bytes(b'ID3 truncated')
+    manifest = {key: {'file': f'gtts/{key}.mp3', 'backend': 'gtts',
+                      'sha256': hashlib.sha256(b'ID3 full audio').hexdigest()}}
+    (bundle / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+    cache = AudioCache(str(tmp_path / 'audio'), bundle_dir=str(bundle))
+    assert cache.get(key) is None
+    assert cache.stats()['bundle_hits'] == 0
+
+
+def flaky_service(failures, threshold=2, reset=0.3):
+    """처음 failures번 실패하는 합성 함수 (회로 차단기를 거쳐 호출)"""
+    from outbound import OutboundBackend
+
+    service = OutboundBackend('tts-test', failure_threshold=threshold, reset_timeout=reset)
+    calls = []
+
+    def synthesize(text, lang='en', tld='com'):
+        def send():
+            calls.append(text)
+            if len(calls) <= failures:
+                raise ConnectionError("upstream error")
+            return fake_gtts(text, lang, tld)
+        return service.call(None, send)
+    return synthesize, service, calls
+
+
+def test_retry_waits_out_open_circuit():
+    synthesize, service, calls = flaky_service(failures=2)
+    audio = presynth.synthesize_with_retry(synthesize, 'cat', 'com', retries=4, base_delay=0.01)
+    assert audio == fake_gtts('cat', tld='com')
+    assert len(calls) == 3                     # 실패 2번(회로 열림) → 기다린 뒤 시험 호출 성공
+    assert service.stats()['rejected'] >= 1    # 열린 동안의 호출은 재시도 횟수를 쓰지 않음
+
+
+def test_retry_gives_up_when_circuit_stays_open():
+    from outbound import CircuitOpen
+
+    synthesize, _, calls = flaky_service(failures=100, reset=60)
+    with pytest.raises(CircuitOpen):
+        presynth.synthesize_with_retry(synthesize, 'cat', 'com', retries=4, base_delay=0.01,
+                                       circuit_poll=0.05, max_circuit_wait=0.2)
+    assert len(calls) == 2
@@ -0,0 +1,24 @@
+from progress import ProgressStore
+
+
+def test_memory_database_is_shared_with_writer_thread():
+    store = ProgressStore('sqlite:///:memory:', flush_interval=0.01)
+    store.record_attempt('kim', 'apple', 0.95, True)
+    store.record_attempt('kim', 'apple', 0.4, False)
+    store.record_attempt('lee', 'cat', 0.9, True)
+    store.flush()
+
+    assert store.stats()['failed_batches'] == 0
+    assert store.stats()['written'] == 3
+    assert store.learner_accuracy('kim') == (1, 2)
+    assert store.word_accuracy('kim') == [('apple', 1, 2)]
+
+
+def test_file_database_keeps_attempts_across_stores(tmp_path):
+    url = f'sqlite:///{tmp_path / "db" / "progress.db"}'
+    store = ProgressStore(url, flush_interval=0.01)
+    store.record_attempt('kim', 'apple', 0.95, True)
+    store.flush()
+
+    assert ProgressStore(url).learner_accuracy('kim') == (1, 1)
+    assert ProgressStore(url).learner_accuracy('nobody') == (0, 0)
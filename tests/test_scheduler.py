@@ -0,0 +1,78 @@
+from scheduler import IN_FLIGHT_SECONDS, INTERVALS, LeitnerScheduler
+
+
+def test_next_batch_is_distinct_new_words():
+    scheduler = LeitnerScheduler(['a', 'b', 'c', 'd'], seed=1)
+    batch = scheduler.next_batch(3, now=0)
+    assert len(batch) == len(set(batch)) == 3
+    assert set(batch) <= {'a', 'b', 'c', 'd'}
+
+
+def test_in_flight_words_are_held_back():
+    scheduler = LeitnerScheduler(['a', 'b', 'c'], seed=1)
+    scheduler.record('c', False, now=0)   # 상자 0: 바로 복습
+    assert scheduler.next_word(now=0) == 'c'
+    # 결과가 기록되기 전에는 복습할 단어로 다시 나오지 않고 새 단어가 먼저 나옴
+    assert scheduler.next_word(now=IN_FLIGHT_SECONDS - 1) in {'a', 'b'}
+    assert scheduler.next_word(now=IN_FLIGHT_SECONDS) == 'c'
+
+
+def test_next_batch_stops_instead_of_repeating_a_word():
+    scheduler = LeitnerScheduler(['a', 'b'], seed=1)
+    assert sorted(scheduler.next_batch(5, now=0)) == ['a', 'b']
+
+
+def test_due_words_come_before_new_words():
+    scheduler = LeitnerScheduler(['a', 'b', 'c'], seed=1)
+    scheduler.record('a', False, now=0)   # 상자 0: 바로 복습
+    assert scheduler.next_word(now=1) == 'a'
+
+
+def test_correct_answer_promotes_and_wrong_answer_demotes():
+    scheduler = LeitnerScheduler(['a', 'b'], seed=1)
+    for expected in range(1, len(INTERVALS)):
+        scheduler.record('a', True, now=0)
+        assert scheduler.box('a') == expected
+    scheduler.record('a', True, now=0)
+    assert scheduler.box('a') == len(INTERVALS) - 1   # 마지막 상자에서 멈춤
+    scheduler.record('a', False, now=0)
+    assert scheduler.box('a') == 0
+
+
+def test_promoted_word_waits_for_its_interval():
+    scheduler = LeitnerScheduler(['a', 'b'], seed=1)
+    scheduler.record('a', True, now=0)
+    scheduler.record('b', True, now=0)
+    scheduler.record('b', True, now=0)
+    # 'a'(상자 1)가 'b'(상자 2)보다 먼저 복습 시각이 됨
+    assert scheduler.next_word(now=INTERVALS[1]) == 'a'
+    scheduler.record('a', True, now=INTERVALS[1])   # 상자 2로, 'b'보다 늦게 복습
+    assert scheduler.next_word(now=INTERVALS[2]) == 'b'
+
+
+def test_replay_restores_boxes_from_history():
+    history = [('a', True, 0), ('a', True, 10), ('b', False, 20), ('zebra', True, 30)]
+    scheduler = LeitnerScheduler(['a', 'b', 'c'], seed=1).replay(history)
+    assert scheduler.box('a') == 2
+    assert scheduler.box('b') == 0
+    assert scheduler.box('zebra') == 0   # 일정에 없는 단어는 무시
+    # 틀린 'b'는 바로 복습, 다음은 새 단어 'c' ('a'는 상자 2 간격 뒤)
+    assert scheduler.next_batch(2, now=30) == ['b', 'c']
+
+
+def test_scheduler_is_seeded_from_progress_store():
+    from progress import ProgressStore
+
+    store = ProgressStore('sqlite:///:memory:', flush_interval=0.01)
+    store.record_attempt('seed-test', 'apple', 0.95, True)
+    store.record_attempt('seed-test', 'apple', 0.9, True)
+    store.record_attempt('seed-test', 'cat', 0.3, False)
+    store.record_attempt('someone-else', 'cat', 0.9, True)
+    store.flush()
+
+    history = store.word_history('seed-test', ['apple', 'cat'])
+    assert [(word, correct) for word, correct, _ in history] == [('apple', True), ('apple', True), ('cat', False)]
+    scheduler = LeitnerScheduler(['apple', 'cat', 'dog']).replay(history)
+    assert scheduler.box('apple') == 2
+    assert scheduler.box('cat') == 0
+    assert store.word_history('seed-test', ['dog']) == []
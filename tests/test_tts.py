@@ -0,0 +1,122 @@
+import io
+import sys
+import types
+import wave
+
+import numpy as np
+import pytest
+
+import tts
+from audio_io import pcm16_to_wav
+
+
+class FakeConfig:
+    sample_rate = 22050
+
+
+class FakeChunk:
+    def __init__(self, samples):
+        self.audio_int16_bytes = samples.tobytes()
+        self.sample_rate = FakeConfig.sample_rate
+
+
+class FakeVoice:
+    """piper-tts 1.3 API: synthesize(text)가 조각을 돌려줌 ('!'는 실패)"""
+
+    config = FakeConfig()
+
+    @classmethod
+    def load(cls, path):
+        return cls()
+
+    def synthesize(self, text):
+        if '!' in text:
+            raise RuntimeError("onnxruntime error")
+        for word in text.split():
+            if any(char.isalnum() for char in word):
+                yield FakeChunk(np.full(2205, 1000, dtype=np.int16))
+
+
+class FakeGtts:
+    name = 'gtts'
+
+    def __init__(self):
+        self.calls = []
+
+    def voice_key(self, gender):
+        return tts.VOICES[gender]
+
+    def synthesize(self, text, lang, voice):
+        self.calls.append((text, voice))
+        return pcm16_to_wav(np.full(1600, 500, dtype=np.int16).tobytes(), 16000)
+
+
+@pytest.fixture(autouse=True)
+def fake_piper(monkeypatch):
+    package = types.ModuleType('piper')
+    module = types.ModuleType('piper.voice')
+    module.PiperVoice = FakeVoice
+    monkeypatch.setitem(sys.modules, 'piper', package)
+    monkeypatch.setitem(sys.modules, 'piper.voice', module)
+
+
+def read_wav(data):
+    with wave.open(io.BytesIO(data)) as f:
+        return f.getframerate(), f.getnframes()
+
+
+def piper(fallback=None):
+    return tts.PiperBackend({'Boy': 'models/ryan.onnx', 'Girl': 'models/amy.onnx'}, fallback=fallback)
+
+
+def test_piper_wav_output():
+    backend = piper()
+    assert read_wav(backend.synthesize('two words', 'en', backend.voice_key('Girl'))) == (22050, 4410)
+
+
+def test_piper_without_chunks():
+    backend = piper()
+    assert read_wav(backend.synthesize('?.', 'en', backend.voice_key('Boy'))) == (22050, 0)
+
+
+def test_piper_error_without_fallback():
+    backend = piper()
+    with pytest.raises(RuntimeError):
+        backend.synthesize('hello!', 'en', backend.voice_key('Boy'))
+
+
+def test_piper_error_falls_back_per_call():
+    fallback = FakeGtts()
+    backend = piper(fallback)
+    assert read_wav(backend.synthesize('hello!', 'en', backend.voice_key('Boy'))) == (16000, 1600)
+    assert fallback.calls == [('hello!', tts.VOICES['Boy'])]
+    # 다음 호출은 다시 piper
+    assert read_wav(backend.synthesize('hello', 'en', backend.voice_key('Boy'))) == (22050, 2205)
+    assert len(fallback.calls) == 1
+
+
+def test_render_uses_fallback_without_caching_it(tmp_path):
+    from audio_cache import AudioCache, cache_key
+
+    backend = piper(FakeGtts())
+    cache = AudioCache(str(tmp_path))
+    voice = backend.voice_key('Girl')
+    audio = tts.render(cache, 'hello!', voice, backend=backend)
+    assert isinstance(audio, tts.FallbackAudio)
+    assert read_wav(audio) == (16000, 1600)
+    # 대신 만든 음성이 Piper 목소리 키로 남으면 다음 요청(과 API 응답 캐시)에 계속 쓰임
+    assert cache.get(cache_key('hello!', 'en', voice)) is None
+
+
+def test_stream_does_not_cache_fallback(tmp_path):
+    from audio_cache import AudioCache, cache_key
+
+    backend = piper(FakeGtts())
+    cache = AudioCache(str(tmp_path))
+    voice = backend.voice_key('Boy')
+    assert read_wav(b''.join(tts.stream(cache, 'hi!', voice, backend=backend))) == (16000, 1600)
+    assert cache.get(cache_key('hi!', 'en', voice)) is None
+
+    # 정상 합성은 그대로 저장
+    audio = b''.join(tts.stream(cache, 'hi', voice, backend=backend))
+    assert cache.get(cache_key('hi', 'en', voice)) == audio
@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+import pytest
+
+from audio_io import wav_to_pcm16k
+from vad import VoiceActivityDetector, frames_db, iter_frames, trim_silence
+
+RATE = 16000
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return np.array(wav_to_pcm16k(f.read()))
+
+
+def replay(samples, **options):
+    """녹음 파일을 20ms 프레임으로 실시간처럼 넣음 → (검출기, 끝난 시점 ms 또는 None)"""
+    detector = VoiceActivityDetector(RATE, **options)
+    for n, frame in enumerate(iter_frames(samples, RATE)):
+        if detector.push(frame):
+            return detector, (n + 1) * 20
+    return detector, None
+
+
+@pytest.mark.parametrize('name', ['silence.wav', 'noise.wav'])
+def test_trim_without_speech_is_empty(name):
+    assert trim_silence(load(name), RATE).size == 0
+
+
+def test_trim_keeps_speech_with_padding():
+    samples = load('speech_padded.wav')
+    trimmed = trim_silence(samples, RATE)
+    # 말소리 0.6s + 앞뒤 0.1s (20ms 프레임 단위 오차 허용)
+    assert 0.78 * RATE <= trimmed.size <= 0.84 * RATE
+    # 앞쪽 패딩은 조용하고 그 뒤는 말소리
+    levels = frames_db(trimmed, RATE // 50)
+    assert (levels[:4] < -45).all()
+    assert (levels[6:-6] > -45).all()
+    assert (levels[-4:] < -45).all()
+
+
+@pytest.mark.parametrize('name', ['silence.wav', 'noise.wav'])
+def test_detector_ignores_silence_and_noise(name):
+    detector, ended = replay(load(name))
+    assert not detector.started
+    assert ended is None
+    assert detector.utterance().size == 0
+
+
+def test_detector_stops_after_trailing_silence():
+    detector, ended = replay(load('speech_padded.wav'))
+    assert detector.started
+    # 말소리 끝(1.0s) + trailing_silence_ms(0.6s)
+    assert 1560 <= ended <= 1660
+    utterance = detector.utterance()
+    assert 0.78 * RATE <= utterance.size <= 0.84 * RATE
+
+
+def test_detector_gives_up_at_max_length():
+    detector, ended = replay(load('noise.wav'), max_ms=500)
+    assert ended == 500
+    assert not detector.started
+
+
+def test_short_click_is_not_speech():
+    samples = load('silence.wav').copy()
+    samples[4000:4000 + RATE // 25] = 20000   # 40ms 잡음
+    detector, _ = replay(samples)
+    assert not detector.started
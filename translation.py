@@ -0,0 +1,139 @@
+"""단어 뜻(한국어) 조회: 저장소 + TTL 메모 + 주제 단위 일괄 번역"""
+import json
+import os
+import threading
+import time
+
+import metrics
+import outbound
+
+
+def _load_json(path):
+    """JSON 파일 읽기 (없으면 빈 dict)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _is_timeout(error):
+    """httpx 시간 초과 예외인지 확인"""
+    return 'Timeout' in type(error).__name__
+
+
+class GlossStore:
+    """단어 → 한국어 뜻 저장소
+
+    저장소에 포함된 기본 뜻(bundle)은 만료되지 않고, 번역기로 가져온 뜻은 ttl이 지나면
+    다시 가져온다. 번역 실패나 시간 초과 시에는 기존 값(만료된 값 포함)을 돌려주고
+    stats()에 횟수를 남긴다.
+    """
+
+    def __init__(self, store_path, bundle_path=None, ttl=7 * 24 * 60 * 60, timeout=5, dest='ko'):
+        self.store_path = store_path
+        self.ttl = ttl
+        self.timeout = timeout
+        self.dest = dest
+        self._lock = threading.Lock()
+        self._translator = None
+        self.counters = dict.fromkeys(
+            ['hits', 'misses', 'requests', 'fetched', 'failures', 'timeouts', 'circuit_open', 'stale_fallbacks'], 0)
+
+        # word -> {'text': 뜻, 'source': 'bundle' | 'google', 'ts': 가져온 시각}
+        self._entries = {}
+        if bundle_path:
+            for word, text in _load_json(bundle_path).items():
+                self._entries[word] = {'text': text, 'source': 'bundle', 'ts': 0}
+        for word, entry in _load_json(store_path).items():
+            self._entries.setdefault(word, entry)
+
+    def _fresh(self, entry, now):
+        return entry['source'] == 'bundle' or now - entry['ts'] < self.ttl
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+        metrics.incr(f'translate.{name}', n)
+
+    def _get_translator(self):
+        """번역기는 한 번만 만들어 재사용"""
+        if self._translator is None:
+            from googletrans import Translator
+            self._translator = Translator(timeout=self.timeout)
+        return self._translator
+
+    def _fetch(self, words):
+        """번역기 한 번 호출로 여러 단어 번역, 실패 시 빈 dict"""
+        self._count('requests')
+        def send():
+            # 줄바꿈으로 이어 붙여 한 번의 요청으로 보냄
+            with metrics.span('translate'):
+                return self._get_translator().translate('\n'.join(words), dest=self.dest).text
+
+        try:
+            result = outbound.get('translate').call((self.dest, tuple(words)), send)
+        except outbound.CircuitOpen:
+            self._count('circuit_open')
+            return {}
+        except Exception as e:
+            self._count('timeouts' if _is_timeout(e) else 'failures')
+            return {}
+
+        texts = [line.strip() for line in result.split('\n')]
+        if len(texts) != len(words):
+            self._count('failures')
+            return {}
+        return dict(zip(words, texts))
+
+    def _store(self, glosses):
+        """번역 결과를 메모리와 파일에 저장"""
+        now = time.time()
+        with self._lock:
+            for word, text in glosses.items():
+                self._entries[word] = {'text': text, 'source': 'google', 'ts': now}
+            fetched = {word: entry for word, entry in self._entries.items() if entry['source'] != 'bundle'}
+            self.counters['fetched'] += len(glosses)
+
+        os.makedirs(os.path.dirname(self.store_path) or '.', exist_ok=True)
+        tmp_path = f'{self.store_path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(fetched, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.store_path)
+
+    def lookup(self, word):
+        """단어 뜻 조회, 가져올 수 없으면 None"""
+        now = time.time()
+        entry = self._entries.get(word)
+        if entry is not None and self._fresh(entry, now):
+            self._count('hits')
+            return entry['text']
+
+        self._count('misses')
+        glosses = self._fetch([word])
+        if glosses:
+            self._store(glosses)
+            return glosses[word]
+        if entry is not None:
+            self._count('stale_fallbacks')
+            return entry['text']
+        return None
+
+    def prefetch(self, words):
+        """만료되었거나 없는 단어의 뜻을 한 번에 가져옴 (주제 선택 시 호출)"""
+        now = time.time()
+        missing = [word for word in dict.fromkeys(words)
+                   if word not in self._entries or not self._fresh(self._entries[word], now)]
+        if not missing:
+            return 0
+        glosses = self._fetch(missing)
+        if glosses:
+            self._store(glosses)
+        return len(glosses)
+
+    def stats(self):
+        """조회/번역 통계"""
+        with self._lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self._entries)
+            return stats
@@ -0,0 +1,222 @@
+"""음성 합성 백엔드 (gTTS 네트워크 서비스 / Piper 오프라인 엔진)
+
+백엔드는 목소리(Boy/Girl)마다 캐시 키에 쓰는 목소리 키(voice_key)를 정하고, 그 키로
+synthesize()/stream()을 호출한다. 사용할 백엔드는 config.TTS_BACKEND로 고르며
+Piper를 불러올 수 없으면 gTTS로 대신하고, 실행 중 합성이 실패하면 그 호출만 gTTS로 합성해
+Piper 출력 형식으로 바꿔 돌려준다. 이렇게 대신 만든 음성(FallbackAudio)은 목소리가 다르므로
+Piper 목소리 키로 캐시에 저장하지 않는다.
+"""
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from io import BytesIO
+
+import config
+import metrics
+import outbound
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackAudio(bytes):
+    """요청한 목소리 대신 다른 백엔드로 합성한 음성 (캐시에 저장하지 않음)"""
+
+
+# 성별에 따른 gTTS 도메인 설정
+VOICES = {
+    'Boy': 'co.uk',   # 영국 영어 (남성스러운 음색)
+    'Girl': 'com',    # 미국 영어 (여성스러운 음색)
+}
+
+
+def synthesize(text, lang='en', tld='com'):
+    """텍스트를 mp3 bytes로 변환"""
+    from gtts import gTTS  # stub 백엔드만 쓸 때는 gTTS 없이 동작하도록 지연 import
+
+    def send():
+        fp = BytesIO()
+        with metrics.span('tts.synthesize'):
+            gTTS(text=text, lang=lang, tld=tld).write_to_fp(fp)
+        return fp.getvalue()
+
+    # 여러 세션이 같은 단어를 동시에 요청해도 한 번만 합성
+    return outbound.get('tts').call((text, lang, tld), send)
+
+
+class GttsBackend:
+    """Google 번역 TTS (네트워크, 목소리는 tld로 구분하는 억양 차이뿐)"""
+
+    name = 'gtts'
+    mimetype = 'audio/mpeg'
+
+    def voice_key(self, gender):
+        return VOICES['Boy'] if gender == 'Boy' else VOICES['Girl']
+
+    def synthesize(self, text, lang, voice):
+        return synthesize(text, lang=lang, tld=voice)
+
+    def stream(self, text, lang, voice):
+        """긴 문장은 gTTS가 여러 요청으로 나누므로 받는 대로 조각을 내보냄"""
+        from gtts import gTTS
+
+        return outbound.get('tts').stream(lambda: gTTS(text=text, lang=lang, tld=voice).stream())
+
+
+class PiperBackend:
+    """Piper 오프라인 합성 (목소리 모델은 프로세스당 한 번만 읽어 모든 세션이 공유)
+
+    models: 목소리 → .onnx 모델 경로 (옆에 같은 이름의 .onnx.json 설정 파일 필요)
+    output: 'wav' 또는 'opus' (ogg/opus, PyAV 필요)
+    fallback: 합성이 실패하면 그 호출만 대신할 백엔드 (예: GttsBackend, 결과는 output 형식으로 변환)
+    """
+
+    name = 'piper'
+
+    def __init__(self, models, output='wav', fallback=None):
+        from piper.voice import PiperVoice
+
+        self.output = output
+        self.fallback = fallback
+        self.mimetype = 'audio/ogg' if output == 'opus' else 'audio/wav'
+        self._keys = {}
+        self._genders = {}  # 목소리 키 -> 성별 (대신 합성할 때 사용)
+        self._voices = {}   # 목소리 키 -> (PiperVoice, 잠금)
+        for gender, path in models.items():
+            key = f'piper-{os.path.splitext(os.path.basename(path))[0]}.{output}'
+            self._keys[gender] = key
+            self._genders.setdefault(key, gender)
+            if key not in self._voices:
+                # 음소 변환(espeak-ng)이 스레드 안전하지 않을 수 있어 모델마다 한 번에 하나씩 합성
+                self._voices[key] = (PiperVoice.load(path), threading.Lock())
+
+    def voice_key(self, gender):
+        return self._keys['Boy'] if gender == 'Boy' else self._keys['Girl']
+
+    def _pcm(self, voice, text):
+        """16bit 모노 PCM bytes와 샘플링 레이트 (piper-tts 1.2/1.3 API 모두 지원)"""
+        if hasattr(voice, 'synthesize_stream_raw'):
+            return b''.join(voice.synthesize_stream_raw(text)), voice.config.sample_rate
+        # 문장부호뿐인 글은 조각이 하나도 없을 수 있음
+        return b''.join(chunk.audio_int16_bytes for chunk in voice.synthesize(text)), voice.config.sample_rate
+
+    def _fallback_pcm(self, text, lang, voice):
+        """대신할 백엔드로 합성해 16kHz PCM으로 변환"""
+        import audio_io
+
+        gender = self._genders[voice]
+        audio = self.fallback.synthesize(text, lang, self.fallback.voice_key(gender))
+        if audio[:4] == b'RIFF':
+            samples = audio_io.wav_to_pcm16k(audio)
+        else:
+            samples = audio_io.encoded_to_pcm16k(audio)
+        return samples.tobytes(), audio_io.TARGET_RATE
+
+    def synthesize(self, text, lang, voice):
+        import audio_io
+
+        model, lock = self._voices[voice]
+        fell_back = False
+        try:
+            with lock, metrics.span('tts.synthesize.piper'):
+                pcm, rate = self._pcm(model, text)
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            logger.warning("piper 합성 실패, %s로 대신합니다: %s", self.fallback.name, e)
+            metrics.incr('tts.fallbacks')
+            pcm, rate = self._fallback_pcm(text, lang, voice)
+            fell_back = True
+        if self.output == 'opus':
+            audio = audio_io.pcm16_to_opus(pcm, rate)
+        else:
+            audio = audio_io.pcm16_to_wav(pcm, rate)
+        return FallbackAudio(audio) if fell_back else audio
+
+    def stream(self, text, lang, voice):
+        # 로컬 합성은 짧은 단어/문장이면 충분히 빨라 한 번에 내보냄
+        yield self.synthesize(text, lang, voice)
+
+
+def create_backend(name, boy_model=None, girl_model=None, output='wav', fallback=None):
+    """설정 이름으로 합성 백엔드 생성 (fallback: 합성 실패 시 대신할 백엔드, piper만 해당)"""
+    if name == 'gtts':
+        return GttsBackend()
+    if name == 'piper':
+        return PiperBackend({'Boy': boy_model, 'Girl': girl_model}, output=output, fallback=fallback)
+    raise ValueError(f"알 수 없는 음성 합성 백엔드: {name}")
+
+
+@lru_cache(maxsize=None)
+def default_backend():
+    """설정된 합성 백엔드 (프로세스당 한 번, 불러오지 못하면 gTTS, 합성이 실패하면 그 호출만 gTTS)"""
+    try:
+        return create_backend(config.TTS_BACKEND, boy_model=config.PIPER_BOY_MODEL,
+                              girl_model=config.PIPER_GIRL_MODEL, output=config.PIPER_OUTPUT,
+                              fallback=GttsBackend())
+    except (ImportError, OSError) as e:
+        logger.warning("%s 음성 합성을 불러오지 못해 gTTS를 사용합니다: %s", config.TTS_BACKEND, e)
+        return GttsBackend()
+
+
+def render(cache, text, voice, lang='en', backend=None):
+    """캐시에서 음성을 찾고 없으면 합성해 저장 (backend.mimetype 형식 bytes 반환)
+
+    voice: backend.voice_key(성별)
+    """
+    from audio_cache import cache_key
+
+    backend = backend or default_backend()
+    key = cache_key(text, lang, voice)
+    audio = cache.get(key)
+    if audio is None:
+        metrics.incr('tts.cache_misses')
+        audio = backend.synthesize(text, lang, voice)
+        if not isinstance(audio, FallbackAudio):   # 대신 만든 음성은 다음에 다시 합성
+            cache.put(key, audio)
+    else:
+        metrics.incr('tts.cache_hits')
+    return audio
+
+
+def stream(cache, text, voice, lang='en', backend=None):
+    """음성 조각을 받는 대로 내보냄 (캐시에 있으면 한 번에, 없으면 다 받은 뒤 캐시에 저장)
+
+    첫 조각까지 걸린 시간은 'tts.time_to_first_audio'로 기록한다.
+    """
+    from audio_cache import cache_key
+
+    backend = backend or default_backend()
+    start = time.perf_counter()
+    key = cache_key(text, lang, voice)
+    audio = cache.get(key)
+    if audio is not None:
+        metrics.incr('tts.cache_hits')
+        metrics.observe('tts.time_to_first_audio', time.perf_counter() - start)
+        yield audio
+        return
+
+    metrics.incr('tts.cache_misses')
+    parts = []
+    with metrics.span('tts.synthesize'):
+        for chunk in backend.stream(text, lang, voice):
+            if not parts:
+                metrics.observe('tts.time_to_first_audio', time.perf_counter() - start)
+            parts.append(chunk)
+            yield chunk
+    # 빈 음성, 대신 만든 음성은 저장하지 않음
+    if parts and not any(isinstance(part, FallbackAudio) for part in parts):
+        cache.put(key, b''.join(parts))
+
+
+def synthesize_stub(text, lang='en', tld='com'):
+    """네트워크 없이 쓰는 테스트용 가짜 합성 (입력마다 고정된 bytes)"""
+    return f'STUB:{lang}:{tld}:{text}'.encode('utf-8')
+
+
+# 합성 백엔드 이름 -> 함수 (presynth.py 번들용)
+BACKENDS = {
+    'gtts': synthesize,
+    'stub': synthesize_stub,
+}
@@ -0,0 +1,116 @@
+"""프레임 단위 음성 구간 검출(VAD): int16 오디오 프레임의 에너지로 말소리 시작/끝 판단
+
+실시간 녹음에서는 말이 끝난 뒤 무음이 일정 시간 이어지면 녹음을 멈추고,
+앞뒤 무음을 잘라 낸 구간만 인식기로 보낸다.
+"""
+import numpy as np
+
+# int16 최댓값 기준 dBFS
+_FULL_SCALE = 32768.0
+
+
+def frame_db(frame):
+    """프레임 에너지 (dBFS, 무음은 -100)"""
+    samples = np.asarray(frame, dtype=np.float32)
+    if samples.size == 0:
+        return -100.0
+    rms = np.sqrt(np.mean(np.square(samples)))
+    return float(20 * np.log10(max(rms, 1e-5) / _FULL_SCALE))
+
+
+def frames_db(samples, frame_len):
+    """전체 신호를 frame_len 단위로 나눈 프레임별 에너지 배열 (벡터 연산)"""
+    samples = np.asarray(samples)
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return np.empty(0, dtype=np.float32)
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len).astype(np.float32)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-5) / _FULL_SCALE)
+
+
+def iter_frames(samples, sample_rate, frame_ms=20):
+    """신호를 frame_ms 길이 프레임으로 나눠 차례로 돌려줌 (녹음 파일을 실시간처럼 재생할 때 사용)"""
+    frame_len = int(sample_rate * frame_ms / 1000)
+    for start in range(0, len(samples) - frame_len + 1, frame_len):
+        yield samples[start:start + frame_len]
+
+
+def trim_silence(samples, sample_rate, threshold_db=-45.0, frame_ms=20, pad_ms=100):
+    """앞뒤 무음 제거 (말소리 앞뒤로 pad_ms 만큼은 남김), 말소리가 없으면 빈 배열"""
+    frame_len = int(sample_rate * frame_ms / 1000)
+    voiced = np.flatnonzero(frames_db(samples, frame_len) > threshold_db)
+    if voiced.size == 0:
+        return samples[:0]
+    pad = int(sample_rate * pad_ms / 1000)
+    start = max(0, voiced[0] * frame_len - pad)
+    end = min(len(samples), (voiced[-1] + 1) * frame_len + pad)
+    return samples[start:end]
+
+
+class VoiceActivityDetector:
+    """프레임을 차례로 받아 말소리 구간 하나를 모음
+
+    말소리(threshold_db 이상)가 min_speech_ms 이상 이어진 뒤 무음이
+    trailing_silence_ms 동안 계속되면 done이 된다.
+    """
+
+    def __init__(self, sample_rate, threshold_db=-45.0, min_speech_ms=100,
+                 trailing_silence_ms=600, pad_ms=100, max_ms=10000):
+        self.sample_rate = sample_rate
+        self.threshold_db = threshold_db
+        self.min_speech_ms = min_speech_ms
+        self.trailing_silence_ms = trailing_silence_ms
+        self.pad_ms = pad_ms
+        self.max_ms = max_ms
+        self._leading = []      # 말소리 확정 전 프레임 (pad_ms + min_speech_ms 만큼만 유지)
+        self._leading_ms = 0.0
+        self._frames = []
+        self._speech_ms = 0.0
+        self._silence_ms = 0.0
+        self._total_ms = 0.0
+        self.started = False
+        self.done = False
+
+    def push(self, frame):
+        """int16 프레임 하나 추가, 말소리 구간이 끝났으면 True"""
+        if self.done:
+            return True
+        frame = np.asarray(frame, dtype=np.int16)
+        frame_ms = len(frame) * 1000 / self.sample_rate
+        voiced = frame_db(frame) > self.threshold_db
+        self._total_ms += frame_ms
+
+        if not self.started:
+            self._leading.append(frame)
+            self._leading_ms += frame_ms
+            keep_ms = self.pad_ms + self.min_speech_ms
+            while self._leading_ms - len(self._leading[0]) * 1000 / self.sample_rate >= keep_ms:
+                self._leading_ms -= len(self._leading.pop(0)) * 1000 / self.sample_rate
+            if voiced:
+                self._speech_ms += frame_ms
+                if self._speech_ms >= self.min_speech_ms:
+                    self.started = True
+                    self._frames = self._leading
+                    self._leading = []
+            else:
+                self._speech_ms = 0.0
+        else:
+            self._frames.append(frame)
+            if voiced:
+                self._silence_ms = 0.0
+            else:
+                self._silence_ms += frame_ms
+                if self._silence_ms >= self.trailing_silence_ms:
+                    self.done = True
+
+        if self._total_ms >= self.max_ms:
+            self.done = True
+        return self.done
+
+    def utterance(self):
+        """모은 말소리 구간 (뒤쪽 무음은 pad_ms만 남기고 제거)"""
+        if not self._frames:
+            return np.empty(0, dtype=np.int16)
+        samples = np.concatenate(self._frames)
+        return trim_silence(samples, self.sample_rate, self.threshold_db, pad_ms=self.pad_ms)
@@ -0,0 +1,82 @@
+"""단어장: 데이터 파일(data/words.csv)에서 한 번 읽어 주제/난이도별 색인 생성"""
+import csv
+import json
+import random
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+
+import config
+from audio_cache import cache_key
+from matcher import phonetic_key
+from tts import VOICES
+
+# gloss: 한국어 뜻, phonetic: 발음 키, audio_keys: 목소리 → TTS 캐시 키
+WordEntry = namedtuple('WordEntry', ['word', 'topic', 'level', 'gloss', 'phonetic', 'audio_keys'])
+
+
+class WordBank:
+    """단어 목록과 주제/난이도 색인 (단어 수와 무관하게 O(1) 무작위 선택)"""
+
+    def __init__(self, entries):
+        self.entries = {}
+        self._by_topic = defaultdict(list)
+        self._by_topic_level = defaultdict(list)
+        for entry in entries:
+            if entry.word in self.entries:
+                continue
+            self.entries[entry.word] = entry
+            self._by_topic[entry.topic].append(entry.word)
+            self._by_topic_level[(entry.topic, entry.level)].append(entry.word)
+        self.words = list(self.entries)
+
+    @property
+    def topics(self):
+        return list(self._by_topic)
+
+    def words_for(self, topic=None, level=None):
+        """주제/난이도에 해당하는 단어 목록 (모르는 주제면 전체 단어)"""
+        if topic not in self._by_topic:
+            return self.words
+        if level is None:
+            return self._by_topic[topic]
+        return self._by_topic_level.get((topic, level)) or self._by_topic[topic]
+
+    def sample(self, topic=None, level=None):
+        """주제/난이도에서 무작위 단어 하나"""
+        return random.choice(self.words_for(topic, level))
+
+    def get(self, word):
+        return self.entries.get(word)
+
+
+def load(path, gloss_path=None):
+    """CSV(word,topic,level)와 뜻 파일로 단어장 생성"""
+    glosses = {}
+    if gloss_path:
+        with open(gloss_path, encoding='utf-8') as f:
+            glosses = json.load(f)
+
+    entries = []
+    with open(path, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            word = row['word'].strip()
+            entries.append(WordEntry(
+                word=word,
+                topic=row['topic'].strip(),
+                level=int(row['level']),
+                gloss=glosses.get(word),
+                phonetic=phonetic_key(word),
+                audio_keys={voice: cache_key(word, 'en', tld) for voice, tld in VOICES.items()},
+            ))
+    return WordBank(entries)
+
+
+@lru_cache(maxsize=1)
+def default_bank():
+    """설정된 경로의 단어장 (프로세스당 한 번만 읽음)"""
+    return load(config.WORD_BANK_PATH, config.GLOSS_BUNDLE_PATH)
+
+
+def all_words():
+    """전체 단어 목록"""
+    return default_bank().words